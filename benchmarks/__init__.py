@@ -0,0 +1,23 @@
+"""
+v1 API 부하 테스트 / 벤치마크
+
+전용 벤치마크 DB(DATABASE_URL)에 데이터셋을 만들고, 로컬에서 띄운 앱에 동시 HTTP 요청으로
+FRONTEND_API_SPEC.md의 주요 흐름을 실행한 뒤 라우트별 p50/p95/p99와 처리량을 JSON으로 저장합니다.
+
+흐름 (scenarios.py):
+- feed: 공고 목록 (정렬/필터/페이지 무작위)
+- detail: 공고 상세 + 질문 조회
+- apply: 지원서 제출 (첨부파일 포함, --no-attachments로 제외)
+- review: 모집자 지원자 목록 → 지원서 상세 → 상태 변경
+
+사용법:
+    python -m benchmarks.run --reset --posts 500 --applications-per-post 20 --concurrency 32 --duration 60
+    python -m benchmarks.run --base-url http://localhost:8000 --no-seed   # 이미 실행 중인 앱/데이터 사용
+    python -m benchmarks.generate --reset --posts 1000000 --applications 20000000 --defer-indexes  # 대용량 (COPY)
+    python -m benchmarks.compare benchmarks/results/<이전>.json benchmarks/results/<이후>.json
+
+Note:
+    - --reset은 벤치마크 DB의 데이터 테이블을 비우므로 운영 DB에 사용하지 말 것
+    - 첨부파일 흐름은 GCS 업로드를 포함하므로 GCS 자격 증명 또는 STORAGE_EMULATOR_HOST(fake-gcs-server) 필요
+    - 토큰은 같은 JWT_SECRET으로 발급하므로 앱과 같은 환경변수로 실행
+"""
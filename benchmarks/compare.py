@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+벤치마크 결과 비교 CLI
+
+두 결과 JSON(benchmarks.run 출력)의 라우트별 처리량과 p50/p95/p99를 나란히 출력합니다.
+
+사용법:
+    python -m benchmarks.compare <기준>.json <비교>.json
+"""
+
+import argparse
+import json
+import sys
+from typing import Optional
+
+METRICS = ("throughput_rps", "p50_ms", "p95_ms", "p99_ms")
+
+
+def _change(before: Optional[float], after: Optional[float]) -> str:
+    if before in (None, 0) or after is None:
+        return "-"
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="벤치마크 결과 비교")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    args = parser.parse_args()
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(args.candidate, encoding="utf-8") as f:
+        candidate = json.load(f)
+
+    print(f"기준: {baseline['meta'].get('git_commit')}  비교: {candidate['meta'].get('git_commit')}")
+    print(f"{'route':<52} {'metric':<15} {'before':>10} {'after':>10} {'change':>9}")
+    for label in sorted(set(baseline["routes"]) | set(candidate["routes"])):
+        before = baseline["routes"].get(label, {})
+        after = candidate["routes"].get(label, {})
+        for metric in METRICS:
+            b, a = before.get(metric), after.get(metric)
+            print(f"{label:<52} {metric:<15} {str(b):>10} {str(a):>10} {_change(b, a):>9}")
+    print(f"{'TOTAL':<52} {'throughput_rps':<15} {str(baseline.get('throughput_rps')):>10} "
+          f"{str(candidate.get('throughput_rps')):>10} "
+          f"{_change(baseline.get('throughput_rps'), candidate.get('throughput_rps')):>9}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
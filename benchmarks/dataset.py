@@ -0,0 +1,180 @@
+"""
+벤치마크 데이터셋 생성
+
+결정적 시드로 사용자, 공고, 공고 질문, 지원서(답변 포함)를 만듭니다.
+- 모집자(owner) 사용자: 공고 작성자 (review 흐름에서 사용)
+- 시드 지원자: 미리 만들어 둔 지원서의 지원자
+- 벤치 지원자: apply 흐름 전용 (시드 지원서가 없으므로 모든 공고에 새로 지원 가능)
+
+수만 건 규모까지를 대상으로 하며, 대용량(수백만 건 이상)은 benchmarks.generate(COPY)를 사용합니다.
+"""
+
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List, Set, Tuple
+
+from sqlalchemy import insert, select, text
+from sqlalchemy.orm import Session
+
+from database import Application, ApplicationAnswer, Post, PostQuestion, User
+
+# 소셜 user_id 규칙("kakao_{kakao_id}")을 따라야 권한 검증(get_user_id_from_user)과 일치
+USER_PREFIX = "kakao_bench_"
+FIELDS = ["프론트엔드", "백엔드", "기획", "디자인", "데이터 분석"]
+HEADCOUNTS = ["1~2인", "3~5인", "6~10인", "인원미정"]
+SCHOOLS = ["서울대학교", "연세대학교", "고려대학교", "카이스트", "포항공대"]
+BATCH_SIZE = 1000
+
+
+@dataclass
+class DatasetConfig:
+    owners: int = 50
+    seed_applicants: int = 500
+    bench_applicants: int = 500
+    posts: int = 500
+    applications_per_post: int = 20
+    seed: int = 42
+
+
+@dataclass
+class Dataset:
+    """벤치마크 흐름에서 사용할 식별자"""
+
+    post_ids: List[int] = field(default_factory=list)
+    post_owner: Dict[int, str] = field(default_factory=dict)  # post_id -> 작성자 user_id
+    post_questions: Dict[int, List[dict]] = field(default_factory=dict)  # post_id -> [{id, question_type}]
+    submitted_application_ids: Dict[int, List[int]] = field(default_factory=dict)  # post_id -> 제출됨 지원서
+    bench_applicants: List[str] = field(default_factory=list)
+    applied: Set[Tuple[str, int]] = field(default_factory=set)  # 이미 지원한 (벤치 지원자, post_id)
+
+
+def reset(db: Session) -> None:
+    """데이터 테이블 비우기 (벤치마크 전용 DB에서만 사용)"""
+    db.execute(text(
+        "TRUNCATE users, posts, post_questions, applications, application_answers, "
+        "application_status_logs, profile_careers RESTART IDENTITY CASCADE"
+    ))
+    db.commit()
+
+
+def _insert_returning_ids(db: Session, model, rows: List[dict]) -> List[int]:
+    ids: List[int] = []
+    for start in range(0, len(rows), BATCH_SIZE):
+        ids.extend(db.scalars(insert(model).returning(model.id, sort_by_parameter_order=True), rows[start:start + BATCH_SIZE]))
+    return ids
+
+
+def _users(prefix: str, count: int) -> List[dict]:
+    return [
+        {
+            "user_id": f"{USER_PREFIX}{prefix}{i}",
+            "kakao_id": f"bench_{prefix}{i}",
+            "name": f"{prefix}{i}",
+            "field": FIELDS[i % len(FIELDS)],
+            "is_onboarded": True,
+        }
+        for i in range(count)
+    ]
+
+
+def seed(db: Session, config: DatasetConfig) -> Dataset:
+    """
+    데이터셋 생성
+
+    Args:
+        db: 동기 DB 세션
+        config: 데이터셋 크기와 시드
+
+    Returns:
+        Dataset: 생성된 공고/질문/지원서 식별자와 벤치 지원자 목록
+    """
+    rng = random.Random(config.seed)
+    now = datetime.now()
+
+    owners = _users("owner", config.owners)
+    seed_applicants = _users("seed", config.seed_applicants)
+    bench_applicants = _users("apply", config.bench_applicants)
+    _insert_returning_ids(db, User, owners + seed_applicants + bench_applicants)
+
+    post_rows = []
+    for i in range(config.posts):
+        school_specific = rng.random() < 0.2
+        post_rows.append({
+            "user_id": owners[i % len(owners)]["user_id"],
+            "image_url": f"https://storage.googleapis.com/bench/posts/{i}.png",
+            "title": f"{rng.choice(FIELDS)} 팀원 모집 #{i}",
+            "description": "함께 프로젝트를 진행할 팀원을 찾습니다. " * rng.randint(1, 8),
+            "recruitment_field": rng.choice(FIELDS),
+            "recruitment_headcount": rng.choice(HEADCOUNTS),
+            "school_specific": school_specific,
+            "target_school_name": rng.choice(SCHOOLS) if school_specific else None,
+            "deadline": now + timedelta(days=rng.randint(-30, 60)),
+            "views": 0,
+            "created_at": now - timedelta(minutes=config.posts - i),
+        })
+    post_ids = _insert_returning_ids(db, Post, post_rows)
+
+    question_rows = []
+    for post_id in post_ids:
+        question_rows.append({"post_id": post_id, "question_type": "TEXT", "question_content": "자기소개를 해주세요.", "is_required": True})
+        question_rows.append({"post_id": post_id, "question_type": "TEXTAREA", "question_content": "가장 기억에 남는 프로젝트는?", "is_required": False})
+        question_rows.append({"post_id": post_id, "question_type": "ATTACHMENT", "question_content": "포트폴리오를 첨부해주세요.", "is_required": False})
+    question_ids = _insert_returning_ids(db, PostQuestion, question_rows)
+
+    dataset = Dataset(post_ids=post_ids, bench_applicants=[u["user_id"] for u in bench_applicants])
+    for index, post_id in enumerate(post_ids):
+        dataset.post_owner[post_id] = post_rows[index]["user_id"]
+        dataset.post_questions[post_id] = [
+            {"id": question_ids[index * 3 + k], "question_type": question_rows[index * 3 + k]["question_type"]}
+            for k in range(3)
+        ]
+
+    application_rows, application_posts = [], []
+    per_post = min(config.applications_per_post, len(seed_applicants))
+    for post_id in post_ids:
+        for applicant in rng.sample(seed_applicants, per_post):
+            application_rows.append({
+                "post_id": post_id,
+                "user_id": applicant["user_id"],
+                "status": "제출됨",
+                "created_at": now - timedelta(seconds=rng.randint(0, 86400 * 30)),
+            })
+            application_posts.append(post_id)
+    application_ids = _insert_returning_ids(db, Application, application_rows)
+
+    answer_rows = []
+    for application_id, post_id in zip(application_ids, application_posts):
+        dataset.submitted_application_ids.setdefault(post_id, []).append(application_id)
+        for question in dataset.post_questions[post_id][:2]:
+            answer_rows.append({
+                "application_id": application_id,
+                "post_question_id": question["id"],
+                "answer_content": "열심히 하겠습니다. " * rng.randint(1, 5),
+            })
+    for start in range(0, len(answer_rows), BATCH_SIZE):
+        db.execute(insert(ApplicationAnswer), answer_rows[start:start + BATCH_SIZE])
+
+    db.commit()
+    return dataset
+
+
+def load(db: Session) -> Dataset:
+    """이미 생성된 데이터셋 식별자 조회 (--no-seed)"""
+    dataset = Dataset()
+    for post_id, owner in db.execute(select(Post.id, Post.user_id).where(Post.user_id.like(f"{USER_PREFIX}%"))):
+        dataset.post_ids.append(post_id)
+        dataset.post_owner[post_id] = owner
+    for question_id, post_id, question_type in db.execute(
+        select(PostQuestion.id, PostQuestion.post_id, PostQuestion.question_type).order_by(PostQuestion.id)
+    ):
+        if post_id in dataset.post_owner:
+            dataset.post_questions.setdefault(post_id, []).append({"id": question_id, "question_type": question_type})
+    for application_id, post_id in db.execute(select(Application.id, Application.post_id).where(Application.status == "제출됨")):
+        if post_id in dataset.post_owner:
+            dataset.submitted_application_ids.setdefault(post_id, []).append(application_id)
+    dataset.bench_applicants = list(db.scalars(select(User.user_id).where(User.user_id.like(f"{USER_PREFIX}apply%"))))
+    dataset.applied = set(db.execute(
+        select(Application.user_id, Application.post_id).where(Application.user_id.like(f"{USER_PREFIX}apply%"))
+    ).tuples())
+    return dataset
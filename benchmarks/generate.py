@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+"""
+대용량 합성 데이터 생성 CLI (PostgreSQL COPY)
+
+list_posts, 인기순 정렬, 지원자 목록의 규모별 동작을 측정하기 위해 수백만~수천만 건의
+사용자/공고/질문/지원서(선택: 답변)를 ORM insert 대신 COPY FROM STDIN으로 배치 적재합니다.
+
+- 결정적 시드: 같은 옵션과 --seed면 같은 데이터 (시각은 실행 시점 기준 상대값)
+- 인기도 편향: 공고별 지원서 수가 Zipf 분포 (--zipf, 0이면 균등)
+- 한국어 텍스트: 단어 조합으로 만든 제목/설명/답변 문장 풀에서 선택
+- id를 직접 부여하고 적재 후 시퀀스를 맞추므로 RETURNING 없이 FK를 연결
+
+사용자 이름은 benchmarks.dataset 규칙(USER_PREFIX)을 따르므로, 생성 후
+`python -m benchmarks.run --no-seed`로 바로 부하를 걸 수 있습니다.
+--reset 없이 다시 실행하면 기존 벤치마크 사용자 번호 다음부터 이어서 만듭니다 (데이터 누적).
+
+사용법:
+    python -m benchmarks.generate --reset --posts 1000000 --applications 20000000 --defer-indexes
+    python -m benchmarks.generate --posts 10000 --applications 200000 --answers   # 소규모 + 답변
+
+Note:
+    - --reset은 데이터 테이블을 비우므로 벤치마크 전용 DB에서만 사용
+    - --defer-indexes는 적재 중 보조 인덱스를 삭제했다가 마지막에 다시 만듭니다 (PK/UNIQUE 인덱스는 유지)
+      적재가 실패해도 다시 만들고, 재생성마저 실패하면 삭제한 인덱스 정의를 출력합니다.
+"""
+
+import argparse
+import io
+import math
+import random
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, List, Optional, Sequence
+
+from benchmarks.dataset import FIELDS, HEADCOUNTS, SCHOOLS, USER_PREFIX, reset
+from database import SessionLocal, engine
+
+TABLES = ["users", "posts", "post_questions", "applications", "application_answers"]
+# stride로 쓰는 큰 소수 (지원자 수와 서로소인 값을 골라 공고별 지원자를 중복 없이 순회)
+STRIDE_PRIMES = [1_000_003, 2_000_003, 3_000_017, 4_000_037, 5_000_011, 7_000_003, 9_000_011]
+
+TITLE_TOPICS = ["AI 챗봇", "캠퍼스 중고거래", "공모전", "해커톤", "스터디 매칭", "동아리 홈페이지", "여행 플래너",
+                "헬스케어 앱", "배달비 절약", "시간표 공유", "졸업 작품", "창업 동아리", "사이드 프로젝트", "데이터 시각화"]
+TITLE_SUFFIXES = ["팀원 모집합니다", "함께할 분 구해요", "같이 하실 분!", "멤버 급구", "팀 빌딩 중입니다"]
+SENTENCES = [
+    "함께 프로젝트를 진행할 팀원을 찾습니다.", "주 1회 오프라인 회의를 진행합니다.", "초보자도 환영합니다.",
+    "포트폴리오에 쓸 수 있는 결과물을 목표로 합니다.", "협업 툴은 노션과 슬랙을 사용합니다.",
+    "마감일까지 MVP를 완성하는 것이 목표입니다.", "관심 있는 분은 편하게 지원해주세요.",
+    "기획부터 배포까지 전 과정을 경험할 수 있습니다.", "열정 있는 분이라면 경험은 상관없습니다.",
+    "학기 중에도 무리 없는 일정으로 진행합니다.", "코드 리뷰를 통해 함께 성장하고 싶습니다.",
+]
+ANSWER_SENTENCES = [
+    "열심히 하겠습니다.", "비슷한 프로젝트 경험이 있습니다.", "팀 프로젝트에서 프론트엔드를 맡았습니다.",
+    "새로운 기술을 배우는 것을 좋아합니다.", "일정 관리에 자신 있습니다.", "꼭 함께하고 싶습니다.",
+]
+TEXT_POOL_SIZE = 4096
+
+
+@dataclass
+class GenerateConfig:
+    owners: int = 50_000
+    applicants: int = 300_000
+    bench_applicants: int = 1_000
+    posts: int = 1_000_000
+    applications: int = 20_000_000
+    zipf: float = 0.8
+    accepted_ratio: float = 0.1
+    rejected_ratio: float = 0.2
+    school_specific_ratio: float = 0.2
+    days: int = 365
+    answers: bool = False
+    seed: int = 42
+    batch_size: int = 100_000
+
+
+def _sentence_pool(rng: random.Random, sentences: Sequence[str], low: int, high: int) -> List[str]:
+    return [" ".join(rng.choices(sentences, k=rng.randint(low, high))) for _ in range(TEXT_POOL_SIZE)]
+
+
+def _timestamp(epoch_seconds: float) -> str:
+    return datetime.fromtimestamp(int(epoch_seconds)).isoformat(" ")
+
+
+def _coprime_stride(n: int, rng: random.Random) -> int:
+    candidates = [p for p in STRIDE_PRIMES if math.gcd(p, n) == 1]
+    return rng.choice(candidates) if candidates else 1
+
+
+def _application_counts(config: GenerateConfig, rng: random.Random) -> List[int]:
+    """
+    공고별 지원서 수 (Zipf 편향)
+
+    인기 순위를 무작위로 섞어 id와 인기도가 상관되지 않게 하고, 공고당 최대치는 지원자 수로 제한합니다.
+    """
+    n = config.posts
+    weights = [1.0 / (rank + 1) ** config.zipf for rank in range(n)]
+    scale = config.applications / sum(weights)
+    rng.shuffle(weights)
+    counts = []
+    for weight in weights:
+        expected = weight * scale
+        count = int(expected) + (rng.random() < expected - int(expected))
+        counts.append(min(count, config.applicants))
+    return counts
+
+
+class CopyLoader:
+    """행 생성기를 batch_size 단위 텍스트 버퍼로 묶어 COPY FROM STDIN으로 적재"""
+
+    def __init__(self, connection, batch_size: int):
+        self.connection = connection
+        self.batch_size = batch_size
+
+    def copy(self, table: str, columns: Sequence[str], rows: Iterable[str], total: Optional[int] = None) -> int:
+        sql = f"COPY {table} ({', '.join(columns)}) FROM STDIN"
+        started = time.perf_counter()
+        count = 0
+        buffer = io.StringIO()
+        cursor = self.connection.cursor()
+        try:
+            for row in rows:
+                buffer.write(row)
+                count += 1
+                if count % self.batch_size == 0:
+                    self._flush(cursor, sql, buffer)
+                    buffer = io.StringIO()
+                    self._progress(table, count, total, started)
+            if buffer.tell():
+                self._flush(cursor, sql, buffer)
+        finally:
+            cursor.close()
+        self.connection.commit()
+        elapsed = time.perf_counter() - started
+        print(f"\r{table}: {count:,}건 ({elapsed:.1f}초, {count / elapsed if elapsed else 0:,.0f}건/초)" + " " * 10)
+        return count
+
+    @staticmethod
+    def _flush(cursor, sql: str, buffer: io.StringIO) -> None:
+        buffer.seek(0)
+        cursor.copy_expert(sql, buffer)
+
+    @staticmethod
+    def _progress(table: str, count: int, total: Optional[int], started: float) -> None:
+        elapsed = time.perf_counter() - started
+        suffix = f" / {total:,}" if total else ""
+        print(f"\r{table}: {count:,}{suffix} ({count / elapsed:,.0f}건/초)", end="", flush=True)
+
+
+def _next_id(cursor, table: str) -> int:
+    cursor.execute(f"SELECT COALESCE(MAX(id), 0) + 1 FROM {table}")
+    return cursor.fetchone()[0]
+
+
+def _sync_sequences(cursor) -> None:
+    for table in TABLES:
+        cursor.execute(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), COALESCE((SELECT MAX(id) FROM {table}), 0) + 1, false)"
+        )
+
+
+def _next_user_number(cursor, group: str) -> int:
+    """기존 벤치마크 사용자({USER_PREFIX}{group}{번호})의 다음 번호 (재실행 시 user_id/kakao_id 충돌 방지)"""
+    cursor.execute(
+        "SELECT COALESCE(MAX(substring(user_id FROM %s)::bigint) + 1, 0) FROM users WHERE user_id LIKE %s",
+        (f"^{USER_PREFIX}{group}([0-9]+)$", f"{USER_PREFIX}{group}%"),
+    )
+    return cursor.fetchone()[0]
+
+
+def _drop_secondary_indexes(cursor) -> List[str]:
+    """UNIQUE가 아닌 보조 인덱스 삭제 후 재생성용 정의 반환 (PK/UNIQUE는 FK가 참조할 수 있어 유지)"""
+    cursor.execute(
+        """
+        SELECT i.indexname, i.indexdef FROM pg_indexes i
+        WHERE i.schemaname = current_schema() AND i.tablename = ANY(%s)
+          AND i.indexdef NOT LIKE 'CREATE UNIQUE INDEX%%'
+          AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conname = i.indexname)
+        """,
+        (TABLES,),
+    )
+    definitions = []
+    for name, definition in cursor.fetchall():
+        cursor.execute(f'DROP INDEX IF EXISTS "{name}"')
+        definitions.append(definition)
+    return definitions
+
+
+def _restore_indexes(connection, definitions: List[str]) -> None:
+    """삭제한 보조 인덱스 재생성 (실패 시 수동 복구용 정의 출력)"""
+    started = time.perf_counter()
+    connection.rollback()  # 적재 실패로 트랜잭션이 중단된 경우
+    cursor = connection.cursor()
+    try:
+        for definition in definitions:
+            cursor.execute(definition.replace("CREATE INDEX ", "CREATE INDEX IF NOT EXISTS ", 1))
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        print("인덱스 재생성 실패 - 다음 정의를 직접 실행하세요:", file=sys.stderr)
+        for definition in definitions:
+            print(f"  {definition};", file=sys.stderr)
+        raise
+    finally:
+        cursor.close()
+    print(f"인덱스 {len(definitions)}개 재생성 ({time.perf_counter() - started:.1f}초)")
+
+
+def generate(config: GenerateConfig, defer_indexes: bool = False) -> dict:
+    """
+    합성 데이터 적재
+
+    Args:
+        config: 규모, 분포, 시드
+        defer_indexes: 적재 중 보조 인덱스를 삭제했다가 마지막에 다시 생성
+
+    Returns:
+        dict: 테이블별 적재 건수
+    """
+    rng = random.Random(config.seed)
+    now = time.time()
+    titles = [f"{rng.choice(TITLE_TOPICS)} {rng.choice(TITLE_SUFFIXES)}" for _ in range(TEXT_POOL_SIZE)]
+    descriptions = _sentence_pool(rng, SENTENCES, 2, 12)
+    answers = _sentence_pool(rng, ANSWER_SENTENCES, 1, 6)
+
+    connection = engine.raw_connection()
+    index_definitions: List[str] = []
+    try:
+        cursor = connection.cursor()
+        if defer_indexes:
+            index_definitions = _drop_secondary_indexes(cursor)
+            connection.commit()
+        try:
+            loaded = _load(connection, cursor, config, rng, now, titles, descriptions, answers)
+        finally:
+            if index_definitions:
+                _restore_indexes(connection, index_definitions)
+
+        started = time.perf_counter()
+        for table in TABLES:
+            cursor.execute(f"ANALYZE {table}")
+        connection.commit()
+        print(f"ANALYZE 완료 ({time.perf_counter() - started:.1f}초)")
+        cursor.close()
+        return loaded
+    finally:
+        connection.close()
+
+
+def _load(connection, cursor, config: GenerateConfig, rng: random.Random, now: float,
+          titles: List[str], descriptions: List[str], answers: List[str]) -> dict:
+    """테이블별 COPY 적재 후 시퀀스 동기화 → 테이블별 적재 건수"""
+    span = config.days * 86400
+    loader = CopyLoader(connection, config.batch_size)
+    user_base = _next_id(cursor, "users")
+    post_base = _next_id(cursor, "posts")
+    question_base = _next_id(cursor, "post_questions")
+    application_base = _next_id(cursor, "applications")
+    answer_base = _next_id(cursor, "application_answers")
+    loaded = {}
+
+    # 사용자: owner(공고 작성자), seed(생성 지원서의 지원자), apply(benchmarks.run apply 흐름 전용)
+    # 번호는 기존 벤치마크 사용자 다음부터 (--reset 없이 재실행해도 UNIQUE 충돌 없음)
+    groups = [("owner", config.owners), ("seed", config.applicants), ("apply", config.bench_applicants)]
+    first = {prefix: _next_user_number(cursor, prefix) for prefix, _ in groups}
+
+    def user_rows():
+        user_id = user_base
+        for prefix, count in groups:
+            for i in range(first[prefix], first[prefix] + count):
+                field = FIELDS[i % len(FIELDS)]
+                created = _timestamp(now - span - rng.random() * 86400 * 30)
+                yield f"{user_id}\t{USER_PREFIX}{prefix}{i}\tbench_{prefix}{i}\t{prefix}{i}\t{field}\tt\t{created}\n"
+                user_id += 1
+
+    loaded["users"] = loader.copy(
+        "users", ["id", "user_id", "kakao_id", "name", "field", "is_onboarded", "created_at"],
+        user_rows(), config.owners + config.applicants + config.bench_applicants,
+    )
+
+    counts = _application_counts(config, rng)
+    post_created = [now - span * (1 - i / config.posts) for i in range(config.posts)]
+
+    def post_rows():
+        for i in range(config.posts):
+            owner = f"{USER_PREFIX}owner{first['owner'] + i % config.owners}"
+            school_specific = rng.random() < config.school_specific_ratio
+            school = rng.choice(SCHOOLS) if school_specific else "\\N"
+            deadline = _timestamp(post_created[i] + rng.randint(7, 60) * 86400)
+            views = counts[i] * rng.randint(3, 20) + rng.randint(0, 50)
+            yield (
+                f"{post_base + i}\t{owner}\thttps://storage.googleapis.com/bench/posts/{i}.png\t"
+                f"{titles[rng.randrange(TEXT_POOL_SIZE)]} #{i}\t{descriptions[rng.randrange(TEXT_POOL_SIZE)]}\t"
+                f"{rng.choice(FIELDS)}\t{rng.choice(HEADCOUNTS)}\t{'t' if school_specific else 'f'}\t{school}\t"
+                f"{deadline}\t{views}\t{_timestamp(post_created[i])}\n"
+            )
+
+    loaded["posts"] = loader.copy(
+        "posts", ["id", "user_id", "image_url", "title", "description", "recruitment_field",
+                  "recruitment_headcount", "school_specific", "target_school_name", "deadline", "views", "created_at"],
+        post_rows(), config.posts,
+    )
+
+    # 공고당 질문 2개: TEXT(필수), TEXTAREA(선택) → question id = question_base + 2 * i + k
+    def question_rows():
+        for i in range(config.posts):
+            post_id = post_base + i
+            yield f"{question_base + 2 * i}\t{post_id}\tTEXT\t자기소개를 해주세요.\tt\n"
+            yield f"{question_base + 2 * i + 1}\t{post_id}\tTEXTAREA\t가장 기억에 남는 프로젝트는?\tf\n"
+
+    loaded["post_questions"] = loader.copy(
+        "post_questions", ["id", "post_id", "question_type", "question_content", "is_required"],
+        question_rows(), config.posts * 2,
+    )
+
+    accepted, rejected = config.accepted_ratio, config.accepted_ratio + config.rejected_ratio
+    answer_refs: List[int] = [] if config.answers else None
+
+    def application_rows():
+        application_id = application_base
+        for i, count in enumerate(counts):
+            if not count:
+                continue
+            start = rng.randrange(config.applicants)
+            stride = _coprime_stride(config.applicants, rng)
+            created = post_created[i]
+            window = max(now - created, 1.0)
+            for j in range(count):
+                applicant = (start + j * stride) % config.applicants
+                roll = rng.random()
+                status = "합격" if roll < accepted else "불합격" if roll < rejected else "제출됨"
+                if answer_refs is not None:
+                    answer_refs.append(i)
+                yield (
+                    f"{application_id}\t{post_base + i}\t{USER_PREFIX}seed{first['seed'] + applicant}\t{status}\t"
+                    f"{_timestamp(created + rng.random() * window)}\n"
+                )
+                application_id += 1
+
+    loaded["applications"] = loader.copy(
+        "applications", ["id", "post_id", "user_id", "status", "created_at"], application_rows(), sum(counts),
+    )
+
+    if answer_refs is not None:
+        # 지원서마다 필수 질문(TEXT) 답변 1건
+        def answer_rows():
+            for offset, post_index in enumerate(answer_refs):
+                yield (
+                    f"{answer_base + offset}\t{application_base + offset}\t{question_base + 2 * post_index}\t"
+                    f"{answers[rng.randrange(TEXT_POOL_SIZE)]}\n"
+                )
+
+        loaded["application_answers"] = loader.copy(
+            "application_answers", ["id", "application_id", "post_question_id", "answer_content"],
+            answer_rows(), len(answer_refs),
+        )
+
+    _sync_sequences(cursor)
+    connection.commit()
+
+    return loaded
+
+
+def _ratio(value: str) -> float:
+    ratio = float(value)
+    if not 0 <= ratio <= 1:
+        raise argparse.ArgumentTypeError("0과 1 사이 값이어야 합니다.")
+    return ratio
+
+
+def main() -> int:
+    defaults = GenerateConfig()
+    parser = argparse.ArgumentParser(description="JOBA 대용량 합성 데이터 생성 (COPY)")
+    parser.add_argument("--reset", action="store_true", help="데이터 테이블을 비우고 생성 (벤치마크 전용 DB에서만)")
+    parser.add_argument("--owners", type=int, default=defaults.owners, help="공고 작성자 수")
+    parser.add_argument("--applicants", type=int, default=defaults.applicants, help="지원자 수 (공고당 최대 지원서 수)")
+    parser.add_argument("--bench-applicants", type=int, default=defaults.bench_applicants,
+                        help="benchmarks.run apply 흐름 전용 사용자 수")
+    parser.add_argument("--posts", type=int, default=defaults.posts)
+    parser.add_argument("--applications", type=int, default=defaults.applications, help="목표 지원서 수")
+    parser.add_argument("--zipf", type=float, default=defaults.zipf, help="공고 인기도 편향 지수 (0이면 균등)")
+    parser.add_argument("--accepted-ratio", type=_ratio, default=defaults.accepted_ratio)
+    parser.add_argument("--rejected-ratio", type=_ratio, default=defaults.rejected_ratio)
+    parser.add_argument("--school-specific-ratio", type=_ratio, default=defaults.school_specific_ratio)
+    parser.add_argument("--days", type=int, default=defaults.days, help="공고 작성일 분포 기간 (일)")
+    parser.add_argument("--answers", action="store_true", help="지원서마다 답변 1건 생성")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--batch-size", type=int, default=defaults.batch_size, help="COPY 한 번에 보낼 행 수")
+    parser.add_argument("--defer-indexes", action="store_true", help="적재 중 보조 인덱스 삭제 후 마지막에 재생성")
+    args = parser.parse_args()
+
+    if args.accepted_ratio + args.rejected_ratio > 1:
+        parser.error("--accepted-ratio와 --rejected-ratio의 합은 1 이하여야 합니다.")
+    if min(args.owners, args.applicants, args.posts) <= 0:
+        parser.error("--owners, --applicants, --posts는 1 이상이어야 합니다.")
+
+    config = GenerateConfig(
+        owners=args.owners, applicants=args.applicants, bench_applicants=args.bench_applicants,
+        posts=args.posts, applications=args.applications, zipf=args.zipf,
+        accepted_ratio=args.accepted_ratio, rejected_ratio=args.rejected_ratio,
+        school_specific_ratio=args.school_specific_ratio, days=args.days, answers=args.answers,
+        seed=args.seed, batch_size=args.batch_size,
+    )
+    if args.reset:
+        with SessionLocal() as db:
+            reset(db)
+
+    started = time.perf_counter()
+    loaded = generate(config, defer_indexes=args.defer_indexes)
+    print(f"🎉 완료: {sum(loaded.values()):,}건, {time.perf_counter() - started:.1f}초")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
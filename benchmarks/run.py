@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+v1 API 벤치마크 실행 CLI
+
+데이터셋 생성 → (필요 시) 로컬 앱 실행 → 워밍업 → 동시 요청 실행 → 라우트별 결과 JSON 저장.
+사용법은 benchmarks/__init__.py 참고.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+import httpx
+
+from benchmarks import dataset as dataset_module
+from benchmarks.scenarios import DEFAULT_WEIGHTS, SCENARIOS, Recorder, ScenarioContext
+from database import SessionLocal, User
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(ROOT_DIR, "benchmarks", "results")
+
+
+def _parse_weights(value: str) -> Dict[str, int]:
+    # "feed=50,detail=30,apply=10,review=10"
+    weights = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"알 수 없는 흐름: {name} (가능: {', '.join(SCENARIOS)})")
+        weights[name] = int(weight or 1)
+    return weights
+
+
+def _git(*args: str) -> Optional[str]:
+    try:
+        return subprocess.run(["git", *args], cwd=ROOT_DIR, capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(workers: int) -> tuple:
+    """uvicorn으로 로컬 앱 실행 후 /ping 응답까지 대기"""
+    port = _free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning", "--no-access-log"],
+        cwd=ROOT_DIR,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"앱 실행 실패 (종료 코드 {process.returncode})")
+        try:
+            if httpx.get(f"{base_url}/ping", timeout=1.0).status_code == 200:
+                return process, base_url
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("앱이 60초 안에 응답하지 않습니다.")
+
+
+async def run_load(ctx: ScenarioContext, weights: Dict[str, int], concurrency: int,
+                   duration: float, max_requests: Optional[int]) -> float:
+    """동시 작업자 concurrency개가 duration초(또는 max_requests개 동작) 동안 흐름을 실행, 경과 시간 반환"""
+    names = list(weights)
+    cumulative = [weights[name] for name in names]
+    deadline = time.perf_counter() + duration
+    remaining = [max_requests] if max_requests else None
+
+    async def worker():
+        while time.perf_counter() < deadline:
+            if remaining is not None:
+                if remaining[0] <= 0:
+                    return
+                remaining[0] -= 1
+            name = ctx.rng.choices(names, weights=cumulative)[0]
+            await SCENARIOS[name](ctx)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - started
+
+
+async def benchmark(args, data: dataset_module.Dataset, base_url: str) -> dict:
+    recorder = Recorder()
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=args.timeout) as client:
+        ctx = ScenarioContext(
+            client=client, recorder=recorder, dataset=data, rng=random.Random(args.seed),
+            attachments=not args.no_attachments, attachment_bytes=args.attachment_kb * 1024,
+        )
+        if args.warmup > 0:
+            recorder.enabled = False
+            await run_load(ctx, args.weights, args.concurrency, args.warmup, None)
+            recorder.enabled = True
+        elapsed = await run_load(ctx, args.weights, args.concurrency, args.duration, args.requests)
+
+    routes = recorder.summary(elapsed)
+    total = sum(r["count"] for r in routes.values())
+    return {
+        "elapsed_seconds": round(elapsed, 3),
+        "total_requests": total,
+        "total_errors": sum(r["errors"] for r in routes.values()),
+        "throughput_rps": round(total / elapsed, 2) if elapsed else None,
+        "routes": routes,
+    }
+
+
+def print_report(result: dict) -> None:
+    print(f"\n{'route':<52} {'count':>7} {'err':>5} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8}  (ms)")
+    for label, r in result["routes"].items():
+        print(f"{label:<52} {r['count']:>7} {r['errors']:>5} {r['throughput_rps']:>8} "
+              f"{r['p50_ms']:>8} {r['p95_ms']:>8} {r['p99_ms']:>8}")
+    print(f"\n총 {result['total_requests']}건, 오류 {result['total_errors']}건, "
+          f"{result['throughput_rps']} req/s ({result['elapsed_seconds']}초)")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="JOBA v1 API 벤치마크")
+    parser.add_argument("--base-url", help="이미 실행 중인 앱 주소 (없으면 uvicorn으로 로컬 실행)")
+    parser.add_argument("--workers", type=int, default=1, help="로컬 실행 시 uvicorn 워커 수")
+    parser.add_argument("--reset", action="store_true", help="데이터 테이블을 비우고 새로 생성 (벤치마크 전용 DB에서만)")
+    parser.add_argument("--no-seed", action="store_true", help="데이터셋을 만들지 않고 기존 벤치마크 데이터 사용")
+    parser.add_argument("--owners", type=int, default=50)
+    parser.add_argument("--seed-applicants", type=int, default=500)
+    parser.add_argument("--bench-applicants", type=int, default=500, help="apply 흐름 전용 사용자 수")
+    parser.add_argument("--posts", type=int, default=500)
+    parser.add_argument("--applications-per-post", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42, help="데이터셋/요청 선택 난수 시드")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=30.0, help="측정 시간 (초)")
+    parser.add_argument("--requests", type=int, default=None, help="최대 동작 수 (지정 시 duration 전에 끝날 수 있음)")
+    parser.add_argument("--warmup", type=float, default=5.0, help="워밍업 시간 (초, 결과에서 제외)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="요청 타임아웃 (초)")
+    parser.add_argument("--weights", type=_parse_weights, default=DEFAULT_WEIGHTS,
+                        help="흐름별 가중치 (예: feed=50,detail=30,apply=10,review=10)")
+    parser.add_argument("--no-attachments", action="store_true", help="지원서 제출 시 첨부파일 제외 (GCS 미사용)")
+    parser.add_argument("--attachment-kb", type=int, default=200)
+    parser.add_argument("--label", default=None, help="결과 파일 이름에 붙일 라벨")
+    parser.add_argument("--output", default=None, help="결과 JSON 경로 (기본: benchmarks/results/)")
+    args = parser.parse_args()
+
+    config = dataset_module.DatasetConfig(
+        owners=args.owners, seed_applicants=args.seed_applicants, bench_applicants=args.bench_applicants,
+        posts=args.posts, applications_per_post=args.applications_per_post, seed=args.seed,
+    )
+    with SessionLocal() as db:
+        if args.no_seed:
+            data = dataset_module.load(db)
+        else:
+            if args.reset:
+                dataset_module.reset(db)
+            elif db.query(User.id).filter(User.user_id.like(f"{dataset_module.USER_PREFIX}%")).first():
+                print("❌ 기존 벤치마크 데이터가 있습니다. --reset 또는 --no-seed를 사용하세요.")
+                return 1
+            print("데이터셋 생성 중...")
+            data = dataset_module.seed(db, config)
+    if not data.post_ids:
+        print("❌ 벤치마크 데이터가 없습니다.")
+        return 1
+
+    process = None
+    base_url = args.base_url
+    if not base_url:
+        process, base_url = start_server(args.workers)
+    try:
+        print(f"벤치마크 실행: {base_url}, 동시성 {args.concurrency}, {args.duration}초")
+        result = asyncio.run(benchmark(args, data, base_url))
+    finally:
+        if process:
+            process.terminate()
+            process.wait(timeout=30)
+
+    commit = _git("rev-parse", "--short", "HEAD")
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_commit": commit,
+            "git_dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "base_url": base_url if args.base_url else "local",
+            "workers": args.workers if not args.base_url else None,
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+            "warmup": args.warmup,
+            "weights": args.weights,
+            "attachments": not args.no_attachments,
+            "seed": args.seed,
+        },
+        "dataset": {
+            "posts": len(data.post_ids),
+            "bench_applicants": len(data.bench_applicants),
+            "submitted_applications": sum(len(v) for v in data.submitted_application_ids.values()),
+            "config": vars(config) if not args.no_seed else None,
+        },
+        **result,
+    }
+
+    output = args.output
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        name = datetime.now().strftime("%Y%m%d-%H%M%S") + f"-{commit or 'nogit'}" + (f"-{args.label}" if args.label else "")
+        output = os.path.join(RESULTS_DIR, f"{name}.json")
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print_report(result)
+    print(f"결과 저장: {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
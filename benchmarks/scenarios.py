@@ -0,0 +1,185 @@
+"""
+벤치마크 흐름과 지연 기록
+
+각 흐름은 ScenarioContext를 받아 한 번의 사용자 동작(여러 요청일 수 있음)을 실행합니다.
+요청 지연은 라우트 템플릿 라벨("GET /v1/posts/{post_id}")별로 Recorder에 기록됩니다.
+"""
+
+import itertools
+import json
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+from benchmarks.dataset import Dataset
+from security import create_access_token
+
+SORTS = ["최신순", "인기순", "랜덤순"]
+FIELDS = ["프론트엔드", "백엔드", "기획", "디자인", "데이터 분석"]
+
+
+def percentile(sorted_values: List[float], q: float) -> Optional[float]:
+    """nearest-rank 분위수 (정렬된 값 기준)"""
+    if not sorted_values:
+        return None
+    index = max(0, min(len(sorted_values) - 1, int(round(q * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+@dataclass
+class RouteStats:
+    latencies: List[float] = field(default_factory=list)
+    statuses: Dict[str, int] = field(default_factory=dict)
+    errors: int = 0
+
+
+class Recorder:
+    """라우트별 요청 지연/상태 기록 (이벤트 루프 하나에서만 사용)"""
+
+    def __init__(self):
+        self.routes: Dict[str, RouteStats] = {}
+        self.enabled = True
+
+    def record(self, label: str, seconds: float, status: str, error: bool) -> None:
+        if not self.enabled:
+            return
+        stats = self.routes.setdefault(label, RouteStats())
+        stats.latencies.append(seconds)
+        stats.statuses[status] = stats.statuses.get(status, 0) + 1
+        if error:
+            stats.errors += 1
+
+    def summary(self, elapsed_seconds: float) -> Dict[str, dict]:
+        """라우트별 요청 수, 오류 수, 처리량(rps), 지연 분위수(ms)"""
+        result = {}
+        for label, stats in sorted(self.routes.items()):
+            values = sorted(stats.latencies)
+            count = len(values)
+            result[label] = {
+                "count": count,
+                "errors": stats.errors,
+                "error_rate": round(stats.errors / count, 4) if count else 0.0,
+                "statuses": stats.statuses,
+                "throughput_rps": round(count / elapsed_seconds, 2) if elapsed_seconds else None,
+                "mean_ms": round(sum(values) / count * 1000, 2) if count else None,
+                "p50_ms": _ms(percentile(values, 0.50)),
+                "p95_ms": _ms(percentile(values, 0.95)),
+                "p99_ms": _ms(percentile(values, 0.99)),
+                "max_ms": _ms(values[-1] if values else None),
+            }
+        return result
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return round(seconds * 1000, 2) if seconds is not None else None
+
+
+@dataclass
+class ScenarioContext:
+    client: httpx.AsyncClient
+    recorder: Recorder
+    dataset: Dataset
+    rng: random.Random
+    attachments: bool = True
+    attachment_bytes: int = 200 * 1024
+    _tokens: Dict[str, str] = field(default_factory=dict)
+    _apply_pairs: Optional[Iterator[Tuple[str, int]]] = None
+
+    def auth(self, user_id: str) -> Dict[str, str]:
+        token = self._tokens.get(user_id)
+        if token is None:
+            token = self._tokens[user_id] = create_access_token({"sub": user_id})
+        return {"Authorization": f"Bearer {token}"}
+
+    def next_apply_pair(self) -> Optional[Tuple[str, int]]:
+        """아직 지원하지 않은 (벤치 지원자, 공고) 조합 (소진되면 None)"""
+        if self._apply_pairs is None:
+            posts = list(self.dataset.post_ids)
+            self.rng.shuffle(posts)
+            self._apply_pairs = (
+                (user_id, post_id)
+                for post_id, user_id in itertools.product(posts, self.dataset.bench_applicants)
+                if (user_id, post_id) not in self.dataset.applied
+            )
+        pair = next(self._apply_pairs, None)
+        if pair:
+            self.dataset.applied.add(pair)
+        return pair
+
+    async def request(self, label: str, method: str, url: str, **kwargs) -> Optional[httpx.Response]:
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            self.recorder.record(label, time.perf_counter() - started, type(e).__name__, True)
+            return None
+        self.recorder.record(label, time.perf_counter() - started, str(response.status_code), response.status_code >= 400)
+        return response
+
+
+async def feed(ctx: ScenarioContext) -> None:
+    """공고 목록 탐색 (정렬/분야 필터/페이지 무작위)"""
+    params = {"sort": ctx.rng.choice(SORTS), "page": ctx.rng.choice([1, 1, 1, 2, 3]), "size": 20}
+    if ctx.rng.random() < 0.3:
+        params["recruitment_field"] = ctx.rng.choice(FIELDS)
+    await ctx.request("GET /v1/posts", "GET", "/v1/posts", params=params)
+
+
+async def detail(ctx: ScenarioContext) -> None:
+    """공고 상세 + 질문 조회"""
+    post_id = ctx.rng.choice(ctx.dataset.post_ids)
+    await ctx.request("GET /v1/posts/{post_id}", "GET", f"/v1/posts/{post_id}")
+    await ctx.request("GET /v1/posts/{post_id}/questions", "GET", f"/v1/posts/{post_id}/questions")
+
+
+async def apply(ctx: ScenarioContext) -> None:
+    """지원서 제출 (첨부파일 질문이 있으면 파일 포함)"""
+    pair = ctx.next_apply_pair()
+    if pair is None:
+        return
+    user_id, post_id = pair
+    answers, files = [], []
+    for question in ctx.dataset.post_questions.get(post_id, []):
+        if question["question_type"] == "ATTACHMENT":
+            if not ctx.attachments:
+                continue
+            filename = f"portfolio_{user_id}_{post_id}.pdf"
+            answers.append({"post_question_id": question["id"], "answer_content": filename})
+            files.append(("portfolio_files", (filename, b"%PDF-1.4\n" + b"0" * ctx.attachment_bytes, "application/pdf")))
+        else:
+            answers.append({"post_question_id": question["id"], "answer_content": "벤치마크 지원 답변입니다."})
+    await ctx.request(
+        "POST /v1/applications", "POST", "/v1/applications",
+        data={"application_data": json.dumps({"post_id": post_id, "answers": answers}, ensure_ascii=False)},
+        files=files or None,
+        headers=ctx.auth(user_id),
+    )
+
+
+async def review(ctx: ScenarioContext) -> None:
+    """모집자 검토: 지원자 목록 → 지원서 상세 → 상태 변경"""
+    post_id = ctx.rng.choice(ctx.dataset.post_ids)
+    headers = ctx.auth(ctx.dataset.post_owner[post_id])
+    await ctx.request(
+        "GET /v1/posts/{post_id}/applications", "GET", f"/v1/posts/{post_id}/applications",
+        params={"size": 20}, headers=headers,
+    )
+    pending = ctx.dataset.submitted_application_ids.get(post_id)
+    if not pending:
+        return
+    application_id = pending.pop()
+    await ctx.request(
+        "GET /v1/applications/{application_id}/detail", "GET", f"/v1/applications/{application_id}/detail",
+        headers=headers,
+    )
+    await ctx.request(
+        "PATCH /v1/applications/{application_id}/status", "PATCH", f"/v1/applications/{application_id}/status",
+        json={"new_status": ctx.rng.choice(["합격", "불합격"])}, headers=headers,
+    )
+
+
+SCENARIOS: Dict[str, Callable] = {"feed": feed, "detail": detail, "apply": apply, "review": review}
+DEFAULT_WEIGHTS = {"feed": 50, "detail": 30, "apply": 10, "review": 10}
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+목록 응답 직렬화 마이크로벤치마크
+
+공고 목록(PostListResponse) 한 페이지를 만드는 비용을 경로별로 비교합니다. (DB 조회 제외, 항목당 µs)
+- validated: 항목 dict → PostListResponse 생성(검증) → FastAPI response_model 처리(재검증 + Pydantic dump_json)
+- stdlib: jsonable_encoder + json.dumps (response_model 없는 라우트의 기본 경로)
+- trusted/orjson, trusted/pydantic_core: 검증 없이 dict를 바로 직렬화 (services.fast_json)
+
+모든 경로에 항목 dict 생성 비용이 포함되며, 출력 바이트가 validated와 같은지도 확인합니다.
+
+사용법:
+    python -m benchmarks.serialization --items 100
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Callable, Dict, List
+
+import pydantic_core
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from schemas import PostListResponse
+from services import fast_json
+
+POST_FIELDS = [
+    "id", "user_id", "image_url", "title", "description", "recruitment_field", "recruitment_headcount",
+    "school_specific", "target_school_name", "deadline", "external_link", "created_at", "updated_at",
+]
+
+
+def _rows(count: int) -> List[SimpleNamespace]:
+    now = datetime(2026, 3, 2, 9, 30, 15, 123456)
+    return [
+        SimpleNamespace(
+            id=i + 1,
+            user_id=f"kakao_{1000 + i}",
+            image_url=f"https://storage.googleapis.com/joba/posts/images/{i}.png",
+            title=f"AI 챗봇 사이드 프로젝트 팀원 모집합니다 #{i}",
+            description="함께 프로젝트를 진행할 팀원을 찾습니다. 초보자도 환영합니다. " * 4,
+            recruitment_field="백엔드",
+            recruitment_headcount="3~5인",
+            school_specific=i % 5 == 0,
+            target_school_name="서울대학교" if i % 5 == 0 else None,
+            deadline=now + timedelta(days=i % 30),
+            external_link=None,
+            created_at=now - timedelta(minutes=i),
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+def _page(rows: List[SimpleNamespace]) -> dict:
+    # list_posts와 같은 형태의 응답 dict
+    posts = []
+    for row in rows:
+        post = {name: getattr(row, name) for name in POST_FIELDS}
+        post["application_count"] = row.id % 40
+        post["recruited_count"] = row.id % 3
+        post["recruitment_status"] = "모집중"
+        posts.append(post)
+    return {"total_count": 1_000_000, "posts": posts}
+
+
+def paths(rows: List[SimpleNamespace]) -> Dict[str, Callable[[], bytes]]:
+    response_field = TypeAdapter(PostListResponse)
+
+    def validated() -> bytes:
+        model = PostListResponse(**_page(rows))
+        return response_field.dump_json(response_field.validate_python(model))
+
+    def stdlib() -> bytes:
+        return json.dumps(jsonable_encoder(_page(rows)), ensure_ascii=False, separators=(",", ":")).encode()
+
+    result = {"validated": validated, "stdlib": stdlib}
+    if fast_json.orjson is not None:
+        result["trusted/orjson"] = lambda: fast_json.dumps(_page(rows))
+    result["trusted/pydantic_core"] = lambda: pydantic_core.to_json(_page(rows))
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="목록 응답 직렬화 마이크로벤치마크")
+    parser.add_argument("--items", type=int, default=100, help="페이지당 공고 수")
+    parser.add_argument("--number", type=int, default=200, help="측정 1회당 반복 횟수")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    rows = _rows(args.items)
+    candidates = paths(rows)
+    expected = json.loads(candidates["validated"]())
+
+    print(f"공고 {args.items}개 페이지, {args.number}회 x {args.repeat} (최솟값)")
+    print(f"{'path':<24} {'µs/item':>9} {'ms/page':>9} {'bytes':>8} {'speedup':>8}  same")
+    baseline = None
+    for name, func in candidates.items():
+        body = func()
+        seconds = min(timeit.repeat(func, number=args.number, repeat=args.repeat)) / args.number
+        baseline = baseline or seconds
+        print(f"{name:<24} {seconds / args.items * 1e6:>9.2f} {seconds * 1e3:>9.3f} {len(body):>8} "
+              f"{baseline / seconds:>7.1f}x  {json.loads(body) == expected}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
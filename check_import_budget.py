@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+워커 기동 시간(import main) 점검 스크립트
+CI나 배포 전에 실행하여 앱 import가 예산 안에 끝나는지, 무거운 선택 의존성이
+기동 경로에서 로딩되지 않는지 확인합니다. 실패 시 종료 코드 1을 반환합니다.
+
+사용법:
+    python check_import_budget.py                # 기본 예산 1.0초, 3회 중 최솟값 기준
+    python check_import_budget.py --budget 0.8 --runs 5
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+# 기동 경로에서 로딩되면 안 되는 모듈 (최초 사용 시점에 로딩)
+FORBIDDEN_MODULE_PREFIXES = ("google.cloud", "google.oauth2", "redis")
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import main  # noqa: F401
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def measure_import() -> dict:
+    """
+    새 인터프리터에서 main을 import하고 소요 시간과 로딩된 모듈 목록을 반환합니다.
+
+    Returns:
+        dict: {"seconds": float, "modules": List[str]}
+
+    Note:
+        - REDIS_URL을 비운 상태로 측정 (Redis 미사용 워커 기준)
+    """
+    env = dict(os.environ, REDIS_URL="")
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="import main 시간 예산 점검")
+    parser.add_argument("--budget", type=float, default=1.0, help="허용 import 시간 (초)")
+    parser.add_argument("--runs", type=int, default=3, help="측정 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    samples = [measure_import() for _ in range(max(1, args.runs))]
+    best = min(sample["seconds"] for sample in samples)
+    loaded = [
+        name for name in samples[0]["modules"]
+        if any(name == prefix or name.startswith(prefix + ".") for prefix in FORBIDDEN_MODULE_PREFIXES)
+    ]
+
+    ok = True
+    if loaded:
+        ok = False
+        print(f"❌ 기동 경로에서 로딩된 모듈: {', '.join(loaded[:10])}")
+    if best > args.budget:
+        ok = False
+        print(f"❌ import main {best:.3f}초 (예산 {args.budget:.3f}초 초과)")
+    else:
+        print(f"✅ import main {best:.3f}초 (예산 {args.budget:.3f}초)")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
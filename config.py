@@ -7,6 +7,21 @@ class Settings(BaseSettings):
     # 데이터베이스 설정
     DATABASE_URL: str
     
+    # DB 커넥션 풀 설정 (동기/비동기 엔진에 각각 적용 - 워커당 최대 연결 수 = 2 * (POOL_SIZE + MAX_OVERFLOW))
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0  # 커넥션 획득 대기 한도
+    DB_POOL_RECYCLE_SECONDS: int = -1  # 연결 재생성 주기 (-1: 사용 안 함, Neon 등 유휴 연결을 끊는 환경에서는 300 권장)
+    DB_POOL_PRE_PING: bool = True  # 체크아웃 시 연결 확인 (끄면 recycle/오류 발생 시 무효화에만 의존)
+    DB_POOL_USE_LIFO: bool = False  # 최근 사용한 연결 우선 재사용 (유휴 연결이 자연스럽게 정리됨)
+    RUN_MIGRATIONS_ON_STARTUP: bool = False  # 워커 기동 시 마이그레이션 실행 (기본은 배포 시 update_db.py로 한 번)
+    
+    # 읽기 복제본 설정 (공개 조회 API) - 쉼표로 여러 개 지정, 비어 있으면 primary만 사용
+    DATABASE_READ_URLS: Optional[str] = None
+    DB_READ_MAX_LAG_SECONDS: float = 5.0  # 이보다 지연된 복제본은 제외
+    DB_READ_LAG_CHECK_INTERVAL_SECONDS: float = 5.0  # 복제 지연 확인 주기
+    DB_READ_YOUR_WRITES_SECONDS: float = 5.0  # 쓰기 후 같은 클라이언트를 primary에서 읽게 하는 시간
+    
     # GCP 설정
     GCP_PROJECT_ID: str
     GCS_BUCKET_NAME: str
@@ -19,10 +34,21 @@ class Settings(BaseSettings):
     JWT_SECRET: str
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7일
     JWT_SIGNUP_TOKEN_EXPIRE_MINUTES: int = 15  # 15분
+    JWT_EMBED_CLAIMS: bool = False  # 액세스 토큰에 사용자 클레임 포함 (get_current_claims가 DB 조회 생략, REDIS_URL 필요)
     
     # 파일 업로드 설정
     MAX_FILE_SIZE_BYTES: int = 1024 * 1024 * 1024  # 1GB
     
+    # 캐시 설정 - 공고 질문 (Redis는 REDIS_URL이 있을 때만 사용)
+    QUESTION_CACHE_MAX_POSTS: int = 2048  # 프로세스 내 캐시에 보관할 공고 수
+    QUESTION_CACHE_TTL_SECONDS: int = 60  # 프로세스 내 캐시 (Redis 무효화 실패 시 이전 질문이 쓰일 수 있는 최대 시간)
+    QUESTION_CACHE_REDIS_TTL_SECONDS: int = 60 * 60  # 1시간
+    
+    # 캐시 설정 - 인증 사용자 (get_current_user)
+    AUTH_USER_CACHE_MAX_ENTRIES: int = 10000
+    AUTH_USER_CACHE_TTL_SECONDS: int = 15  # 프로세스 내 캐시 (다른 워커의 변경이 반영되기까지 최대 지연)
+    AUTH_USER_CACHE_REDIS_TTL_SECONDS: int = 5 * 60  # 5분
+    
     # 소셜 로그인 설정 - Kakao
     KAKAO_CLIENT_ID: str
     KAKAO_CLIENT_SECRET: str
@@ -38,6 +64,52 @@ class Settings(BaseSettings):
     GOOGLE_CLIENT_ID: str
     GOOGLE_CLIENT_SECRET: str
     GOOGLE_REDIRECT_URI: str
+    
+    # 소셜 로그인 HTTP 클라이언트 설정 (제공자별 커넥션 풀)
+    OAUTH_HTTP_TIMEOUT_SECONDS: float = 5.0
+    OAUTH_HTTP_CONNECT_TIMEOUT_SECONDS: float = 3.0
+    OAUTH_HTTP_MAX_CONNECTIONS: int = 20
+    OAUTH_HTTP_KEEPALIVE_SECONDS: float = 30.0
+    OAUTH_CIRCUIT_FAILURE_THRESHOLD: int = 5  # 연속 실패 횟수 (초과 시 서킷 open)
+    OAUTH_CIRCUIT_RESET_SECONDS: float = 30.0  # open 유지 시간 (이후 시험 호출 1건 허용)
+    
+    # 응답 직렬화 (services/fast_json.py)
+    RESPONSE_VALIDATE_TRUSTED: bool = False  # 검증을 생략하는 목록 응답도 response_model로 검증 (테스트/CI용)
+    
+    # 요청 속도 제한 (services/rate_limit.py) - "횟수/단위"(second|minute|hour|day), JWT sub 또는 IP별
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_UPLOAD: str = "20/minute"  # 파일 업로드 (공고 이미지, 지원서 첨부, 프로필 이미지)
+    RATE_LIMIT_OAUTH_CALLBACK: str = "30/minute"  # 소셜 로그인 콜백, 회원가입
+    RATE_LIMIT_SEARCH: str = "120/minute"  # 검색어가 있는 공고 목록 조회
+    RATE_LIMIT_PING: str = "100/minute"
+    RATE_LIMIT_HEALTH: str = "50/minute"
+    RATE_LIMIT_LOCAL_MAX_KEYS: int = 10000  # 워커별로 보관하는 클라이언트 버킷 수
+    
+    # 응답 압축 (services/compression.py) - br은 brotli, zstd는 zstandard 패키지가 설치된 경우에만 사용
+    COMPRESSION_ENCODINGS: str = "zstd,br,gzip"  # 사용할 인코딩 (선호 순서, 비우면 압축 안 함)
+    COMPRESSION_MIN_SIZE: int = 1024  # 이보다 작은 응답 본문은 압축하지 않음 (바이트)
+    COMPRESSION_CONTENT_TYPES: str = "application/json,application/x-ndjson,text/csv,text/plain,text/html"
+    COMPRESSION_GZIP_LEVEL: int = 5  # 1(빠름)~9(작음)
+    COMPRESSION_BROTLI_QUALITY: int = 4  # 0(빠름)~11(작음)
+    COMPRESSION_ZSTD_LEVEL: int = 3  # 1(빠름)~19(작음)
+    
+    # 동시 조회 합치기 (services/single_flight.py) - 같은 조건의 동시 조회는 한 번만 실행해 결과 공유
+    SINGLE_FLIGHT_ENABLED: bool = True
+    
+    # 블로킹 작업 오프로드 스레드 풀 (services/offload.py) - 풀별 동시 실행 한도
+    OFFLOAD_DB_THREADS: int = 15  # 동기 Session 작업 (DB_POOL_SIZE + DB_MAX_OVERFLOW 이하 권장, 초과분은 커넥션 대기)
+    OFFLOAD_GCS_THREADS: int = 8  # GCS 파일 업로드
+    OFFLOAD_REDIS_THREADS: int = 8  # async 경로의 동기 Redis 호출 (속도 제한 토큰 임대, 인증 사용자 캐시, read-your-writes 기록)
+    
+    # 내부 메트릭 엔드포인트 (/internal/metrics, /metrics) 접근 토큰 - 설정 시 X-Metrics-Token 헤더 필요
+    METRICS_TOKEN: Optional[str] = None
+    METRICS_PUBLIC: bool = False  # 토큰 없이 공개 (내부망/로컬 전용), 토큰도 없고 false면 404
+    
+    # 요청별 SQL 쿼리 계측 (services/query_stats.py)
+    QUERY_STATS_HEADERS: bool = False  # Server-Timing / X-DB-Query-Count 응답 헤더
+    QUERY_COUNT_WARN_THRESHOLD: int = 30  # 요청당 쿼리 수가 이 이상이면 경고 로그
+    QUERY_REPEAT_WARN_THRESHOLD: int = 5  # 같은 SQL문을 이 횟수 이상 실행하면 경고 로그 (N+1 의심)
+    QUERY_BUDGET_ENFORCE: bool = False  # @query_budget 초과 시 500 응답 (테스트/CI용)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
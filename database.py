@@ -1,13 +1,85 @@
 from sqlalchemy import create_engine, Column, Integer, String, Text, Boolean, DateTime, func, ForeignKey, UniqueConstraint, Index, Date
+from sqlalchemy.engine import make_url, URL
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from config import settings
+from services import db_pool, offload, query_stats, read_replicas
 from sqlalchemy.dialects.postgresql import JSONB
 
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL, pool_pre_ping=True)
+
+def to_async_database_url(database_url: str) -> URL:
+    """
+    동기(psycopg2) 연결 문자열을 asyncpg 연결 문자열로 변환
+    
+    Args:
+        database_url: DATABASE_URL (postgres://, postgresql://, postgresql+psycopg2:// 등)
+        
+    Returns:
+        URL: postgresql+asyncpg 드라이버 URL
+    
+    Note:
+        - libpq 전용 쿼리 파라미터 보정: sslmode -> ssl, channel_binding 제거 (asyncpg 미지원)
+    """
+    url = make_url(database_url.replace("postgres://", "postgresql://", 1))
+    query = dict(url.query)
+    if "sslmode" in query:
+        query["ssl"] = query.pop("sslmode")
+    query.pop("channel_binding", None)
+    return url.set(drivername="postgresql+asyncpg", query=query)
+
+
+def _pool_options(name: str) -> dict:
+    # 커넥션 풀 설정 (settings.DB_POOL_*), pool_logging_name은 풀 메트릭 라벨
+    return dict(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_use_lifo=settings.DB_POOL_USE_LIFO,
+        pool_logging_name=name,
+    )
+
+
+engine = create_engine(SQLALCHEMY_DATABASE_URL, poolclass=db_pool.InstrumentedQueuePool, **_pool_options("sync"))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# 비동기 엔진 (asyncpg) - async 라우터는 get_async_db 사용
+# 커밋 후에도 로드된 속성을 유지하여 응답 구성 시 추가 조회(지연 로딩)가 일어나지 않도록 expire_on_commit=False
+async_engine = create_async_engine(
+    to_async_database_url(SQLALCHEMY_DATABASE_URL),
+    poolclass=db_pool.InstrumentedAsyncAdaptedQueuePool,
+    **_pool_options("async"),
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+db_pool.instrument(engine, "sync")
+db_pool.instrument(async_engine.sync_engine, "async")
+
+# 요청별 쿼리 수/DB 시간 계측 (QueryStatsMiddleware)
+query_stats.install()
+
+# 읽기 복제본 (DATABASE_READ_URLS) - 공개 조회 API는 get_read_db / get_async_read_db 사용
+# 엔진은 연결을 실제로 사용할 때 맺으므로, 쓰지 않는 쪽(동기/비동기) 풀은 비용이 없음
+for _index, _read_url in enumerate(u.strip() for u in (settings.DATABASE_READ_URLS or "").split(",") if u.strip()):
+    _name = f"replica{_index + 1}"
+    _read_engine = create_engine(_read_url, poolclass=db_pool.InstrumentedQueuePool, **_pool_options(_name))
+    _read_async_engine = create_async_engine(
+        to_async_database_url(_read_url),
+        poolclass=db_pool.InstrumentedAsyncAdaptedQueuePool,
+        **_pool_options(f"{_name}_async"),
+    )
+    db_pool.instrument(_read_engine, _name)
+    db_pool.instrument(_read_async_engine.sync_engine, f"{_name}_async")
+    read_replicas.add_replica(
+        _name,
+        sessionmaker(autocommit=False, autoflush=False, bind=_read_engine, info={"read_replica": _name}),
+        async_sessionmaker(_read_async_engine, autoflush=False, expire_on_commit=False, info={"read_replica": _name}),
+    )
+
 Base = declarative_base()
 
 class Post(Base):
@@ -67,6 +139,7 @@ class Application(Base):
     __table_args__ = (
         UniqueConstraint('user_id', 'post_id', name='unique_user_post'),
         Index('idx_applications_post_status', 'post_id', 'status'),
+        Index('idx_applications_post_created', 'post_id', 'created_at', 'id'),  # 지원자 목록 키셋 페이지네이션
         Index('idx_applications_user_created', 'user_id', 'created_at'),
     )
 
@@ -125,6 +198,8 @@ class User(Base):
 
     created_at = Column(DateTime, server_default=func.now(), index=True)  # 인덱스 추가
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    # 사용자 정보를 변경하는 트랜잭션마다 1 증가 (services/user_cache.bump_version, 클레임 토큰/캐시 최신성 확인용)
+    version = Column(Integer, nullable=False, default=0, server_default="0")
 
     # 프로필 관련 컬럼들 (직접 프로필에서 관리하는 요소들)
     avatar_url = Column(String(500))     # 프로필 사진 URL
@@ -161,11 +236,86 @@ class Notice(Base):
 
 
 # DB 세션 의존성
-from typing import Generator
+import logging
+from typing import Generator, AsyncGenerator
+from starlette.requests import Request
 
 def get_db() -> Generator:
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close() 
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """비동기 DB 세션 의존성 (이벤트 루프를 막지 않음, 같은 요청의 의존성끼리 세션 공유)"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def _request_client_key(request: Request):
+    return read_replicas.client_key(request.headers.get("authorization"))
+
+
+def _read_route(key):
+    # (사용할 복제본 또는 None, read-your-writes 고정 여부)
+    if read_replicas.is_sticky(key):
+        return None, True
+    return read_replicas.choose_replica(key), False
+
+
+def get_read_db(request: Request) -> Generator:
+    """
+    조회 전용 DB 세션 의존성 (읽기 복제본 우선)
+    
+    Note:
+        - 복제본이 없거나, 모두 지연/장애 상태이거나, 직전에 쓰기를 한 클라이언트면 primary 세션
+        - 직전에 쓰기를 한 클라이언트의 세션은 info["read_your_writes"]=True (동시 조회 합치기 제외)
+        - 쓰기에 사용하지 말 것
+    """
+    replica, sticky = _read_route(_request_client_key(request))
+    db = None
+    if replica:
+        db = replica.session_factory()
+        if read_replicas.needs_lag_check(replica):
+            try:
+                lag = db.execute(read_replicas.REPLICA_LAG_SQL).scalar()
+            except Exception as e:
+                logging.warning(f"읽기 복제본 지연 확인 실패({replica.name}): {e}")
+                lag = None
+            if not read_replicas.record_lag(replica, lag):
+                db.close()
+                db = None
+    if db is None:
+        db = SessionLocal(info={"read_your_writes": sticky})
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """조회 전용 비동기 DB 세션 의존성 (get_read_db와 같은 라우팅 규칙)"""
+    key = _request_client_key(request)
+    if read_replicas.sticky_check_uses_redis(key):
+        # read-your-writes 확인(Redis)이 이벤트 루프를 막지 않도록
+        replica, sticky = await offload.run_blocking(_read_route, key, pool="redis")
+    else:
+        replica, sticky = _read_route(key)
+    db = None
+    if replica:
+        db = replica.async_session_factory()
+        if read_replicas.needs_lag_check(replica):
+            try:
+                lag = (await db.execute(read_replicas.REPLICA_LAG_SQL)).scalar()
+            except Exception as e:
+                logging.warning(f"읽기 복제본 지연 확인 실패({replica.name}): {e}")
+                lag = None
+            if not read_replicas.record_lag(replica, lag):
+                await db.close()
+                db = None
+    if db is None:
+        db = AsyncSessionLocal(info={"read_your_writes": sticky})
+    async with db:
+        yield db
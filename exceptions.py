@@ -37,3 +37,8 @@ class InternalServerError(JOBAException):
     """내부 서버 오류 (500)"""
     def __init__(self, message: str):
         super().__init__(message, 500)
+
+class ServiceUnavailableError(JOBAException):
+    """외부 서비스 일시 사용 불가 (503)"""
+    def __init__(self, message: str):
+        super().__init__(message, 503)
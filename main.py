@@ -1,22 +1,21 @@
-from fastapi import FastAPI, Request
+from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
 from routers import logs as logs_router
 from routers import posts, applications, post_questions, auth, profiles, mypage, notices
-from database import Base, engine
+from routers import metrics as metrics_router
+from database import engine, async_engine
+from config import settings
 from datetime import datetime
 from fastapi import APIRouter
 from exceptions import JOBAException
 from services.logging_stream import ensure_queue_handler, ensure_redis_handler
-
-# 데이터베이스 스키마 업데이트
-Base.metadata.create_all(bind=engine)
-
-# Rate Limiter 설정
-limiter = Limiter(key_func=get_remote_address)
+from services import oauth_http
+from services.read_replicas import ReadYourWritesMiddleware
+from services.query_stats import QueryStatsMiddleware
+from services.http_metrics import RequestMetricsMiddleware
+from services.compression import CompressionMiddleware
+from services.rate_limit import rate_limit
 
 app = FastAPI(
     title="JOBA Backend API",
@@ -24,10 +23,6 @@ app = FastAPI(
     version="1.0.0"
 )
 
-# Rate Limiter를 앱에 추가
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
-
 # JOBA 예외 핸들러 추가
 @app.exception_handler(JOBAException)
 async def joba_exception_handler(request: Request, exc: JOBAException):
@@ -58,6 +53,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 쓰기 직후 같은 클라이언트의 조회는 primary에서 (읽기 복제본 사용 시)
+app.add_middleware(ReadYourWritesMiddleware)
+
+# 요청별 SQL 쿼리 수/DB 시간 집계 (N+1 탐지, 쿼리 예산)
+app.add_middleware(QueryStatsMiddleware)
+
+# JSON/CSV 등 응답 압축 (SSE, 이미 압축된 형식, 작은 응답 제외)
+app.add_middleware(CompressionMiddleware)
+
+# 라우트별 요청 처리 시간, 처리 중 요청 수 (/metrics) - 압축 시간 포함
+app.add_middleware(RequestMetricsMiddleware)
+
 # API 버전 관리 - v1 네임스페이스
 # v1 API 라우터
 v1_router = APIRouter(prefix="/v1")
@@ -76,181 +83,56 @@ v1_router.include_router(logs_router.router, tags=["logs"])
 # 메인 앱에 v1 라우터 포함
 app.include_router(v1_router)
 
+# 내부 메트릭 (버전 네임스페이스 밖, 문서 미노출)
+app.include_router(metrics_router.router, tags=["metrics"], include_in_schema=False)
+app.include_router(metrics_router.prometheus_router, tags=["metrics"], include_in_schema=False)
+
 @app.on_event("startup")
 def on_startup():
+    # Ensure log handlers
     try:
-        # Ensure log handlers
-        try:
-            ensure_redis_handler()
-        except Exception:
-            pass
+        ensure_redis_handler()
+    except Exception:
+        pass
+    try:
+        ensure_queue_handler()
+    except Exception:
+        pass
+
+    # 스키마 마이그레이션은 배포 시 `python update_db.py`로 한 번 실행 (워커 기동 시 스키마 조회 없음)
+    if settings.RUN_MIGRATIONS_ON_STARTUP:
+        from services.migrations import run_migrations
         try:
-            ensure_queue_handler()
-        except Exception:
-            pass
+            applied = run_migrations(engine)
+            print(f"✅ 데이터베이스 마이그레이션 완료 ({len(applied)}건 적용)")
+        except Exception as e:
+            print(f"❌ 데이터베이스 마이그레이션 실패: {e}")
+            # 에러가 발생해도 서버는 계속 실행
+
+@app.on_event("startup")
+async def start_oauth_http_clients():
+    # 소셜 로그인 제공자별 커넥션 풀 생성 (keep-alive, HTTP/2)
+    await oauth_http.startup()
 
-        print("데이터베이스 스키마 업데이트 시작...")
-        Base.metadata.create_all(bind=engine)
-        print("✅ 데이터베이스 스키마 업데이트 완료")
-        
-        # user_id 컬럼이 없으면 추가 (PostgreSQL)
-        from sqlalchemy import text
-        with engine.connect() as conn:
-            # users 테이블에 user_id 컬럼이 있는지 확인
-            result = conn.execute(text("""
-                SELECT column_name 
-                FROM information_schema.columns 
-                WHERE table_name = 'users' AND column_name = 'user_id'
-            """))
-            
-            if not result.fetchone():
-                print("user_id 컬럼이 없습니다. 추가 중...")
-                conn.execute(text("""
-                    ALTER TABLE users 
-                    ADD COLUMN user_id VARCHAR(100) UNIQUE
-                """))
-                conn.commit()
-                print("✅ user_id 컬럼 추가 완료")
-            else:
-                print("✅ user_id 컬럼이 이미 존재합니다")
 
-            # posts.image_url 길이 확장 (255 -> 500)
-            try:
-                result = conn.execute(text("""
-                    SELECT character_maximum_length
-                    FROM information_schema.columns
-                    WHERE table_name = 'posts' AND column_name = 'image_url'
-                """))
-                length_row = result.fetchone()
-                current_len = length_row[0] if length_row else None
-                if current_len is not None and current_len < 500:
-                    print("posts.image_url 컬럼 길이 확장 중 (255 -> 500)...")
-                    conn.execute(text("""
-                        ALTER TABLE posts
-                        ALTER COLUMN image_url TYPE VARCHAR(500)
-                    """))
-                    conn.commit()
-                    print("✅ posts.image_url 컬럼 길이 확장 완료")
-                else:
-                    print("✅ posts.image_url 컬럼 길이 적절함")
-            except Exception as e:
-                print(f"⚠️ posts.image_url 컬럼 길이 점검/확장 중 경고: {e}")
+@app.on_event("shutdown")
+async def stop_oauth_http_clients():
+    await oauth_http.shutdown()
 
-            # posts.user_id 타입을 VARCHAR(100)으로 강제 (정수형 → 문자열로 전환)
-            try:
-                result = conn.execute(text("""
-                    SELECT data_type
-                    FROM information_schema.columns
-                    WHERE table_name = 'posts' AND column_name = 'user_id'
-                """))
-                row = result.fetchone()
-                current_type = row[0] if row else None
-                if current_type and current_type != 'character varying':
-                    print(f"posts.user_id 컬럼 타입 변경 중 ({current_type} -> VARCHAR(100))...")
-                    conn.execute(text("""
-                        ALTER TABLE posts
-                        ALTER COLUMN user_id TYPE VARCHAR(100) USING user_id::text
-                    """))
-                    conn.commit()
-                    print("✅ posts.user_id 컬럼 타입 변경 완료")
-                else:
-                    print("✅ posts.user_id 컬럼 타입 적절함")
-            except Exception as e:
-                print(f"⚠️ posts.user_id 컬럼 타입 점검/변경 중 경고: {e}")
 
-            # posts.deadline 타입을 TIMESTAMP WITHOUT TIME ZONE으로 전환 (과거 DATE였던 스키마 호환)
-            try:
-                result = conn.execute(text("""
-                    SELECT data_type
-                    FROM information_schema.columns
-                    WHERE table_name = 'posts' AND column_name = 'deadline'
-                """))
-                row = result.fetchone()
-                current_type = row[0] if row else None
-                if current_type and current_type != 'timestamp without time zone':
-                    print(f"posts.deadline 컬럼 타입 변경 중 ({current_type} -> TIMESTAMP WITHOUT TIME ZONE)...")
-                    conn.execute(text("""
-                        ALTER TABLE posts
-                        ALTER COLUMN deadline TYPE TIMESTAMP WITHOUT TIME ZONE USING deadline::timestamp
-                    """))
-                    conn.commit()
-                    print("✅ posts.deadline 컬럼 타입 변경 완료")
-                else:
-                    print("✅ posts.deadline 컬럼 타입 적절함")
-            except Exception as e:
-                print(f"⚠️ posts.deadline 컬럼 타입 점검/변경 중 경고: {e}")
-            
-            # posts.views 컬럼 NOT NULL + 기본값 0 보정
-            try:
-                result = conn.execute(text("""
-                    SELECT is_nullable, column_default
-                    FROM information_schema.columns
-                    WHERE table_name = 'posts' AND column_name = 'views'
-                """))
-                row = result.fetchone()
-                if not row:
-                    print("posts.views 컬럼이 없습니다. 추가 중...")
-                    conn.execute(text("""
-                        ALTER TABLE posts
-                        ADD COLUMN views INTEGER NOT NULL DEFAULT 0
-                    """))
-                    conn.commit()
-                    print("✅ posts.views 컬럼 추가(기본값 0, NOT NULL) 완료")
-                else:
-                    is_nullable, column_default = row
-                    # NULL 존재 시 0으로 채우기
-                    conn.execute(text("UPDATE posts SET views = 0 WHERE views IS NULL"))
-                    # 기본값과 NOT NULL 강제
-                    if is_nullable == 'YES' or not column_default:
-                        print("posts.views 제약 보정 중 (NOT NULL + DEFAULT 0)...")
-                        conn.execute(text("""
-                            ALTER TABLE posts
-                            ALTER COLUMN views SET DEFAULT 0,
-                            ALTER COLUMN views SET NOT NULL
-                        """))
-                        conn.commit()
-                        print("✅ posts.views 제약 보정 완료")
-                    else:
-                        print("✅ posts.views 제약 적절함")
-            except Exception as e:
-                print(f"⚠️ posts.views 컬럼 보정 중 경고: {e}")
-            
-            # users.email NULL 허용으로 보정 (기존 NOT NULL 스키마 호환)
-            try:
-                result = conn.execute(text("""
-                    SELECT is_nullable
-                    FROM information_schema.columns
-                    WHERE table_name = 'users' AND column_name = 'email'
-                """))
-                row = result.fetchone()
-                if row and row[0] == 'NO':
-                    print("users.email 컬럼 NULL 허용으로 변경 중 (SET NULLABLE)...")
-                    # PostgreSQL에서 NULL 허용으로 변경
-                    conn.execute(text("""
-                        ALTER TABLE users
-                        ALTER COLUMN email DROP NOT NULL
-                    """))
-                    conn.commit()
-                    print("✅ users.email 컬럼 NULL 허용 변경 완료")
-                else:
-                    print("✅ users.email 컬럼 NULL 허용 상태 또는 존재하지 않음")
-            except Exception as e:
-                print(f"⚠️ users.email NULL 허용 보정 중 경고: {e}")
-                
-    except Exception as e:
-        print(f"❌ 데이터베이스 스키마 업데이트 실패: {e}")
-        # 에러가 발생해도 서버는 계속 실행
+@app.on_event("shutdown")
+async def dispose_async_engine():
+    # asyncpg 커넥션 풀 정리
+    await async_engine.dispose()
 
 # 서버 슬립 방지를 위한 핑 엔드포인트
-@app.get("/ping")
-@app.head("/ping")
-@limiter.limit("100/minute")
+@app.get("/ping", dependencies=[Depends(rate_limit("ping"))])
+@app.head("/ping", dependencies=[Depends(rate_limit("ping"))])
 def ping(request: Request):
     return {"message": "pong"}
 
 # 헬스체크 엔드포인트
-@app.get("/health")
-@app.head("/health")
-@limiter.limit("50/minute")
+@app.get("/health", dependencies=[Depends(rate_limit("health"))])
+@app.head("/health", dependencies=[Depends(rate_limit("health"))])
 def health_check(request: Request):
     return {"status": "healthy", "version": "1.0.0"}
\ No newline at end of file
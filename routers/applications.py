@@ -6,32 +6,57 @@
 """
 
 from fastapi import APIRouter, Depends, File, UploadFile, HTTPException, status, Form, Query
-from sqlalchemy.orm import Session
-from database import get_db, Application, Post, PostQuestion, ApplicationAnswer, User, ApplicationStatusLog
+from fastapi import status as status_module
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import aliased
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import get_async_db, SessionLocal, Application, Post, PostQuestion, ApplicationAnswer, User, ApplicationStatusLog
 from schemas import (
     ApplicationCreate, ApplicationResponse, ApplicationAnswerCreate,
-    ApplicationListItem, ApplicationListResponse, ApplicationDetailResponse,
-    ApplicationStatusUpdate, ApplicationStatusResponse, ApplicationSortEnum, ApplicationStatusEnum, MyApplicationListResponse
+    ApplicationListResponse, ApplicationDetailResponse,
+    ApplicationStatusUpdate, ApplicationStatusResponse, ApplicationSortEnum, ApplicationStatusEnum, MyApplicationListResponse,
+    ApplicationBulkStatusUpdate, ApplicationBulkStatusResponse, ApplicationExportFormatEnum
 )
 from services.file_upload_service import FileUploadService
-from routers.auth import get_current_user
+from routers.auth import get_current_user, get_current_claims, AccessClaims
 from services.user_service import get_user_id_from_user
+from services import fast_json, offload, question_cache
+from services.redis_client import get_redis
+from services.query_stats import query_budget
+from services.rate_limit import rate_limit
 import logging
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Tuple
 import json
+import base64
+import csv
+import io
+from itertools import groupby
 from config import settings
-from sqlalchemy import func
+from sqlalchemy import func, update, insert, case, any_, literal, literal_column, Integer, JSON, select, and_, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
 
 router = APIRouter()
 
+# 지원자 내보내기 시 서버 사이드 커서에서 한 번에 가져오는 행 수
+EXPORT_BATCH_SIZE = 500
 
-@router.post("/applications", response_model=ApplicationResponse, status_code=201)
+# 지원서 상세 일괄 조회 시 한 번에 요청할 수 있는 최대 지원서 수
+MAX_BATCH_DETAIL_IDS = 50
+
+
+def _load_post_questions(post_id: int) -> list:
+    """공고 질문 캐시 조회 (오프로드 스레드에서 동기 세션으로 실행)"""
+    with SessionLocal() as session:
+        return question_cache.get_post_questions(session, post_id)
+
+
+@router.post("/applications", response_model=ApplicationResponse, status_code=201, dependencies=[Depends(rate_limit("upload"))])
 async def create_application(
     application_data: str = Form(..., description="지원서 데이터(JSON 문자열) - key: application_data"),
     portfolio_files: Optional[List[UploadFile]] = File(None, description="첨부파일 타입 질문에 대한 파일들"),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     공고 지원 - 커스터마이징된 질문에 대한 답변 제출
@@ -58,6 +83,7 @@ async def create_application(
         - 모든 필수 질문에 답변 필요
         - ATTACHMENT 타입 질문은 파일 업로드 필수
         - 파일 크기 제한: 1GB (settings.MAX_FILE_SIZE_BYTES)
+        - 질문 검증은 공고 질문 캐시(question_cache)를 사용하여 추가 DB 조회 없음
     """
     try:
         # 0. application_data(JSON 문자열) 파싱
@@ -68,7 +94,7 @@ async def create_application(
             raise HTTPException(status_code=400, detail="application_data 형식이 올바르지 않습니다.")
 
         # 1. 공고 존재 여부 확인
-        post = db.query(Post).filter(Post.id == application_obj.post_id).first()
+        post = (await db.execute(select(Post.id).where(Post.id == application_obj.post_id))).first()
         if not post:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, 
@@ -76,10 +102,12 @@ async def create_application(
             )
         
         # 2. 중복 지원 확인 (같은 사용자가 같은 공고에 중복 지원 방지)
-        existing_application = db.query(Application).filter(
-            Application.user_id == get_user_id_from_user(current_user),
-            Application.post_id == application_obj.post_id
-        ).first()
+        existing_application = (await db.execute(
+            select(Application.id).where(
+                Application.user_id == get_user_id_from_user(current_user),
+                Application.post_id == application_obj.post_id
+            )
+        )).first()
         
         if existing_application:
             raise HTTPException(
@@ -87,10 +115,13 @@ async def create_application(
                 detail="이미 지원한 공고입니다."
             )
         
-        # 3. 공고의 커스텀 질문들 조회
-        post_questions = db.query(PostQuestion).filter(
-            PostQuestion.post_id == application_obj.post_id
-        ).all()
+        # 3. 공고의 커스텀 질문들 조회 (공고 질문 캐시)
+        if get_redis() is None:
+            post_questions = await db.run_sync(question_cache.get_post_questions, application_obj.post_id)
+        else:
+            # 질문 캐시의 동기 Redis 호출이 이벤트 루프를 막지 않도록 오프로드 스레드의 동기 세션으로 조회
+            post_questions = await offload.run_blocking(_load_post_questions, application_obj.post_id)
+        questions_by_id = {q["id"]: q for q in post_questions}
         
         if not post_questions:
             raise HTTPException(
@@ -99,13 +130,13 @@ async def create_application(
             )
         
         # 4. 필수 질문 답변 검증 (모든 필수 질문에 답변이 있는지 확인)
-        required_questions = [q for q in post_questions if q.is_required]
+        required_questions = [q for q in post_questions if q["is_required"]]
         answered_question_ids = [answer.post_question_id for answer in application_obj.answers]
         
         missing_required_questions = []
         for question in required_questions:
-            if question.id not in answered_question_ids:
-                missing_required_questions.append(question.question_content)
+            if question["id"] not in answered_question_ids:
+                missing_required_questions.append(question["question_content"])
         
         if missing_required_questions:
             raise HTTPException(
@@ -114,10 +145,9 @@ async def create_application(
             )
         
         # 5. 답변의 질문 ID 유효성 검증 (실제 존재하는 질문인지 확인)
-        valid_question_ids = [q.id for q in post_questions]
         invalid_answers = []
         for answer in application_obj.answers:
-            if answer.post_question_id not in valid_question_ids:
+            if answer.post_question_id not in questions_by_id:
                 invalid_answers.append(answer.post_question_id)
         
         if invalid_answers:
@@ -149,15 +179,14 @@ async def create_application(
         )
         
         db.add(application)
-        db.commit()
-        db.refresh(application)
+        await db.flush()  # application.id, created_at (RETURNING)
         
         # 8. 답변들 저장 (질문 타입에 따라 처리)
         for answer_data in application_obj.answers:
             # ATTACHMENT 타입 질문의 경우 파일 URL로 대체
-            question = db.query(PostQuestion).filter(PostQuestion.id == answer_data.post_question_id).first()
+            question = questions_by_id[answer_data.post_question_id]
             
-            if question.question_type == "ATTACHMENT":
+            if question["question_type"] == "ATTACHMENT":
                 # 파일명을 기반으로 업로드된 파일 URL 찾기
                 file_url = None
                 for filename, url in file_upload_results.items():
@@ -183,7 +212,8 @@ async def create_application(
             )
             db.add(answer)
         
-        db.commit()
+        # 지원서와 답변을 한 트랜잭션으로 저장 (답변 검증 실패 시 지원서만 남지 않음)
+        await db.commit()
         
         return ApplicationResponse(
             id=application.id,
@@ -197,7 +227,7 @@ async def create_application(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logging.error(f"지원서 저장 실패: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
@@ -205,11 +235,103 @@ async def create_application(
         )
 
 
+@router.get("/applications/detail", response_model=List[ApplicationDetailResponse])
+async def get_application_details(
+    ids: str = Query(..., description="조회할 지원서 ID 목록 (쉼표 구분, 최대 50개, 예: 1,2,3)"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    지원서 상세 일괄 조회 (여러 지원자를 나란히 검토할 때 사용)
+    
+    **JWT 인증 필요** - 지원자 본인 또는 공고 작성자만 접근 가능
+    
+    Args:
+        ids: 조회할 지원서 ID 목록 (쉼표 구분, 최대 MAX_BATCH_DETAIL_IDS개)
+        current_user: 현재 인증된 사용자
+        db: 데이터베이스 세션
+        
+    Returns:
+        List[ApplicationDetailResponse]: 요청한 순서대로 정렬된 지원서 상세 정보 목록
+        
+    Raises:
+        HTTPException: 
+            - 400: ids 형식 오류 또는 개수 초과
+            - 404: 지원서 또는 연결된 공고를 찾을 수 없음 (하나라도 없으면)
+            - 403: 권한 없음 (하나라도 조회 권한이 없으면)
+    
+    Note:
+        - 단일 상세 조회와 같은 쿼리를 id IN (...)으로 한 번만 실행
+        - 모집자가 조회한 지원서의 감사 로그는 다중 행 INSERT 한 번으로 기록
+        - /applications/{application_id}보다 먼저 등록되어야 "detail"이 ID로 해석되지 않음
+    """
+    # 1. ids 파싱 (중복 제거, 요청 순서 유지)
+    try:
+        application_ids = list(dict.fromkeys(int(value) for value in ids.split(",") if value.strip()))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="ids는 쉼표로 구분된 지원서 ID 목록이어야 합니다."
+        )
+    if not application_ids or len(application_ids) > MAX_BATCH_DETAIL_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"지원서 ID는 1개 이상 {MAX_BATCH_DETAIL_IDS}개 이하로 요청해주세요."
+        )
+    
+    # 2. 단일 쿼리로 조회
+    rows = (await db.execute(_application_detail_query().where(Application.id.in_(application_ids)))).all()
+    rows_by_id = {row[0].id: row for row in rows}
+    
+    missing_ids = [application_id for application_id in application_ids if application_id not in rows_by_id]
+    if missing_ids or any(row[1] is None for row in rows):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"지원서를 찾을 수 없습니다: {missing_ids}" if missing_ids else "연결된 공고를 찾을 수 없습니다."
+        )
+    
+    # 3. 권한 검증 - 모든 지원서에 대해 지원자 본인이거나 공고 작성자여야 함
+    current_user_id = get_user_id_from_user(current_user)
+    forbidden_ids = [
+        application.id for application, post_owner_id, _, _ in rows
+        if application.user_id != current_user_id and post_owner_id != current_user_id
+    ]
+    if forbidden_ids:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"이 지원서를 조회할 권한이 없습니다: {sorted(forbidden_ids)}"
+        )
+    
+    # 응답은 커밋 전에 구성 (커밋 후 만료된 속성을 다시 조회하지 않도록)
+    details = [
+        _build_application_detail(rows_by_id[application_id][0], rows_by_id[application_id][2], rows_by_id[application_id][3])
+        for application_id in application_ids
+    ]
+    
+    # 4. 모집자가 조회한 지원서 감사 로그 기록 (다중 행 INSERT 한 번)
+    audit_logs = [
+        {
+            "application_id": application.id,
+            "previous_status": application.status,
+            "new_status": application.status,
+            "changed_by_user_id": current_user.id,
+            "change_reason": "상세 조회",
+        }
+        for application, post_owner_id, _, _ in rows
+        if post_owner_id == current_user_id
+    ]
+    if audit_logs:
+        await db.execute(insert(ApplicationStatusLog), audit_logs)
+        await db.commit()
+    
+    return details
+
+
 @router.get("/applications/{application_id}", response_model=ApplicationResponse)
 async def get_application(
     application_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AccessClaims = Depends(get_current_claims),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     지원서 상세 조회 (본인의 지원서만 조회 가능)
@@ -218,7 +340,7 @@ async def get_application(
     
     Args:
         application_id: 조회할 지원서 ID
-        current_user: 현재 인증된 사용자
+        current_user: 현재 인증된 사용자 (토큰 클레임)
         db: 데이터베이스 세션
         
     Returns:
@@ -232,10 +354,12 @@ async def get_application(
         - 본인의 지원서만 조회 가능 (user_id 기반 필터링)
         - 질문과 답변은 포함되지 않음 (기본 정보만)
     """
-    application = db.query(Application).filter(
-        Application.id == application_id,
-        Application.user_id == get_user_id_from_user(current_user)  # 본인의 지원서만 조회 가능
-    ).first()
+    application = (await db.execute(
+        select(Application).where(
+            Application.id == application_id,
+            Application.user_id == current_user.social_user_id  # 본인의 지원서만 조회 가능
+        )
+    )).scalar_one_or_none()
     
     if not application:
         raise HTTPException(
@@ -251,12 +375,13 @@ async def get_application(
 @router.get("/posts/{post_id}/applications", response_model=ApplicationListResponse)
 async def get_post_applications(
     post_id: int,
-    page: int = Query(1, ge=1, description="페이지 번호"),
+    page: int = Query(1, ge=1, description="페이지 번호 (cursor가 없을 때만 사용)"),
     size: int = Query(20, ge=1, le=100, description="페이지 크기"),
     status: Optional[str] = Query(None, description="상태 필터"),
     sort_by: ApplicationSortEnum = Query(ApplicationSortEnum.CREATED_AT_DESC, description="정렬 기준"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor, 최신순/오래된순에서만 지원)"),
+    current_user: AccessClaims = Depends(get_current_claims),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     특정 공고에 대한 지원자 목록 조회 (모집자만 접근 가능)
@@ -265,89 +390,288 @@ async def get_post_applications(
     
     Args:
         post_id: 공고 ID
-        page: 페이지 번호 (기본값: 1, 최소: 1)
+        page: 페이지 번호 (기본값: 1, 최소: 1, cursor가 있으면 무시)
         size: 페이지 크기 (기본값: 20, 범위: 1~100)
         status: 상태 필터 ("제출됨", "합격", "불합격", "취소됨", 선택사항)
         sort_by: 정렬 기준 (CREATED_AT_DESC, CREATED_AT_ASC, STATUS)
-        current_user: 현재 인증된 사용자
+        cursor: 커서 기반 페이지네이션용 커서 (선택사항)
+        current_user: 현재 인증된 사용자 (토큰 클레임)
         db: 데이터베이스 세션
         
     Returns:
         ApplicationListResponse: 지원자 목록, 총 개수, 페이지네이션 정보
         - User.nickname과 JOIN하여 지원자 닉네임 포함
+        - status_counts: 상태별 지원자 수 (상태 탭마다 별도 호출 불필요)
+        - next_cursor: 다음 페이지 커서 (마지막 페이지이거나 상태순 정렬이면 null)
         
     Raises:
         HTTPException: 
             - 404: 공고를 찾을 수 없음
             - 403: 권한 없음 (공고 작성자가 아님)
+            - 400: 잘못된 커서 또는 상태순 정렬에서 커서 사용
     
     Note:
-        - 공고 작성자만 접근 가능 (post.user_id == get_user_id_from_user(current_user) 검증)
-        - User 테이블과 JOIN하여 지원자 닉네임 포함
+        - 공고 작성자만 접근 가능 (post.user_id == current_user.social_user_id 검증)
+        - 총 개수는 상태별 GROUP BY 한 번(idx_applications_post_status)으로 계산하여 별도 count 스캔 없음
+        - cursor가 있으면 (created_at, id) 키셋 조건으로 조회하여 OFFSET 스캔 없음
+          (idx_applications_post_created 사용)
+        - 응답은 항목별 재검증 없이 바로 직렬화 (fast_json.trusted_response)
     """
     # 1. 공고 존재 여부 및 권한 확인
-    post = db.query(Post).filter(Post.id == post_id).first()
+    post = (await db.execute(select(Post.user_id).where(Post.id == post_id))).first()
     if not post:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
+            status_code=status_module.HTTP_404_NOT_FOUND,
             detail="공고를 찾을 수 없습니다."
         )
     
     # 2. 권한 검증 - 공고 작성자만 접근 가능
-    if post.user_id != get_user_id_from_user(current_user):
+    if post.user_id != current_user.social_user_id:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
+            status_code=status_module.HTTP_403_FORBIDDEN,
             detail="이 공고의 지원자 목록을 조회할 권한이 없습니다."
         )
     
-    # 3. 지원자 목록 조회 (사용자 닉네임과 함께)
-    query = db.query(Application, User.name).join(
+    if cursor and sort_by == ApplicationSortEnum.STATUS:
+        raise HTTPException(
+            status_code=status_module.HTTP_400_BAD_REQUEST,
+            detail="커서 페이지네이션은 최신순/오래된순 정렬에서만 지원합니다."
+        )
+    
+    # 3. 상태별 지원자 수 (총 개수와 상태 탭 개수를 한 번에)
+    status_counts = dict((await db.execute(
+        select(Application.status, func.count(Application.id))
+        .where(Application.post_id == post_id)
+        .group_by(Application.status)
+    )).all())
+    total_count = status_counts.get(status, 0) if status else sum(status_counts.values())
+    
+    # 4. 지원자 목록 조회 (사용자 닉네임과 함께)
+    query = select(Application, User.name).outerjoin(
         User, Application.user_id == User.user_id
-    ).filter(Application.post_id == post_id)
+    ).where(Application.post_id == post_id)
     
     # 상태 필터 적용
     if status:
-        query = query.filter(Application.status == status)
+        query = query.where(Application.status == status)
     
-    # 정렬 적용
-    if sort_by == ApplicationSortEnum.CREATED_AT_DESC:
-        query = query.order_by(Application.created_at.desc())
-    elif sort_by == ApplicationSortEnum.CREATED_AT_ASC:
-        query = query.order_by(Application.created_at.asc())
+    # 정렬 적용 (같은 created_at 내에서 순서가 고정되도록 id를 보조 정렬 키로 사용)
+    if sort_by == ApplicationSortEnum.CREATED_AT_ASC:
+        query = query.order_by(Application.created_at.asc(), Application.id.asc())
     elif sort_by == ApplicationSortEnum.STATUS:
-        query = query.order_by(Application.status.asc(), Application.created_at.desc())
+        query = query.order_by(Application.status.asc(), Application.created_at.desc(), Application.id.desc())
+    else:
+        query = query.order_by(Application.created_at.desc(), Application.id.desc())
     
-    # 전체 개수 조회
-    total_count = query.count()
+    # 페이지네이션 적용 (커서가 있으면 키셋, 없으면 OFFSET) - 다음 페이지 여부 확인을 위해 한 건 더 조회
+    if cursor:
+        cursor_created_at, cursor_id = _decode_application_cursor(cursor)
+        keyset = tuple_(Application.created_at, Application.id)
+        if sort_by == ApplicationSortEnum.CREATED_AT_ASC:
+            query = query.where(keyset > tuple_(cursor_created_at, cursor_id))
+        else:
+            query = query.where(keyset < tuple_(cursor_created_at, cursor_id))
+    else:
+        query = query.offset((page - 1) * size)
+    applications = (await db.execute(query.limit(size + 1))).all()
     
-    # 페이지네이션 적용
-    offset = (page - 1) * size
-    applications = query.offset(offset).limit(size).all()
+    has_next = len(applications) > size
+    applications = applications[:size]
+    next_cursor = None
+    if has_next and sort_by != ApplicationSortEnum.STATUS:
+        last_application = applications[-1][0]
+        next_cursor = _encode_application_cursor(last_application.created_at, last_application.id)
     
     # 응답 데이터 구성
     application_items = []
     for application, nickname in applications:
-        application_items.append(ApplicationListItem(
-            application_id=application.id,
-            user_id=application.user_id,
-            applicant_name=nickname or "알 수 없음",
-            status=application.status,
-            submitted_at=application.created_at
-        ))
-    
-    return ApplicationListResponse(
-        total_count=total_count,
-        applications=application_items,
-        page=page,
-        size=size
+        application_items.append({
+            "application_id": application.id,
+            "user_id": application.user_id,
+            "applicant_name": nickname or "알 수 없음",
+            "status": application.status,
+            "submitted_at": application.created_at
+        })
+    
+    return fast_json.trusted_response(ApplicationListResponse, {
+        "total_count": total_count,
+        "applications": application_items,
+        "page": page,
+        "size": size,
+        "next_cursor": next_cursor,
+        "status_counts": status_counts
+    })
+
+
+def _encode_application_cursor(created_at: datetime, application_id: int) -> str:
+    raw = f"{created_at.isoformat()}|{application_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_application_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, application_id = base64.urlsafe_b64decode(padded.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), int(application_id)
+    except Exception:
+        raise HTTPException(
+            status_code=status_module.HTTP_400_BAD_REQUEST,
+            detail="유효하지 않은 커서입니다."
+        )
+
+
+@router.get("/posts/{post_id}/applications/export")
+async def export_post_applications(
+    post_id: int,
+    export_format: ApplicationExportFormatEnum = Query(ApplicationExportFormatEnum.CSV, alias="format", description="내보내기 형식 (csv 또는 ndjson)"),
+    current_user: AccessClaims = Depends(get_current_claims),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    공고 지원자 전체를 답변과 함께 내보내기 (모집자만 접근 가능)
+    
+    **JWT 인증 필요** - 공고 작성자만 해당 공고의 지원자를 내보낼 수 있음
+    
+    Args:
+        post_id: 공고 ID
+        export_format: 내보내기 형식 (csv: 지원자당 한 행, ndjson: 지원자당 JSON 한 줄)
+        current_user: 현재 인증된 사용자 (토큰 클레임)
+        db: 데이터베이스 세션
+        
+    Returns:
+        StreamingResponse: 지원자 목록 스트림 (첨부파일로 다운로드)
+        - 지원서 ID, user_id, 지원자 닉네임, 상태, 제출 시간, 질문별 답변
+        
+    Raises:
+        HTTPException: 
+            - 404: 공고를 찾을 수 없음
+            - 403: 권한 없음 (공고 작성자가 아님)
+    
+    Note:
+        - 지원자 목록 조회 후 지원서별 상세 조회를 반복하던 N+1 호출을 한 번의 요청으로 대체
+        - applications, users, post_questions, application_answers를 한 쿼리로 JOIN하고
+          서버 사이드 커서(yield_per)로 EXPORT_BATCH_SIZE 행씩 읽어 메모리 사용량이 지원자 수와 무관하게 일정
+        - CSV는 엑셀 한글 호환을 위해 UTF-8 BOM을 포함하며, 질문 순서(질문 ID 순)대로 열을 구성
+    """
+    # 1. 공고 존재 여부 및 권한 확인
+    post = (await db.execute(select(Post.user_id).where(Post.id == post_id))).first()
+    if not post:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="공고를 찾을 수 없습니다."
+        )
+    
+    if post.user_id != current_user.social_user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="이 공고의 지원자 목록을 조회할 권한이 없습니다."
+        )
+    
+    # 2. 질문 목록 (CSV 헤더 및 질문 내용 매핑용)
+    questions = (await db.execute(
+        select(PostQuestion.id, PostQuestion.question_content)
+        .where(PostQuestion.post_id == post_id)
+        .order_by(PostQuestion.id)
+    )).all()
+    
+    if export_format == ApplicationExportFormatEnum.NDJSON:
+        media_type = "application/x-ndjson"
+    else:
+        media_type = "text/csv; charset=utf-8"
+    
+    return StreamingResponse(
+        _iter_application_export(post_id, questions, export_format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="post_{post_id}_applications.{export_format.value}"'}
     )
 
 
+def _iter_application_export(post_id: int, questions: list, export_format: ApplicationExportFormatEnum):
+    """
+    지원자 내보내기 행 생성기
+    
+    StreamingResponse가 스레드풀에서 순회하므로 이벤트 루프를 막지 않으며,
+    응답 스트리밍 동안 유지되어야 하므로 요청 세션 대신 별도 세션을 사용합니다.
+    """
+    question_ids = [question_id for question_id, _ in questions]
+    question_contents = dict(questions)
+    
+    stmt = (
+        select(
+            Application.id, Application.user_id, User.name, Application.status, Application.created_at,
+            PostQuestion.id, ApplicationAnswer.answer_content
+        )
+        .select_from(Application)
+        .outerjoin(User, User.user_id == Application.user_id)
+        .outerjoin(PostQuestion, PostQuestion.post_id == Application.post_id)
+        .outerjoin(
+            ApplicationAnswer,
+            and_(
+                ApplicationAnswer.application_id == Application.id,
+                ApplicationAnswer.post_question_id == PostQuestion.id
+            )
+        )
+        .where(Application.post_id == post_id)
+        .order_by(Application.id, PostQuestion.id)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if export_format == ApplicationExportFormatEnum.CSV:
+        buffer.write("\ufeff")
+        writer.writerow(["지원서ID", "사용자ID", "지원자명", "상태", "제출일시"] + [question_contents[qid] for qid in question_ids])
+    
+    db = SessionLocal()
+    try:
+        rows = db.execute(stmt)
+        pending = 0
+        for application_id, application_rows in groupby(rows, key=lambda row: row[0]):
+            application_rows = list(application_rows)
+            _, user_id, name, application_status, created_at, _, _ = application_rows[0]
+            answers = {row[5]: row[6] for row in application_rows if row[5] is not None}
+            
+            if export_format == ApplicationExportFormatEnum.CSV:
+                writer.writerow(
+                    [application_id, user_id, name or "알 수 없음", application_status, created_at.isoformat()]
+                    + [answers.get(qid) or "" for qid in question_ids]
+                )
+            else:
+                buffer.write(json.dumps({
+                    "application_id": application_id,
+                    "user_id": user_id,
+                    "applicant_name": name or "알 수 없음",
+                    "status": application_status,
+                    "submitted_at": created_at.isoformat(),
+                    "questions": [
+                        {
+                            "question_id": qid,
+                            "question_content": question_contents[qid],
+                            "answer_content": answers.get(qid)
+                        }
+                        for qid in question_ids
+                    ]
+                }, ensure_ascii=False))
+                buffer.write("\n")
+            
+            pending += 1
+            if pending >= EXPORT_BATCH_SIZE:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+                pending = 0
+        
+        if buffer.tell():
+            yield buffer.getvalue()
+    finally:
+        db.close()
+
+
 @router.get("/applications/{application_id}/detail", response_model=ApplicationDetailResponse)
 async def get_application_detail(
     application_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     지원서 상세 조회 (모집자 또는 지원자 본인만 접근 가능)
@@ -372,62 +696,36 @@ async def get_application_detail(
     
     Note:
         - 모집자가 조회 시 감사 로그만 기록 (상태 변경 없음)
-        - PostQuestion과 ApplicationAnswer LEFT JOIN으로 모든 질문 포함
-        - User 테이블과 JOIN하여 지원자 닉네임 포함
+        - 지원서, 공고 작성자, 지원자 닉네임, 질문/답변(json_agg)을 한 번의 쿼리로 조회
+        - 질문은 생성 순서(질문 ID 순)로 정렬
     """
-    # 1. 지원서 존재 여부 확인
-    application = db.query(Application).filter(Application.id == application_id).first()
-    if not application:
+    # 1. 지원서 + 공고 작성자 + 지원자 닉네임 + 질문/답변 조회 (단일 쿼리)
+    row = (await db.execute(_application_detail_query().where(Application.id == application_id))).first()
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="지원서를 찾을 수 없습니다."
         )
-    
-    # 2. 권한 검증
-    post = db.query(Post).filter(Post.id == application.post_id).first()
-    if not post:
+    application, post_owner_id, applicant_name, questions = row
+    if post_owner_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="연결된 공고를 찾을 수 없습니다."
         )
     
-    # 지원자 본인이거나 공고 작성자인 경우만 접근 가능
-    from services.user_service import get_user_id_from_user
+    # 2. 권한 검증 - 지원자 본인이거나 공고 작성자인 경우만 접근 가능
     current_user_id = get_user_id_from_user(current_user)
-    if application.user_id != current_user_id and post.user_id != current_user_id:
+    if application.user_id != current_user_id and post_owner_id != current_user_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="이 지원서를 조회할 권한이 없습니다."
         )
     
-    # 3. 지원자 정보 조회
-    applicant = db.query(User).filter(User.user_id == application.user_id).first()
-    
-    # 4. 질문과 답변 조회 (LEFT JOIN으로 모든 질문과 해당 답변)
-    questions_answers = db.query(
-        PostQuestion, ApplicationAnswer
-    ).outerjoin(
-        ApplicationAnswer, 
-        (PostQuestion.id == ApplicationAnswer.post_question_id) & 
-        (ApplicationAnswer.application_id == application_id)
-    ).filter(
-        PostQuestion.post_id == application.post_id
-    ).all()
-    
-    # 5. 응답 데이터 구성
-    questions = []
-    for question, answer in questions_answers:
-        question_data = {
-            "question_id": question.id,
-            "question_type": question.question_type,
-            "question_content": question.question_content,
-            "answer_content": answer.answer_content if answer else None
-        }
-        questions.append(question_data)
+    # 응답은 커밋 전에 구성 (커밋 후 만료된 속성을 다시 조회하지 않도록)
+    detail = _build_application_detail(application, applicant_name, questions)
     
-    # 6. 모집자가 조회한 경우 감사 로그만 기록 (상태 변경 없음)
-    if post.user_id == current_user_id:
-        # 감사 로그 기록
+    # 3. 모집자가 조회한 경우 감사 로그만 기록 (상태 변경 없음)
+    if post_owner_id == current_user_id:
         status_log = ApplicationStatusLog(
             application_id=application.id,
             previous_status=application.status,
@@ -436,12 +734,60 @@ async def get_application_detail(
             change_reason="상세 조회"
         )
         db.add(status_log)
-        db.commit()
+        await db.commit()
+    
+    return detail
+
+
+def _application_detail_query():
+    """
+    지원서 상세 조회 쿼리 (지원서, 공고 작성자 user_id, 지원자 닉네임, 질문/답변 목록)
     
+    질문/답변은 상관 서브쿼리에서 json_agg로 집계하므로 지원서 한 건당 한 행이 반환됩니다.
+    미답변 질문도 answer_content가 null인 항목으로 포함됩니다.
+    """
+    questions_answers = (
+        select(
+            func.coalesce(
+                func.json_agg(
+                    aggregate_order_by(
+                        func.json_build_object(
+                            "question_id", PostQuestion.id,
+                            "question_type", PostQuestion.question_type,
+                            "question_content", PostQuestion.question_content,
+                            "answer_content", ApplicationAnswer.answer_content,
+                        ),
+                        PostQuestion.id,
+                    )
+                ),
+                literal_column("'[]'::json"),
+                type_=JSON,
+            )
+        )
+        .select_from(PostQuestion)
+        .outerjoin(
+            ApplicationAnswer,
+            and_(
+                ApplicationAnswer.post_question_id == PostQuestion.id,
+                ApplicationAnswer.application_id == Application.id
+            )
+        )
+        .where(PostQuestion.post_id == Application.post_id)
+        .correlate(Application)
+        .scalar_subquery()
+    )
+    return (
+        select(Application, Post.user_id, User.name, questions_answers)
+        .outerjoin(Post, Post.id == Application.post_id)
+        .outerjoin(User, User.user_id == Application.user_id)
+    )
+
+
+def _build_application_detail(application: Application, applicant_name: Optional[str], questions: list) -> ApplicationDetailResponse:
     return ApplicationDetailResponse(
         application_id=application.id,
         user_id=application.user_id,
-        applicant_name=applicant.name or "알 수 없음",
+        applicant_name=applicant_name or "알 수 없음",
         status=application.status,
         submitted_at=application.created_at,
         questions=questions
@@ -453,7 +799,7 @@ async def update_application_status(
     application_id: int,
     status_update: ApplicationStatusUpdate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     지원서 상태 변경 (합격/불합격 결정)
@@ -482,7 +828,7 @@ async def update_application_status(
         - updated_at 자동 갱신 (datetime.utcnow())
     """
     # 1. 지원서 존재 여부 확인
-    application = db.query(Application).filter(Application.id == application_id).first()
+    application = (await db.execute(select(Application).where(Application.id == application_id))).scalar_one_or_none()
     if not application:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -490,7 +836,7 @@ async def update_application_status(
         )
     
     # 2. 권한 검증
-    post = db.query(Post).filter(Post.id == application.post_id).first()
+    post = (await db.execute(select(Post.user_id).where(Post.id == application.post_id))).first()
     if not post:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -523,7 +869,7 @@ async def update_application_status(
         changed_by_user_id=current_user.id
     )
     db.add(status_log)
-    db.commit()
+    await db.commit()
     
     return ApplicationStatusResponse(
         application_id=application.id,
@@ -532,11 +878,124 @@ async def update_application_status(
     )
 
 
+@router.patch("/posts/{post_id}/applications/status", response_model=ApplicationBulkStatusResponse)
+async def bulk_update_application_status(
+    post_id: int,
+    bulk_update: ApplicationBulkStatusUpdate,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    지원서 상태 일괄 변경 (공고 마감 시 합격/불합격 일괄 처리)
+    
+    **JWT 인증 필요** - 공고 작성자만 지원서 상태 변경 가능
+    
+    Args:
+        post_id: 공고 ID
+        bulk_update: 변경할 지원서 ID와 새로운 상태 목록 (ApplicationBulkStatusUpdate)
+        current_user: 현재 인증된 사용자
+        db: 데이터베이스 세션
+        
+    Returns:
+        ApplicationBulkStatusResponse: 일괄 변경 결과
+        - updated: 변경된 지원서 상태 목록
+        - skipped_application_ids: 변경되지 않은 지원서 ID 목록
+        
+    Raises:
+        HTTPException: 
+            - 404: 공고를 찾을 수 없음
+            - 403: 권한 없음 (공고 작성자가 아님)
+    
+    Note:
+        - 권한 검증은 공고 단위로 한 번만 수행
+        - 단일 UPDATE(id = ANY(...))와 단일 다중 행 INSERT(ApplicationStatusLog)를 하나의 트랜잭션으로 처리
+        - 다른 공고의 지원서, 존재하지 않는 지원서, 이미 "합격"/"불합격"인 지원서는 건너뜀
+        - 같은 지원서 ID가 여러 번 포함되면 마지막 항목의 상태를 적용
+    """
+    # 1. 공고 존재 여부 및 권한 확인 (한 번만)
+    post = (await db.execute(select(Post.user_id).where(Post.id == post_id))).first()
+    if not post:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="공고를 찾을 수 없습니다."
+        )
+    
+    if post.user_id != get_user_id_from_user(current_user):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="이 공고의 지원서 상태를 변경할 권한이 없습니다."
+        )
+    
+    new_status_by_id = {item.application_id: item.new_status.value for item in bulk_update.updates}
+    application_ids = list(new_status_by_id)
+    now = datetime.utcnow()
+    
+    # 2. 상태 일괄 변경 - 변경 전 상태는 같은 테이블의 별칭(previous)에서 읽어 RETURNING으로 함께 반환
+    previous = aliased(Application)
+    stmt = (
+        update(Application)
+        .where(
+            Application.id == previous.id,
+            Application.id == any_(literal(application_ids, ARRAY(Integer))),
+            Application.post_id == post_id,
+            Application.status.notin_(["합격", "불합격"]),
+        )
+        .values(
+            status=case(new_status_by_id, value=Application.id),
+            updated_at=now,
+        )
+        .returning(Application.id, previous.status, Application.status, Application.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    
+    try:
+        changed_rows = (await db.execute(stmt)).all()
+        
+        # 3. 감사 로그 기록 (다중 행 INSERT 한 번)
+        if changed_rows:
+            await db.execute(
+                insert(ApplicationStatusLog),
+                [
+                    {
+                        "application_id": application_id,
+                        "previous_status": previous_status,
+                        "new_status": new_status,
+                        "changed_by_user_id": current_user.id,
+                        "change_reason": "일괄 상태 변경",
+                    }
+                    for application_id, previous_status, new_status, _ in changed_rows
+                ],
+            )
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        logging.error(f"지원서 상태 일괄 변경 실패: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="지원서 상태 일괄 변경에 실패했습니다."
+        )
+    
+    changed_by_id = {row[0]: row for row in changed_rows}
+    return ApplicationBulkStatusResponse(
+        updated=[
+            ApplicationStatusResponse(
+                application_id=application_id,
+                status=changed_by_id[application_id][2],
+                updated_at=changed_by_id[application_id][3]
+            )
+            for application_id in application_ids if application_id in changed_by_id
+        ],
+        skipped_application_ids=[
+            application_id for application_id in application_ids if application_id not in changed_by_id
+        ]
+    )
+
+
 @router.patch("/applications/{application_id}/cancel", response_model=ApplicationStatusResponse)
 async def cancel_application(
     application_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     지원서 취소 (지원자 본인만 가능)
@@ -565,7 +1024,7 @@ async def cancel_application(
         - updated_at 자동 갱신 (datetime.utcnow())
     """
     # 1. 지원서 존재 여부 확인
-    application = db.query(Application).filter(Application.id == application_id).first()
+    application = (await db.execute(select(Application).where(Application.id == application_id))).scalar_one_or_none()
     if not application:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -600,7 +1059,7 @@ async def cancel_application(
         change_reason="지원자 취소"
     )
     db.add(status_log)
-    db.commit()
+    await db.commit()
     
     return ApplicationStatusResponse(
         application_id=application.id,
@@ -610,10 +1069,11 @@ async def cancel_application(
 
 
 @router.get("/my/applications", response_model=MyApplicationListResponse)
+@query_budget(2)  # 사용자 조회(토큰이 최신 클레임이 아닐 때) + 지원 목록
 async def get_my_applications(
     sort: str = Query("latest", description="정렬 기준 (latest 또는 oldest)"),
-    current_user=Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AccessClaims = Depends(get_current_claims),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     내가 지원한 공고 목록 조회
@@ -625,13 +1085,19 @@ async def get_my_applications(
     - 최신순(latest) / 오래된순(oldest) 정렬을 지원합니다.
     - 지원 내역이 없으면 빈 리스트([])를 정상 응답으로 반환합니다.
     """
-    user_id = get_user_id_from_user(current_user)
+    user_id = current_user.social_user_id
 
-    # Application ↔ Post JOIN
+    # 공고별 전체 지원자 수 (상관 서브쿼리)
+    counted = aliased(Application)
+    application_count_column = (
+        select(func.count(counted.id)).where(counted.post_id == Post.id).scalar_subquery()
+    )
+
+    # Application ↔ Post JOIN (지원자 수 포함)
     query = (
-        db.query(Application, Post)
+        select(Application, Post, application_count_column)
         .join(Post, Application.post_id == Post.id)
-        .filter(Application.user_id == user_id)
+        .where(Application.user_id == user_id)
     )
 
     # 정렬 적용
@@ -640,17 +1106,12 @@ async def get_my_applications(
     elif sort == "oldest":
         query = query.order_by(Application.created_at.asc())
 
-    applications = query.all()
+    applications = (await db.execute(query)).all()
 
     result = []
-    for application, post in applications:
+    for application, post, application_count in applications:
         recruitment_status = "마감" if post.deadline < datetime.now() else "모집중"
 
-        # 해당 공고의 전체 지원자 수 계산
-        application_count = db.query(func.count(Application.id)).filter(
-            Application.post_id == post.id
-        ).scalar()
-
         result.append({
             "application_id": application.id,
             "status": application.status,
@@ -668,4 +1129,4 @@ async def get_my_applications(
             }
         })
 
-    return {"applications": result}
\ No newline at end of file
+    return fast_json.trusted_response(MyApplicationListResponse, {"applications": result})
\ No newline at end of file
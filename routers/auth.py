@@ -8,21 +8,88 @@ JWT 토큰 기반의 인증 시스템을 사용합니다.
 from fastapi import APIRouter, Depends, HTTPException, Header, Query, Security
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.responses import RedirectResponse, JSONResponse
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from database import get_db, User
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import get_async_db, SessionLocal, User
 from services import kakao_auth, naver_auth, google_auth
-from services.user_service import get_or_create_minimal
+from services.user_service import get_or_create_minimal, get_user_id_from_user
+from services import offload, user_cache
+from services.rate_limit import rate_limit
 from security import create_access_token, create_signup_token, decode_token
+from config import settings
 from pydantic import BaseModel, HttpUrl, field_validator, EmailStr
+from typing import Optional
 from urllib.parse import urlencode
 import os
 
 router = APIRouter(prefix="/auth")
 
 
-def get_current_user(
+class AccessClaims(BaseModel):
+    """액세스 토큰 클레임 기반 현재 사용자 정보 (get_current_claims)"""
+    id: int  # DB 내부 ID
+    user_id: str  # 토큰의 sub
+    social_user_id: str  # get_user_id_from_user 결과 (권한 검증용)
+    name: Optional[str] = None
+    field: Optional[str] = None
+    is_onboarded: bool = False
+
+    @classmethod
+    def from_user(cls, sub: str, user: User) -> "AccessClaims":
+        return cls(
+            id=user.id,
+            user_id=sub,
+            social_user_id=get_user_id_from_user(user),
+            name=user.name,
+            field=user.field,
+            is_onboarded=bool(user.is_onboarded),
+        )
+
+
+async def issue_access_token(user: User, sub: str) -> str:
+    """
+    로그인/회원가입 완료 사용자에게 액세스 토큰 발급
+    
+    Args:
+        user: 사용자 객체
+        sub: 토큰 sub로 사용할 user_id
+        
+    Returns:
+        str: JWT 액세스 토큰
+    
+    Note:
+        - JWT_EMBED_CLAIMS가 켜져 있으면 uid, sid, name, field, onb, ver 클레임 포함
+        - ver는 발급 시점의 사용자 버전 (users.version, Redis에도 users.id와 함께 반영)
+    """
+    if not settings.JWT_EMBED_CLAIMS:
+        return create_access_token({"sub": sub})
+    await offload.run_redis(user_cache.publish_version, sub, user.id, user.version)
+    return create_access_token({
+        "sub": sub,
+        "uid": user.id,
+        "sid": get_user_id_from_user(user),
+        "name": user.name,
+        "field": user.field,
+        "onb": bool(user.is_onboarded),
+        "ver": user.version or 0,
+    })
+
+
+def _decode_bearer(credentials: Optional[HTTPAuthorizationCredentials]) -> dict:
+    # Swagger UI(/docs)에서도 Bearer 토큰을 설정 가능하도록 HTTPBearer 스키마 사용
+    if not credentials or not credentials.scheme or credentials.scheme.lower() != "bearer":
+        raise HTTPException(401, "Missing or invalid Authorization header")
+
+    payload = decode_token(credentials.credentials)  # exp/만료 검증
+    if not payload:
+        raise HTTPException(401, "Invalid or expired token")
+    return payload
+
+
+async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Security(HTTPBearer(auto_error=False)),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> User:
     """
     JWT 토큰을 검증하여 현재 사용자 정보를 반환
@@ -36,19 +103,71 @@ def get_current_user(
         
     Raises:
         HTTPException: 토큰 없음, 토큰 만료, 사용자 없음
+    
+    Note:
+        - 사용자 조회 결과는 user_cache에 캐싱되며, 적중 시 DB 조회 없이 세션에 연결된 User 반환
+        - 비동기 세션(get_async_db) 사용 - 같은 요청의 핸들러가 get_async_db를 쓰면 세션 공유
+        - Redis 캐시 조회/저장은 offload.run_redis로 이벤트 루프 밖에서 실행
     """
-    # Swagger UI(/docs)에서도 Bearer 토큰을 설정 가능하도록 HTTPBearer 스키마 사용
-    if not credentials or not credentials.scheme or credentials.scheme.lower() != "bearer":
-        raise HTTPException(401, "Missing or invalid Authorization header")
+    payload = _decode_bearer(credentials)
+    return await _load_user(db, payload["sub"])
 
-    token = credentials.credentials
-    payload = decode_token(token)  # exp/만료 검증
+
+async def get_current_claims(
+    credentials: HTTPAuthorizationCredentials = Security(HTTPBearer(auto_error=False)),
+    db: AsyncSession = Depends(get_async_db),
+) -> AccessClaims:
+    """
+    JWT 토큰의 클레임으로 현재 사용자 정보를 반환 (User 행이 필요 없는 조회용)
     
-    if not payload:
-        raise HTTPException(401, "Invalid or expired token")
+    Args:
+        authorization: Authorization 헤더 (Bearer 토큰)
+        db: 데이터베이스 세션 (클레임을 쓸 수 없을 때만 사용)
+        
+    Returns:
+        AccessClaims: 현재 인증된 사용자 클레임
+        
+    Raises:
+        HTTPException: 토큰 없음, 토큰 만료, 사용자 없음
     
-    # payload["sub"]가 user_id (문자열)이므로 User 테이블에서 직접 조회
-    user_id = payload["sub"]
+    Note:
+        - 클레임 모드 토큰이고 (uid, ver)가 현재 사용자 버전(Redis에 반영된 users.id, users.version) 이상이면 DB 조회 없이 반환
+          (탈퇴한 계정의 토큰은 거절되고, 같은 소셜 계정으로 다시 가입한 새 계정의 토큰은 신뢰)
+        - sub만 있는 토큰, 오래된 토큰(사용자 정보 변경 이후 발급 전 토큰),
+          버전 확인 불가(Redis 없음/키 없음/장애) 시에는 get_current_user와 같이 사용자를 조회하여 클레임 구성
+        - 전체 User 행이 필요한 핸들러는 get_current_user 사용
+    """
+    payload = _decode_bearer(credentials)
+    sub = payload["sub"]
+    if "ver" in payload and "uid" in payload and "sid" in payload:
+        current_version = await offload.run_redis(user_cache.get_user_version, sub)
+        if current_version is not None and (payload["uid"], payload["ver"]) >= current_version:
+            return AccessClaims(
+                id=payload["uid"],
+                user_id=sub,
+                social_user_id=payload["sid"],
+                name=payload.get("name"),
+                field=payload.get("field"),
+                is_onboarded=bool(payload.get("onb")),
+            )
+    return AccessClaims.from_user(sub, await _load_user(db, sub))
+
+
+async def _load_user(db: AsyncSession, user_id: str) -> User:
+    # payload["sub"]가 user_id (문자열) - 인증 사용자 캐시 우선, 미스 시 User 테이블에서 직접 조회
+    # (동기 Redis 호출은 offload.run_redis, DB 조회는 run_sync로 동기 서비스 재사용)
+    snapshot = user_cache.get_local_snapshot(user_id)
+    if snapshot is None:
+        snapshot = await offload.run_redis(user_cache.get_shared_snapshot, user_id)
+    if snapshot is not None:
+        return await db.run_sync(user_cache.attach_user, snapshot)
+    user, snapshot = await db.run_sync(_query_user, user_id)
+    await offload.run_redis(user_cache.cache_snapshot, user_id, snapshot)
+    return user
+
+
+def _query_user(db: Session, user_id: str):
+    # AsyncSession.run_sync로 호출 - Redis를 호출하지 않음 (email=None이면 get_or_create_minimal도 DB만 사용)
     user = db.query(User).filter(User.user_id == user_id).first()
 
     if not user:
@@ -62,7 +181,15 @@ def get_current_user(
         except Exception:
             raise HTTPException(404, "User not found")
     
-    return user
+    return user, user_cache.snapshot_user(user)
+
+
+def _get_or_create_user(**kwargs):
+    # 오프로드 스레드에서 동기 세션으로 실행 (이메일 연결 시 get_or_create_minimal의 캐시 무효화가 Redis를 호출)
+    with SessionLocal() as session:
+        user, user_id, created = get_or_create_minimal(session, **kwargs)
+        session.expunge(user)
+        return user, user_id, created
 
 
 @router.get("/me")
@@ -170,11 +297,10 @@ async def login_kakao(frontRedirect: str = Query(None, description="프론트엔
     return RedirectResponse(login_url)
 
 
-@router.get("/kakao/callback")
+@router.get("/kakao/callback", dependencies=[Depends(rate_limit("oauth_callback"))])
 async def kakao_callback(
     code: str = Query(..., description="카카오에서 받은 인증 코드"),
     state: str = Query(None, description="프론트엔드 리다이렉트 URL"),
-    db: Session = Depends(get_db)
 ):
     """
     카카오 로그인 콜백 처리
@@ -184,7 +310,6 @@ async def kakao_callback(
     Args:
         code: 카카오에서 받은 인증 코드 (필수)
         state: 프론트엔드 리다이렉트 URL (frontRedirect, 선택사항)
-        db: 데이터베이스 세션
         
     Returns:
         RedirectResponse: 프론트엔드로 302 리다이렉트
@@ -195,7 +320,7 @@ async def kakao_callback(
     Note:
         - state 파라미터 URL 디코딩 처리
         - HTTPS 강제 리다이렉트 (프로덕션 환경, localhost 제외)
-        - 사용자 생성/조회는 get_or_create_minimal 함수 사용
+        - 사용자 생성/조회는 get_or_create_minimal 함수 사용 (오프로드 스레드의 동기 세션)
         - 모든 에러는 프론트엔드로 리다이렉트하여 처리
     """
     # URL 디코딩 처리
@@ -212,8 +337,8 @@ async def kakao_callback(
         logging.info(f"HTTPS로 변경된 front_redirect: {front_redirect}")
     
     try:
-        token = kakao_auth.get_access_token(code)
-        raw = kakao_auth.get_user_info(token)
+        token = await kakao_auth.get_access_token(code)
+        raw = await kakao_auth.get_user_info(token)
         email, pid = extract_email_and_id("kakao", raw)
         # 카카오 닉네임 추출(없으면 None)
         profile = (raw or {}).get("properties", {}) if isinstance(raw, dict) else {}
@@ -222,8 +347,8 @@ async def kakao_callback(
         if not pid:
             raise HTTPException(400, "카카오 사용자의 id를 가져올 수 없습니다.")
 
-        user, user_id, _ = get_or_create_minimal(
-            db,
+        user, user_id, _ = await offload.run_blocking(
+            _get_or_create_user,
             provider="kakao",
             provider_user_id=pid,
             email=email,  # 동의 안 했으면 None
@@ -243,7 +368,7 @@ async def kakao_callback(
             return RedirectResponse(redirect_url, status_code=302)
         
         # 기존 회원: 로그인 완료
-        access_token = create_access_token({"sub": user_id})
+        access_token = await issue_access_token(user, user_id)
         params = {"token": access_token}
         redirect_url = f"{front_redirect}?{urlencode(params)}"
         logging.info(f"기존 회원 리다이렉트 URL: {redirect_url}")
@@ -274,11 +399,10 @@ async def login_naver(frontRedirect: str = Query(None, description="프론트엔
     return RedirectResponse(naver_auth.get_login_url(frontRedirect))
 
 
-@router.get("/naver/callback")
+@router.get("/naver/callback", dependencies=[Depends(rate_limit("oauth_callback"))])
 async def naver_callback(
     code: str = Query(..., description="네이버에서 받은 인증 코드"),
     state: str = Query(None, description="프론트엔드 리다이렉트 URL"),
-    db: Session = Depends(get_db)
 ):
     """
     네이버 로그인 콜백 처리
@@ -286,7 +410,6 @@ async def naver_callback(
     Args:
         code: 네이버에서 받은 인증 코드
         state: 프론트엔드 리다이렉트 URL (frontRedirect)
-        db: 데이터베이스 세션
         
     Returns:
         RedirectResponse: 프론트엔드로 302 리다이렉트
@@ -295,15 +418,17 @@ async def naver_callback(
     front_redirect = state or os.getenv("FRONT_DEFAULT_REDIRECT", "http://localhost:5173/oauth/callback/naver")
     
     try:
-        token = naver_auth.get_access_token(code, state)
-        raw = naver_auth.get_user_info(token)
+        token = await naver_auth.get_access_token(code, state)
+        raw = await naver_auth.get_user_info(token)
         email, pid = extract_email_and_id("naver", raw)
         nickname = (raw.get("response") or {}).get("nickname") if isinstance(raw, dict) else None
         
         if not pid:
             raise HTTPException(400, "네이버 사용자의 id를 가져올 수 없습니다.")
 
-        user, user_id, _ = get_or_create_minimal(db, provider="naver", provider_user_id=pid, email=email, name=nickname)
+        user, user_id, _ = await offload.run_blocking(
+            _get_or_create_user, provider="naver", provider_user_id=pid, email=email, name=nickname
+        )
 
         if not user.is_onboarded:
             # 신규 회원: 회원가입 필요
@@ -317,7 +442,7 @@ async def naver_callback(
             return RedirectResponse(redirect_url, status_code=302)
         
         # 기존 회원: 로그인 완료
-        access_token = create_access_token({"sub": user_id})
+        access_token = await issue_access_token(user, user_id)
         params = {"token": access_token}
         redirect_url = f"{front_redirect}?{urlencode(params)}"
         return RedirectResponse(redirect_url, status_code=302)
@@ -343,11 +468,10 @@ async def login_google(frontRedirect: str = Query(None, description="프론트
     return RedirectResponse(google_auth.get_login_url(frontRedirect))
 
 
-@router.get("/google/callback")
+@router.get("/google/callback", dependencies=[Depends(rate_limit("oauth_callback"))])
 async def google_callback(
     code: str = Query(..., description="구글에서 받은 인증 코드"),
     state: str = Query(None, description="프론트엔드 리다이렉트 URL"),
-    db: Session = Depends(get_db)
 ):
     """
     구글 로그인 콜백 처리
@@ -355,7 +479,6 @@ async def google_callback(
     Args:
         code: 구글에서 받은 인증 코드
         state: 프론트엔드 리다이렉트 URL (frontRedirect)
-        db: 데이터베이스 세션
         
     Returns:
         RedirectResponse: 프론트엔드로 302 리다이렉트
@@ -364,15 +487,18 @@ async def google_callback(
     front_redirect = state or os.getenv("FRONT_DEFAULT_REDIRECT", "http://localhost:5173/oauth/callback/google")
     
     try:
-        token = google_auth.get_access_token(code)
-        raw = google_auth.get_user_info(token)
+        tokens = await google_auth.exchange_code(code)
+        # id_token이 있으면 로컬 서명 검증으로 사용자 정보 추출 (userinfo 호출 생략)
+        raw = await google_auth.get_user_info_from_tokens(tokens)
         email, pid = extract_email_and_id("google", raw)
         nickname = raw.get("name") if isinstance(raw, dict) else None
         
         if not pid:
             raise HTTPException(400, "구글 사용자의 id를 가져올 수 없습니다.")
 
-        user, user_id, _ = get_or_create_minimal(db, provider="google", provider_user_id=pid, email=email, name=nickname)
+        user, user_id, _ = await offload.run_blocking(
+            _get_or_create_user, provider="google", provider_user_id=pid, email=email, name=nickname
+        )
 
         if not user.is_onboarded:
             # 신규 회원: 회원가입 필요
@@ -386,7 +512,7 @@ async def google_callback(
             return RedirectResponse(redirect_url, status_code=302)
         
         # 기존 회원: 로그인 완료
-        access_token = create_access_token({"sub": user_id})
+        access_token = await issue_access_token(user, user_id)
         params = {"token": access_token}
         redirect_url = f"{front_redirect}?{urlencode(params)}"
         return RedirectResponse(redirect_url, status_code=302)
@@ -462,8 +588,8 @@ class SignupForm(BaseModel):
         return v
 
 
-@router.post("/signup")
-async def complete_signup(form: SignupForm, db: Session = Depends(get_db)):
+@router.post("/signup", dependencies=[Depends(rate_limit("oauth_callback"))])
+async def complete_signup(form: SignupForm, db: AsyncSession = Depends(get_async_db)):
     """
     회원가입 완료 (온보딩 정보 입력)
     
@@ -501,13 +627,13 @@ async def complete_signup(form: SignupForm, db: Session = Depends(get_db)):
     except Exception:
         raise HTTPException(status_code=401, detail="Invalid or expired signup token")
 
-    user = db.query(User).filter(User.user_id == user_id).first()
+    user = (await db.execute(select(User).where(User.user_id == user_id))).scalar_one_or_none()
     if not user:
         raise HTTPException(404, "User not found")
 
     if user.is_onboarded:
         # 이미 완료된 경우 바로 access 토큰 발급
-        access = create_access_token({"sub": user.user_id})
+        access = await issue_access_token(user, user.user_id)
         return {"access_token": access, "user_id": user.user_id}
 
     # 온보딩 정보 업데이트
@@ -520,10 +646,12 @@ async def complete_signup(form: SignupForm, db: Session = Depends(get_db)):
     if form.email and not user.email:
         user.email = str(form.email)
     user.is_onboarded = True
+    user_cache.bump_version(user)
 
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
+    await offload.run_redis(user_cache.invalidate_user, user.user_id, user.id, user.version)
     logging.info(f"signup completed: user_id={user.user_id}, nickname={user.name}, track={user.field}, school={user.university}, portfolio_url={user.portfolio}, email={user.email}")
 
-    access = create_access_token({"sub": user.user_id})
+    access = await issue_access_token(user, user.user_id)
     return {"access_token": access, "user_id": user.user_id} 
\ No newline at end of file
@@ -0,0 +1,112 @@
+"""
+내부 메트릭 API
+
+프로세스 내 메트릭(services.metrics), 외부 호출 서킷 브레이커 상태, 오프로드 스레드 풀, DB 커넥션 풀 상태를 조회합니다.
+- /internal/metrics: JSON 스냅샷 (분위수 근사값 포함)
+- /metrics: Prometheus 텍스트 포맷 (prometheus_router)
+
+METRICS_TOKEN이 설정되어 있으면 X-Metrics-Token 헤더 또는 Authorization: Bearer 토큰이 일치해야 합니다.
+토큰이 없으면 METRICS_PUBLIC=true로 명시한 경우에만 공개하고, 기본값은 404입니다.
+"""
+
+import secrets
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import Response
+
+from config import settings
+from services import db_pool, metrics, oauth_http, offload, read_replicas
+
+router = APIRouter(prefix="/internal/metrics")
+prometheus_router = APIRouter()
+
+
+def require_metrics_token(
+    x_metrics_token: Optional[str] = Header(None),
+    authorization: Optional[str] = Header(None),
+) -> None:
+    """
+    메트릭 조회 권한 확인
+    
+    Raises:
+        HTTPException:
+            - 403: METRICS_TOKEN과 X-Metrics-Token 헤더 또는 Bearer 토큰(Prometheus scrape 설정용)이 다름
+            - 404: METRICS_TOKEN이 없고 METRICS_PUBLIC도 꺼져 있음 (기본값, 엔드포인트를 노출하지 않음)
+    """
+    expected = settings.METRICS_TOKEN
+    if not expected:
+        if settings.METRICS_PUBLIC:
+            return
+        raise HTTPException(status_code=404, detail="Not Found")
+    provided = x_metrics_token
+    if provided is None and authorization and authorization.lower().startswith("bearer "):
+        provided = authorization[7:].strip()
+    if not (provided and secrets.compare_digest(provided, expected)):
+        raise HTTPException(status_code=403, detail="메트릭 조회 권한이 없습니다.")
+
+
+@router.get("", dependencies=[Depends(require_metrics_token)])
+async def get_metrics():
+    """
+    내부 메트릭 조회
+    
+    Returns:
+        dict: 메트릭 스냅샷
+        - metrics: 카운터/히스토그램 값 (예: oauth_request_seconds, oauth_requests_total)
+        - circuit_breakers: 외부 호출 서킷 브레이커 상태 (oauth 제공자별)
+        - offload: 오프로드 풀별 한도, 사용 중/대기 중 작업 수
+    
+    Note:
+        - 워커 프로세스별 값 (여러 워커 실행 시 요청을 받은 워커의 값)
+    """
+    return {
+        "metrics": metrics.snapshot(),
+        "circuit_breakers": {"oauth": oauth_http.breaker_states()},
+        "offload": offload.pool_status(),
+    }
+
+
+@router.get("/db-pool", dependencies=[Depends(require_metrics_token)])
+async def get_db_pool_metrics():
+    """
+    DB 커넥션 풀 상태 조회
+    
+    Returns:
+        dict: 커넥션 풀 상태와 관련 메트릭
+        - pools: 엔진별(sync, async) 현재 상태 (checked_out, overflow, pool_size 등)
+        - checkout_seconds: 커넥션 획득 대기 시간 히스토그램
+        - events: 풀 이벤트 카운트 (connect, checkout, checkin, invalidate, timeout 등)
+        - replicas: 읽기 복제본별 사용 가능 여부와 마지막으로 확인한 복제 지연
+    
+    Note:
+        - checkout_seconds의 p95가 커지거나 timeout이 증가하면 DB_POOL_SIZE/DB_MAX_OVERFLOW 조정 필요
+    """
+    return {
+        "pools": db_pool.pool_stats(),
+        "checkout_seconds": db_pool.CHECKOUT_SECONDS.snapshot(),
+        "events": db_pool.POOL_EVENTS.snapshot(),
+        "replicas": read_replicas.replica_stats(),
+    }
+
+
+
+@prometheus_router.get("/metrics", dependencies=[Depends(require_metrics_token)])
+async def get_prometheus_metrics():
+    """
+    Prometheus 텍스트 포맷 메트릭
+    
+    Returns:
+        Response: exposition format 0.0.4 텍스트
+        - http_request_duration_seconds: 라우트 템플릿/메서드/상태별 요청 처리 시간
+        - http_requests_in_flight: 처리 중인 요청 수
+        - db_pool_connections, db_pool_checkout_seconds, db_pool_events_total: DB 커넥션 풀
+        - gcs_upload_seconds, gcs_upload_bytes_total: GCS 업로드
+        - oauth_request_seconds, oauth_requests_total: 소셜 로그인 제공자 호출
+        - sse_subscribers: 로그 스트림 구독자 수
+        - cache_requests_total: 캐시 조회 결과 (적중률 = local+redis / 전체)
+    
+    Note:
+        - 워커 프로세스별 값 (여러 워커 실행 시 워커마다 수집하거나 수집 측에서 합산)
+    """
+    return Response(content=metrics.render_prometheus(), media_type=metrics.PROMETHEUS_CONTENT_TYPE)
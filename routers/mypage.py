@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from database import get_db
 from database import User
 from routers.auth import get_current_user
+from services import offload, user_cache
 from pydantic import BaseModel
 from typing import Optional
 
@@ -15,7 +16,8 @@ class BasicProfileUpdate(BaseModel):
 
 
 @router.delete("/users/me")
-async def delete_user(
+@offload.blocking()
+def delete_user(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -29,11 +31,13 @@ async def delete_user(
 
     db.delete(user)   # 완전 삭제
     db.commit()
+    user_cache.invalidate_user(current_user.user_id, current_user.id, None)
     return {"message": "회원 탈퇴가 완료되었습니다."}
 
 
 @router.put("/users/me/basic")
-async def update_basic_info(
+@offload.blocking()
+def update_basic_info(
     data: BasicProfileUpdate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -54,8 +58,10 @@ async def update_basic_info(
     if data.university is not None:
         user.university = data.university
 
+    user_cache.bump_version(user)
     db.commit()
     db.refresh(user)
+    user_cache.invalidate_user(user.user_id, user.id, user.version)
 
     return {
         "message": "기본 정보가 수정되었습니다.",
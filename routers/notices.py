@@ -1,14 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from typing import List
-from database import get_db, Notice
+from database import get_read_db, Notice
 from schemas import NoticeListItem, NoticeDetailResponse
+from services import offload
 
 router = APIRouter(prefix="/notices")
 
 # 1. 공지사항 목록 조회
 @router.get("/", response_model=List[NoticeListItem])
-async def get_notices(db: Session = Depends(get_db)):
+@offload.blocking()
+def get_notices(db: Session = Depends(get_read_db)):
     """
     공지사항 목록 조회 (제목만 표시)
     """
@@ -18,7 +20,8 @@ async def get_notices(db: Session = Depends(get_db)):
 
 # 2. 공지사항 상세 조회
 @router.get("/{notice_id}", response_model=NoticeDetailResponse)
-async def get_notice_detail(notice_id: int, db: Session = Depends(get_db)):
+@offload.blocking()
+def get_notice_detail(notice_id: int, db: Session = Depends(get_read_db)):
     """
     공지사항 상세 조회 (작성일, 제목, 내용)
     """
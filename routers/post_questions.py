@@ -8,17 +8,19 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import List
-from database import get_db, Post, PostQuestion, User
+from database import get_db, get_read_db, Post, PostQuestion, User
 from schemas import PostQuestionsRequest, PostQuestionResponse, PostQuestionCreate
 from routers.auth import get_current_user
 from services.user_service import get_user_id_from_user
+from services import offload, question_cache, single_flight
 from sqlalchemy import and_
 
 router = APIRouter()
 
 
 @router.post("/posts/{post_id}/questions", status_code=201)
-async def create_post_questions(
+@offload.blocking()
+def create_post_questions(
     post_id: int,
     questions_request: PostQuestionsRequest,
     current_user: User = Depends(get_current_user),
@@ -48,6 +50,7 @@ async def create_post_questions(
     
     Note:
         - **덮어쓰기 방식**: 기존 질문 모두 삭제 후 새로 생성
+        - 커밋 후 공고 질문 캐시 무효화 (question_cache)
         - 권한 검증: post.user_id == get_user_id_from_user(current_user)
         - CHOICES 타입 질문은 반드시 choices 필드 필요
         - 질문 타입: TEXT, TEXTAREA, CHOICES, ATTACHMENT 지원
@@ -93,6 +96,7 @@ async def create_post_questions(
         created_questions.append(question)
     
     db.commit()
+    question_cache.invalidate_post_questions(post_id)
     
     # 5. 생성된 질문들의 ID를 설정
     for question in created_questions:
@@ -102,9 +106,10 @@ async def create_post_questions(
 
 
 @router.get("/posts/{post_id}/questions", response_model=List[PostQuestionResponse])
-async def get_post_questions(
+@offload.blocking()
+def get_post_questions(
     post_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     공고의 질문 목록을 조회합니다.
@@ -128,7 +133,15 @@ async def get_post_questions(
         - 지원서 작성 시 필요한 질문 정보 제공
         - 공고 존재 여부만 확인, 권한 검증 없음
         - CHOICES 타입 질문의 경우 choices 필드 포함
+        - 질문 목록은 공고 질문 캐시(question_cache)에서 조회
+        - 같은 공고의 동시 조회는 한 번만 조회해 결과 공유 (single_flight)
     """
+    key = single_flight.make_key("post_questions", session=db, post_id=post_id)
+    return single_flight.coalesce_sync(key, lambda: _load_post_questions(db, post_id))
+
+
+def _load_post_questions(db: Session, post_id: int) -> List[dict]:
+    """get_post_questions 응답 조회 (공고가 없으면 404)"""
     # 1. 공고 존재 여부 확인
     post = db.query(Post).filter(Post.id == post_id).first()
     if not post:
@@ -137,9 +150,5 @@ async def get_post_questions(
             detail="공고를 찾을 수 없습니다."
         )
     
-    # 2. 질문 목록 조회 (생성 순서대로)
-    questions = db.query(PostQuestion).filter(
-        PostQuestion.post_id == post_id
-    ).order_by(PostQuestion.created_at).all()
-    
-    return questions 
\ No newline at end of file
+    # 2. 질문 목록 조회 (생성 순서대로, 공고 질문 캐시 사용)
+    return question_cache.get_post_questions(db, post_id) 
\ No newline at end of file
@@ -7,11 +7,14 @@
 """
 
 from fastapi import APIRouter, Depends, File, UploadFile, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from database import get_db, Post, User, Application
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import get_async_db, get_async_read_db, Post, User, Application
 from schemas import PostCreate, PostResponse, PostListResponse, RecruitmentFieldEnum, RecruitmentHeadcountEnum, SortEnum, PostListMyResponse
+from services import fast_json, single_flight
 from services.file_upload_service import FileUploadService
-from routers.auth import get_current_user
+from services.query_stats import query_budget
+from services.rate_limit import rate_limit
+from routers.auth import get_current_user, get_current_claims, AccessClaims
 import logging
 from sqlalchemy import or_, func, select
 from datetime import datetime
@@ -20,12 +23,12 @@ from typing import Optional
 router = APIRouter()
 
 
-@router.post("/posts", response_model=PostResponse)
+@router.post("/posts", response_model=PostResponse, dependencies=[Depends(rate_limit("upload"))])
 async def create_post(
     post_data: PostCreate = Depends(),
     image_file: UploadFile = File(...),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     공고 생성
@@ -73,11 +76,11 @@ async def create_post(
             views=0,
         )
         db.add(post)
-        db.commit()
-        db.refresh(post)
+        await db.commit()
+        await db.refresh(post)
         return post
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         # 상세 원인 파악을 위해 traceback 포함 로깅
         logging.error(f"DB 저장 실패: {e}", exc_info=True)
         # 디버깅 목적: 배포 환경에서 원인 파악을 위해 에러 클래스를 함께 노출 (문제 해결 후 일반 메시지로 복구 권장)
@@ -87,9 +90,10 @@ async def create_post(
         )
 
 
-@router.get("/posts", response_model=PostListResponse)
+@router.get("/posts", response_model=PostListResponse, dependencies=[Depends(rate_limit("search", query_params=("q", "school_name")))])
+@query_budget(4)  # 전체 수, 목록, 지원자/합격자 집계 + 복제 지연 확인
 async def list_posts(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     sort: SortEnum = Query(SortEnum.LATEST, description="정렬 기준"),
     recruitment_field: Optional[RecruitmentFieldEnum] = Query(None, description="모집 분야"),
     recruitment_headcount: Optional[RecruitmentHeadcountEnum] = Query(None, description="모집 인원"),
@@ -118,16 +122,44 @@ async def list_posts(
     Returns:
         PostListResponse: 공고 목록 및 총 개수
         - 각 공고에 application_count, recruited_count, recruitment_status 포함
-    """
-    query = db.query(Post)
     
-    # 필터링 적용
+    Note:
+        - 응답은 항목별 재검증 없이 바로 직렬화 (fast_json.trusted_response)
+        - 같은 조건의 동시 조회는 한 번만 조회해 결과 공유 (single_flight, 랜덤순 제외)
+    """
+    params = dict(
+        sort=sort, recruitment_field=recruitment_field, recruitment_headcount=recruitment_headcount,
+        school_name=school_name, deadline_before=deadline_before, q=q, page=page, size=size,
+    )
+    if sort == SortEnum.RANDOM:
+        # 랜덤순은 요청마다 다른 결과를 줘야 하므로 합치지 않음
+        content = await _load_post_list(db, **params)
+    else:
+        key = single_flight.make_key("post_list", session=db, **params)
+        content = await single_flight.coalesce(key, lambda: _load_post_list(db, **params))
+    return fast_json.trusted_response(PostListResponse, content)
+
+
+async def _load_post_list(
+    db: AsyncSession,
+    sort: SortEnum,
+    recruitment_field: Optional[RecruitmentFieldEnum],
+    recruitment_headcount: Optional[RecruitmentHeadcountEnum],
+    school_name: Optional[str],
+    deadline_before: Optional[datetime],
+    q: Optional[str],
+    page: int,
+    size: int,
+) -> dict:
+    """list_posts 응답 dict 조회 (동시 요청 간 공유되므로 반환 후 변경 금지)"""
+    # 필터링 조건
+    filters = []
     if recruitment_field:
-        query = query.filter(Post.recruitment_field == recruitment_field.value)
+        filters.append(Post.recruitment_field == recruitment_field.value)
     if recruitment_headcount:
-        query = query.filter(Post.recruitment_headcount == recruitment_headcount.value)
+        filters.append(Post.recruitment_headcount == recruitment_headcount.value)
     if school_name:
-        query = query.filter(
+        filters.append(
             or_(
                 Post.target_school_name == school_name,
                 Post.description.contains(school_name),
@@ -135,9 +167,9 @@ async def list_posts(
             )
         )
     if deadline_before:
-        query = query.filter(Post.deadline <= deadline_before)
+        filters.append(Post.deadline <= deadline_before)
     if q:
-        query = query.filter(
+        filters.append(
             or_(
                 Post.title.contains(q),
                 Post.description.contains(q)
@@ -145,7 +177,9 @@ async def list_posts(
         )
     
     # 총 개수 조회
-    total_count = query.count()
+    total_count = (await db.execute(select(func.count(Post.id)).where(*filters))).scalar_one()
+    
+    query = select(Post).where(*filters)
     
     # 정렬 적용
     if sort == SortEnum.LATEST:
@@ -159,19 +193,26 @@ async def list_posts(
     
     # 페이지네이션 적용
     offset = (page - 1) * size
-    posts = query.offset(offset).limit(size).all()
+    posts = (await db.execute(query.offset(offset).limit(size))).scalars().all()
+    
+    # 페이지 내 공고들의 지원자 수, 모집된 인원 수(합격자)를 한 번에 집계
+    counts = {}
+    if posts:
+        count_rows = (await db.execute(
+            select(
+                Application.post_id,
+                func.count(Application.id),
+                func.count(Application.id).filter(Application.status == "합격"),
+            )
+            .where(Application.post_id.in_([post.id for post in posts]))
+            .group_by(Application.post_id)
+        )).all()
+        counts = {post_id: (total, recruited) for post_id, total, recruited in count_rows}
     
     # 각 공고의 지원자 수, 모집된 인원 수, 모집 상태를 계산해서 추가
     posts_with_count = []
     for post in posts:
-        # 지원자 수 계산
-        application_count = db.query(func.count(Application.id)).filter(Application.post_id == post.id).scalar()
-        
-        # 모집된 인원 수 계산 (합격자)
-        recruited_count = db.query(func.count(Application.id)).filter(
-            Application.post_id == post.id,
-            Application.status == "합격"
-        ).scalar()
+        application_count, recruited_count = counts.get(post.id, (0, 0))
         
         # 모집 상태 계산
         now = datetime.now()
@@ -203,16 +244,16 @@ async def list_posts(
         }
         posts_with_count.append(post_dict)
     
-    return PostListResponse(
-        total_count=total_count,
-        posts=posts_with_count
-    )
+    return {
+        "total_count": total_count,
+        "posts": posts_with_count
+    }
 
 
 @router.get("/posts/{post_id}", response_model=PostResponse)
 async def get_post_detail(
     post_id: int, 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     공고 상세 조회
@@ -232,8 +273,17 @@ async def get_post_detail(
         
     Raises:
         HTTPException: 공고를 찾을 수 없음 (404)
+    
+    Note:
+        - 같은 공고의 동시 조회는 한 번만 조회해 결과 공유 (single_flight)
     """
-    post = db.query(Post).filter(Post.id == post_id).first()
+    key = single_flight.make_key("post_detail", session=db, post_id=post_id)
+    return await single_flight.coalesce(key, lambda: _load_post_detail(db, post_id))
+
+
+async def _load_post_detail(db: AsyncSession, post_id: int) -> dict:
+    """get_post_detail 응답 dict 조회 (공고가 없으면 404)"""
+    post = (await db.execute(select(Post).where(Post.id == post_id))).scalar_one_or_none()
     if not post:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -241,13 +291,17 @@ async def get_post_detail(
         )
     
     # 지원자 수 계산
-    application_count = db.query(func.count(Application.id)).filter(Application.post_id == post.id).scalar()
+    application_count = (await db.execute(
+        select(func.count(Application.id)).where(Application.post_id == post.id)
+    )).scalar()
     
     # 모집된 인원 수 계산 (합격자)
-    recruited_count = db.query(func.count(Application.id)).filter(
-        Application.post_id == post.id,
-        Application.status == "합격"
-    ).scalar()
+    recruited_count = (await db.execute(
+        select(func.count(Application.id)).where(
+            Application.post_id == post.id,
+            Application.status == "합격"
+        )
+    )).scalar()
     
     # 모집 상태 계산
     now = datetime.now()
@@ -280,9 +334,10 @@ async def get_post_detail(
     }
 
 @router.get("/my/posts", response_model=PostListMyResponse)
+@query_budget(2)  # 사용자 조회(토큰이 최신 클레임이 아닐 때) + 공고 목록
 async def get_my_posts(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AccessClaims = Depends(get_current_claims),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     내가 작성한 공고 목록 조회
@@ -295,28 +350,25 @@ async def get_my_posts(
     user_id = str(current_user.user_id)
     now = datetime.now()
 
-    # 내가 작성한 공고 모두 조회
-    my_posts = (
-        db.query(Post)
-        .filter(Post.user_id == user_id)
-        .order_by(Post.created_at.desc())
-        .all()
+    # 지원자 수 (공고별 상관 서브쿼리)
+    application_count_column = (
+        select(func.count(Application.id)).where(Application.post_id == Post.id).scalar_subquery()
     )
 
+    # 내가 작성한 공고 모두 조회 (지원자 수 포함)
+    my_posts = (await db.execute(
+        select(Post, application_count_column)
+        .where(Post.user_id == user_id)
+        .order_by(Post.created_at.desc())
+    )).all()
+
     ongoing, closed = {}, {}
 
-    for post in my_posts:
+    for post, application_count in my_posts:
         is_ongoing = post.deadline >= now
         target_group = ongoing if is_ongoing else closed
         field = post.recruitment_field or "기타"
 
-        # 지원자 수 계산
-        application_count = (
-            db.query(func.count(Application.id))
-            .filter(Application.post_id == post.id)
-            .scalar()
-        )
-
         post_info = {
             "id": post.id,
             "title": post.title,
@@ -3,17 +3,19 @@ import json
 import logging
 from sqlalchemy.orm import Session
 from collections import defaultdict
-from database import get_db
+from database import get_db, get_read_db
 from services.profile_service import update_profile, get_recent_projects
 from schemas import UserProfileResponse
 from database import User
 from routers.auth import get_current_user
 from services.gcs_uploader import upload_avatar, upload_cover, upload_timetable
+from services import single_flight, user_cache
+from services.rate_limit import rate_limit
 
 router = APIRouter(prefix="/profile")
 
 @router.get("/{user_id}", response_model=UserProfileResponse)
-def get_user_profile(user_id: str, db: Session = Depends(get_db)):
+def get_user_profile(user_id: str, db: Session = Depends(get_read_db)):
     """
     특정 사용자의 프로필을 조회합니다.
     
@@ -37,7 +39,14 @@ def get_user_profile(user_id: str, db: Session = Depends(get_db)):
         - careers는 연도별로 그룹화되어 반환 (최신 연도 우선)
         - recent_projects는 get_recent_projects 함수로 조회
         - 공개 프로필로 누구나 조회 가능
+        - 같은 사용자 프로필의 동시 조회는 한 번만 조회해 결과 공유 (single_flight)
     """
+    key = single_flight.make_key("user_profile", session=db, user_id=user_id)
+    return single_flight.coalesce_sync(key, lambda: _load_user_profile(db, user_id))
+
+
+def _load_user_profile(db: Session, user_id: str) -> dict:
+    """get_user_profile 응답 dict 조회 (동시 요청 간 공유되므로 반환 후 변경 금지)"""
     user = db.query(User).filter(User.user_id == user_id).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
@@ -65,7 +74,7 @@ def get_user_profile(user_id: str, db: Session = Depends(get_db)):
         "recent_projects": recent_projects
     }
 
-@router.put("/{user_id}")
+@router.put("/{user_id}", dependencies=[Depends(rate_limit("upload"))])
 def update_user_profile(
     user_id: str,
     name: str = Form(None),
@@ -154,7 +163,7 @@ def update_user_profile(
     }
     return {"message": "프로필이 성공적으로 업데이트되었습니다.", "profile": profile}
 
-@router.post("/{user_id}/upload/timetable")
+@router.post("/{user_id}/upload/timetable", dependencies=[Depends(rate_limit("upload"))])
 def upload_timetable_api(
     user_id: str,
     timetable: UploadFile = File(...),
@@ -195,6 +204,8 @@ def upload_timetable_api(
 
     timetable_url = upload_timetable(timetable, user_id)
     user.timetable_url = timetable_url
+    user_cache.bump_version(user)
     db.commit()
+    user_cache.invalidate_user(user_id, user.id, user.version)
 
     return {"timetable_url": timetable_url}
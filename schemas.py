@@ -32,6 +32,10 @@ class ApplicationSortEnum(str, Enum):
     CREATED_AT_ASC = "오래된순"
     STATUS = "상태순"
 
+class ApplicationExportFormatEnum(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
 class QuestionTypeEnum(str, Enum):
     TEXT = "TEXT"
     TEXTAREA = "TEXTAREA"
@@ -179,6 +183,8 @@ class ApplicationListResponse(BaseModel):
     applications: List[ApplicationListItem]
     page: int
     size: int
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (없으면 마지막 페이지)
+    status_counts: Dict[str, int] = {}  # 상태별 지원자 수 (상태 필터와 무관한 전체 기준)
 
 class ApplicationDetailResponse(BaseModel):
     application_id: int
@@ -209,6 +215,28 @@ class ApplicationStatusResponse(BaseModel):
     class Config:
         from_attributes = True
 
+# 지원서 상태 일괄 변경 (모집자용)
+class ApplicationBulkStatusItem(BaseModel):
+    application_id: int
+    new_status: ApplicationStatusEnum
+
+class ApplicationBulkStatusUpdate(BaseModel):
+    updates: List[ApplicationBulkStatusItem] = Field(..., min_length=1, max_length=500)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "updates": [
+                    {"application_id": 1, "new_status": "합격"},
+                    {"application_id": 2, "new_status": "불합격"}
+                ]
+            }
+        }
+
+class ApplicationBulkStatusResponse(BaseModel):
+    updated: List[ApplicationStatusResponse]
+    skipped_application_ids: List[int]  # 존재하지 않거나, 다른 공고 소속이거나, 이미 최종 결정된 지원서
+
 # ----- Profile 관련 스키마 -----
 class RecentProjectResponse(BaseModel):  # 최근 프로젝트
     id: int
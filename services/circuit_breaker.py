@@ -0,0 +1,72 @@
+"""
+서킷 브레이커
+
+외부 서비스가 연속으로 실패하면 일정 시간 동안 호출하지 않고 즉시 실패시켜,
+느린 외부 서비스 때문에 워커가 타임아웃까지 묶이는 것을 막습니다.
+
+- closed: 정상 호출. 연속 실패가 failure_threshold에 도달하면 open
+- open: reset_timeout_seconds 동안 호출 차단
+- half_open: 이후 한 건만 시험 호출을 허용하여 성공하면 closed, 실패하면 다시 open
+"""
+
+import threading
+import time
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout_seconds: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """호출 허용 여부 (open 상태면 False)"""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout_seconds:
+                    return False
+                self._state = self.HALF_OPEN
+                self._trial_in_flight = False
+            # half_open: 시험 호출은 한 건만
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._consecutive_failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            self._trial_in_flight = False
+            if self._state == self.HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def record_ignored(self) -> None:
+        """성공/실패로 보지 않는 결과 (호출 취소, 호출 측 오류) - 상태는 유지하고 시험 호출 슬롯만 반환"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def state(self) -> dict:
+        """현재 상태 (메트릭 조회용)"""
+        with self._lock:
+            state = self._state
+            if state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout_seconds:
+                state = self.HALF_OPEN
+            return {"state": state, "consecutive_failures": self._consecutive_failures}
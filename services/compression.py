@@ -0,0 +1,252 @@
+"""
+응답 압축 미들웨어 (gzip, 설치되어 있으면 brotli/zstd)
+
+공고 목록(size=100, 전체 description), 내 공고, 지원자 목록 같은 JSON 목록 응답을 압축합니다.
+
+- 인코딩 선택: 클라이언트 Accept-Encoding(q=0 제외) 중 COMPRESSION_ENCODINGS 순서상 첫 번째
+  (br은 brotli, zstd는 zstandard 패키지가 있을 때만 사용)
+- 대상: COMPRESSION_CONTENT_TYPES 허용 목록의 응답만 (이미지/PDF 등 이미 압축된 형식은 제외)
+- 제외: text/event-stream(SSE), Content-Encoding이 이미 있는 응답, Cache-Control: no-transform,
+  본문이 없는 상태 코드, COMPRESSION_MIN_SIZE 미만 본문
+- 스트리밍 응답(CSV/NDJSON 내보내기 등): 최소 크기만큼 모일 때까지 버퍼링한 뒤 압축을 시작하고,
+  작은 청크마다 flush하면 오히려 커지므로 입력이 _STREAM_FLUSH_BYTES 이상 쌓일 때마다 flush하여
+  클라이언트가 순차적으로 받을 수 있게 합니다.
+- 압축 수준: COMPRESSION_GZIP_LEVEL / COMPRESSION_BROTLI_QUALITY / COMPRESSION_ZSTD_LEVEL (CPU ↔ 전송량)
+"""
+
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+from config import settings
+from services import metrics
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성
+    zstandard = None
+
+COMPRESSED_RESPONSES = metrics.counter("http_compressed_responses_total", "압축한 응답 수 (인코딩별)")
+COMPRESSION_BYTES = metrics.counter("http_compression_bytes_total", "압축 전/후 응답 본문 바이트 수 (direction=in|out)")
+
+# 본문이 없는 응답 상태 코드
+_NO_BODY_STATUS = {204, 304}
+# 허용 목록과 무관하게 압축하지 않는 형식 (이벤트 단위 flush가 필요한 SSE)
+_NEVER_COMPRESS = {"text/event-stream"}
+# 스트리밍 압축 시 flush 간격 (압축 전 바이트)
+_STREAM_FLUSH_BYTES = 16 * 1024
+
+
+class _GzipEncoder:
+    def __init__(self):
+        self._compressor = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)  # 31: gzip 헤더
+
+    def compress(self, data: bytes, flush: bool) -> bytes:
+        chunk = self._compressor.compress(data)
+        return chunk + self._compressor.flush(zlib.Z_SYNC_FLUSH) if flush else chunk
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+class _BrotliEncoder:
+    def __init__(self):
+        self._compressor = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+
+    def compress(self, data: bytes, flush: bool) -> bytes:
+        chunk = self._compressor.process(data)
+        return chunk + self._compressor.flush() if flush else chunk
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.process(data) + self._compressor.finish()
+
+
+class _ZstdEncoder:
+    def __init__(self):
+        self._compressor = zstandard.ZstdCompressor(level=settings.COMPRESSION_ZSTD_LEVEL).compressobj()
+
+    def compress(self, data: bytes, flush: bool) -> bytes:
+        chunk = self._compressor.compress(data)
+        return chunk + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK) if flush else chunk
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+def _available_encoders() -> Dict[str, type]:
+    encoders = {"gzip": _GzipEncoder}
+    if brotli is not None:
+        encoders["br"] = _BrotliEncoder
+    if zstandard is not None:
+        encoders["zstd"] = _ZstdEncoder
+    return encoders
+
+
+def _split_setting(value: str) -> List[str]:
+    return [item.strip().lower() for item in value.split(",") if item.strip()]
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """Accept-Encoding 헤더 → {인코딩: q값}"""
+    accepted = {}
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[name] = q
+    return accepted
+
+
+class CompressionMiddleware:
+    """허용된 Content-Type의 응답 본문을 클라이언트가 지원하는 인코딩으로 압축하는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+        available = _available_encoders()
+        # 설정 순서(선호도)대로, 사용 가능한 인코딩만
+        self.encodings: List[Tuple[str, type]] = [
+            (name, available[name]) for name in _split_setting(settings.COMPRESSION_ENCODINGS) if name in available
+        ]
+        self.content_types = set(_split_setting(settings.COMPRESSION_CONTENT_TYPES)) - _NEVER_COMPRESS
+        self.min_size = settings.COMPRESSION_MIN_SIZE
+
+    def _select_encoding(self, scope) -> Optional[Tuple[str, type]]:
+        header = ""
+        for key, value in scope.get("headers", []):
+            if key == b"accept-encoding":
+                header = value.decode("latin-1")
+                break
+        if not header:
+            return None
+        accepted = parse_accept_encoding(header)
+        wildcard = accepted.get("*", 0.0)
+        for name, encoder in self.encodings:
+            if accepted.get(name, wildcard) > 0:
+                return name, encoder
+        return None
+
+    def _should_compress(self, message) -> bool:
+        if message.get("status", 200) in _NO_BODY_STATUS or message.get("status", 200) < 200:
+            return False
+        content_type = b""
+        for key, value in message.get("headers", []):
+            key = key.lower()
+            if key == b"content-encoding":
+                return False
+            if key == b"cache-control" and b"no-transform" in value.lower():
+                return False
+            if key == b"content-type":
+                content_type = value
+        mime = content_type.decode("latin-1").split(";", 1)[0].strip().lower()
+        return mime in self.content_types
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.encodings or scope.get("method") == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        selected = self._select_encoding(scope)
+        if selected is None:
+            await self.app(scope, receive, send)
+            return
+        encoding, encoder_class = selected
+
+        start_message = None
+        encoder = None
+        passthrough = False
+        buffered: List[bytes] = []
+        buffered_size = 0
+        bytes_in = 0
+        bytes_out = 0
+        since_flush = 0
+
+        async def send_start(compressed: bool, content_length: Optional[int] = None):
+            headers = [
+                (key, value) for key, value in start_message.get("headers", [])
+                if not (compressed and key.lower() == b"content-length")
+            ]
+            if compressed:
+                headers.append((b"content-encoding", encoding.encode()))
+                vary = [value for key, value in headers if key.lower() == b"vary"]
+                if not any(b"accept-encoding" in value.lower() for value in vary):
+                    headers.append((b"vary", b"Accept-Encoding"))
+                if content_length is not None:
+                    headers.append((b"content-length", str(content_length).encode()))
+            await send({**start_message, "headers": headers})
+
+        async def send_wrapper(message):
+            nonlocal start_message, encoder, passthrough, buffered_size, bytes_in, bytes_out, since_flush
+
+            if message["type"] == "http.response.start":
+                start_message = message
+                passthrough = not self._should_compress(message)
+                if passthrough:
+                    await send(message)
+                return
+
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if encoder is None:
+                # 최소 크기만큼 모이거나 응답이 끝날 때까지 버퍼링
+                buffered.append(body)
+                buffered_size += len(body)
+                if more_body and buffered_size < self.min_size:
+                    return
+                pending = b"".join(buffered)
+                buffered.clear()
+                if buffered_size < self.min_size:
+                    passthrough = True
+                    await send_start(False)
+                    await send({"type": "http.response.body", "body": pending, "more_body": False})
+                    return
+                encoder = encoder_class()
+                if not more_body:
+                    # 단일 본문: 한 번에 압축하고 Content-Length 설정
+                    compressed = encoder.finish(pending)
+                    self._record(encoding, len(pending), len(compressed))
+                    await send_start(True, len(compressed))
+                    await send({"type": "http.response.body", "body": compressed, "more_body": False})
+                    return
+                await send_start(True)
+                body = pending
+
+            bytes_in += len(body)
+            since_flush += len(body)
+            if more_body:
+                flush = since_flush >= _STREAM_FLUSH_BYTES
+                if flush:
+                    since_flush = 0
+                chunk = encoder.compress(body, flush)
+            else:
+                chunk = encoder.finish(body)
+            bytes_out += len(chunk)
+            if not more_body:
+                self._record(encoding, bytes_in, bytes_out)
+            if chunk or not more_body:
+                await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
+
+    @staticmethod
+    def _record(encoding: str, size_in: int, size_out: int) -> None:
+        COMPRESSED_RESPONSES.inc(encoding=encoding)
+        COMPRESSION_BYTES.inc(size_in, direction="in")
+        COMPRESSION_BYTES.inc(size_out, direction="out")
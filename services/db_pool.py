@@ -0,0 +1,111 @@
+"""
+DB 커넥션 풀 계측
+
+엔진을 만들 때 poolclass로 계측 풀을 지정하고 instrument()로 풀 이벤트를 연결하면,
+커넥션 획득 대기 시간과 풀 이벤트(연결 생성, 체크아웃/체크인, 무효화, 타임아웃)가
+services.metrics에 기록됩니다. 현재 풀 상태는 pool_stats()로 조회합니다 (/internal/metrics/db-pool,
+/metrics에서는 db_pool_connections 게이지).
+
+풀 이름은 create_engine(pool_logging_name=...)으로 지정합니다 (dispose 후 재생성된 풀에도 유지).
+"""
+
+import time
+from typing import Dict
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from services import metrics
+
+# 커넥션 획득 대기 버킷 (초) - 정상 시 1ms 미만, 풀 고갈 시 pool_timeout까지
+CHECKOUT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+CHECKOUT_SECONDS = metrics.histogram(
+    "db_pool_checkout_seconds", "DB 커넥션 획득 대기 시간 (초, 오버플로 연결 생성 포함)", CHECKOUT_BUCKETS
+)
+POOL_EVENTS = metrics.counter("db_pool_events_total", "DB 커넥션 풀 이벤트 수")
+
+_engines: Dict[str, Engine] = {}
+
+
+class _TimedCheckoutMixin:
+    """_do_get(풀에서 커넥션을 꺼내는 부분) 소요 시간 기록"""
+
+    def _do_get(self):
+        name = self._orig_logging_name or "default"
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            POOL_EVENTS.inc(engine=name, event="timeout")
+            raise
+        finally:
+            CHECKOUT_SECONDS.observe(time.perf_counter() - start, engine=name)
+
+
+class InstrumentedQueuePool(_TimedCheckoutMixin, QueuePool):
+    """동기 엔진용 계측 QueuePool"""
+
+
+class InstrumentedAsyncAdaptedQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    """비동기 엔진용 계측 AsyncAdaptedQueuePool"""
+
+
+def instrument(engine: Engine, name: str) -> None:
+    """
+    엔진의 풀 이벤트를 메트릭에 연결
+    
+    Args:
+        engine: 동기 엔진 (비동기 엔진은 async_engine.sync_engine 전달)
+        name: 메트릭 라벨 및 pool_stats 키
+    """
+    _engines[name] = engine
+
+    def _count(event_name):
+        def listener(*args, **kwargs):
+            POOL_EVENTS.inc(engine=name, event=event_name)
+        return listener
+
+    for event_name in ("connect", "checkout", "checkin", "invalidate", "soft_invalidate", "close"):
+        event.listen(engine, event_name, _count(event_name))
+
+
+def pool_stats() -> Dict[str, dict]:
+    """
+    엔진별 현재 풀 상태
+    
+    Returns:
+        dict: {엔진 이름: {pool_size, checked_out, checked_in, overflow, max_overflow, timeout, recycle, pre_ping}}
+    """
+    stats = {}
+    for name, engine in _engines.items():
+        pool = engine.pool
+        if not isinstance(pool, QueuePool):
+            stats[name] = {"pool_class": type(pool).__name__}
+            continue
+        stats[name] = {
+            "pool_size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": pool._max_overflow,
+            "timeout": pool.timeout(),
+            "recycle": pool._recycle,
+            "pre_ping": pool._pre_ping,
+        }
+    return stats
+
+
+def _pool_connection_values():
+    # /metrics 조회 시점의 풀 상태 (engine, state별 연결 수)
+    for name, stats in pool_stats().items():
+        for state in ("checked_out", "checked_in", "overflow", "pool_size"):
+            if state in stats:
+                yield {"engine": name, "state": state}, stats[state]
+
+
+POOL_CONNECTIONS = metrics.gauge(
+    "db_pool_connections", "DB 커넥션 풀 연결 수 (state: checked_out, checked_in, overflow, pool_size)",
+    callback=_pool_connection_values,
+)
@@ -0,0 +1,76 @@
+"""
+목록 응답용 빠른 JSON 직렬화 (신뢰 경로)
+
+response_model이 있는 라우트는 FastAPI가 반환값을 모델로 다시 검증한 뒤 직렬화합니다.
+공고 목록처럼 ORM 행에서 직접 만든 dict는 컬럼 타입이 이미 보장되므로, 항목마다 반복되는
+검증을 생략하고 바로 JSON 바이트로 직렬화해 반환합니다. (response_model은 문서/스키마용으로 유지)
+
+- orjson이 설치되어 있으면 orjson, 없으면 pydantic_core.to_json 사용 (둘 다 Rust 구현)
+- 출력 형식은 response_model 직렬화와 같습니다 (naive datetime → ISO 8601, None → null)
+- RESPONSE_VALIDATE_TRUSTED=true면 반환 전에 response_model로 검증 (테스트/CI에서 스키마와 dict 불일치 확인)
+
+사용 예:
+    return fast_json.trusted_response(PostListResponse, {"total_count": total, "posts": items})
+
+성능 비교: python -m benchmarks.serialization
+"""
+
+from typing import Any, Dict
+
+import pydantic_core
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from config import settings
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+_adapters: Dict[Any, TypeAdapter] = {}
+
+
+def dumps(content: Any) -> bytes:
+    """JSON 바이트 직렬화 (dict/list/str/int/float/bool/None/datetime)"""
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return pydantic_core.to_json(content)
+
+
+class FastJSONResponse(JSONResponse):
+    """dumps()로 본문을 만드는 JSONResponse"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def _adapter(model: Any) -> TypeAdapter:
+    adapter = _adapters.get(model)
+    if adapter is None:
+        adapter = _adapters[model] = TypeAdapter(model)
+    return adapter
+
+
+def trusted_response(model: Any, content: Any, status_code: int = 200) -> FastJSONResponse:
+    """
+    검증 없이 직렬화한 응답 (신뢰할 수 있는 dict 전용)
+
+    Args:
+        model: 라우트의 response_model (RESPONSE_VALIDATE_TRUSTED일 때만 검증에 사용)
+        content: response_model 형태의 dict (JSON 직렬화 가능한 기본 타입과 datetime만)
+        status_code: 응답 상태 코드
+
+    Returns:
+        FastJSONResponse: 직렬화된 응답
+
+    Raises:
+        pydantic.ValidationError: RESPONSE_VALIDATE_TRUSTED=true이고 content가 model과 맞지 않을 때
+
+    Note:
+        - 모델 기본값이 채워지지 않으므로 content에 모든 필드를 넣어야 함
+        - Enum, Decimal, tz-aware datetime 등 직렬화 형식이 다를 수 있는 값은 넣지 말 것
+    """
+    if settings.RESPONSE_VALIDATE_TRUSTED:
+        _adapter(model).validate_python(content)
+    return FastJSONResponse(content, status_code=status_code)
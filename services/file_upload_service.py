@@ -3,6 +3,7 @@
 """
 
 from fastapi import UploadFile, HTTPException
+from services import offload
 from services.gcs_uploader import upload_file_to_gcs, generate_unique_blob_name, generate_portfolio_blob_name
 import logging
 
@@ -26,11 +27,12 @@ class FileUploadService:
         Note:
             - generate_unique_blob_name으로 고유 파일명 생성
             - GCS posts/images/ 경로에 저장
+            - 업로드는 오프로드 gcs 풀 스레드에서 실행 (이벤트 루프 비블로킹)
             - 모든 예외는 500 에러로 변환하여 반환
         """
         try:
             blob_name = generate_unique_blob_name(file.filename or "uploaded_image")
-            return upload_file_to_gcs(file, blob_name)
+            return await offload.run_blocking(upload_file_to_gcs, file, blob_name, pool="gcs")
         except Exception as e:
             logging.error(f"이미지 업로드 실패: {e}")
             raise HTTPException(500, "이미지 업로드에 실패했습니다.")
@@ -52,12 +54,13 @@ class FileUploadService:
         Note:
             - generate_portfolio_blob_name으로 고유 파일명 생성
             - GCS applications/portfolios/ 경로에 저장
+            - 업로드는 오프로드 gcs 풀 스레드에서 실행 (이벤트 루프 비블로킹)
             - ATTACHMENT 타입 질문 답변에 사용됨
             - 모든 예외는 500 에러로 변환하여 반환
         """
         try:
             blob_name = generate_portfolio_blob_name(file.filename or "uploaded_file")
-            return upload_file_to_gcs(file, blob_name)
+            return await offload.run_blocking(upload_file_to_gcs, file, blob_name, pool="gcs")
         except Exception as e:
             logging.error(f"포트폴리오 업로드 실패: {e}")
             raise HTTPException(500, "포트폴리오 업로드에 실패했습니다.")
@@ -1,22 +1,50 @@
 import json
-from google.cloud import storage
-from google.oauth2 import service_account
+import threading
+import time
 from fastapi import UploadFile, HTTPException
 from config import settings
 import uuid
 import os
 import logging
+from services import metrics
 
-# GCP 서비스 계정 키 로딩
-try:
-    service_account_info = json.loads(settings.GCP_SERVICE_ACCOUNT_KEY_JSON)
-    credentials = service_account.Credentials.from_service_account_info(service_account_info)
-    storage_client = storage.Client(credentials=credentials, project=settings.GCP_PROJECT_ID)
-except Exception as e:
-    logging.error("GCP 서비스 계정 키 로딩 실패: %s", e)
-    raise HTTPException(status_code=500, detail="GCP 설정 오류")
+UPLOAD_SECONDS = metrics.histogram("gcs_upload_seconds", "GCS 파일 업로드 시간 (초, 결과별)")
+UPLOAD_BYTES = metrics.counter("gcs_upload_bytes_total", "GCS에 업로드한 바이트 수")
 
-bucket = storage_client.bucket(settings.GCS_BUCKET_NAME)
+# GCS 클라이언트는 최초 업로드 시점에 생성 (google.cloud 로딩을 워커 기동 경로에서 제외)
+_bucket = None
+_bucket_lock = threading.Lock()
+
+
+def get_bucket():
+    """
+    GCS 버킷 핸들 반환 (최초 호출 시 한 번만 생성)
+
+    Returns:
+        google.cloud.storage.Bucket: settings.GCS_BUCKET_NAME 버킷
+
+    Raises:
+        HTTPException: GCP 서비스 계정 키 로딩 실패 시 500 에러
+
+    Note:
+        - 실패한 경우 캐시하지 않으므로 다음 호출에서 다시 시도
+    """
+    global _bucket
+    if _bucket is None:
+        with _bucket_lock:
+            if _bucket is None:
+                try:
+                    from google.cloud import storage
+                    from google.oauth2 import service_account
+
+                    service_account_info = json.loads(settings.GCP_SERVICE_ACCOUNT_KEY_JSON)
+                    credentials = service_account.Credentials.from_service_account_info(service_account_info)
+                    storage_client = storage.Client(credentials=credentials, project=settings.GCP_PROJECT_ID)
+                except Exception as e:
+                    logging.error("GCP 서비스 계정 키 로딩 실패: %s", e)
+                    raise HTTPException(status_code=500, detail="GCP 설정 오류")
+                _bucket = storage_client.bucket(settings.GCS_BUCKET_NAME)
+    return _bucket
 
 def validate_file_size(file: UploadFile) -> None:
     """
@@ -50,19 +78,22 @@ def upload_file_to_gcs(file_object: UploadFile, destination_blob_name: str) -> s
         str: 업로드된 파일의 공개 URL
         
     Raises:
-        Exception: GCP 인증 정보 오류 또는 업로드 실패
+        HTTPException: GCP 인증 정보 오류 시 500 에러
+        Exception: 업로드 실패
     
     Note:
         - content_type 자동 설정
         - 반환 URL 형식: https://storage.googleapis.com/{bucket_name}/{blob_name}
     """
-    if credentials is None:
-        raise Exception("GCP 인증 정보가 올바르지 않습니다.")
+    bucket = get_bucket()
+    started = time.perf_counter()
     try:
         blob = bucket.blob(destination_blob_name)
         
         # 파일 업로드
         blob.upload_from_file(file_object.file, content_type=file_object.content_type)
+        UPLOAD_SECONDS.observe(time.perf_counter() - started, outcome="ok")
+        UPLOAD_BYTES.inc(file_object.size if file_object.size is not None else file_object.file.tell())
 
         # 이미지 파일은 항상 public-read로 전환
         try:
@@ -73,6 +104,7 @@ def upload_file_to_gcs(file_object: UploadFile, destination_blob_name: str) -> s
 
         return f"https://storage.googleapis.com/{settings.GCS_BUCKET_NAME}/{destination_blob_name}"
     except Exception as e:
+        UPLOAD_SECONDS.observe(time.perf_counter() - started, outcome="error")
         logging.error("GCS 파일 업로드 실패: %s", e)
         raise
 
@@ -173,7 +205,7 @@ def upload_profile_image(file: UploadFile, user_id: str, kind: str) -> str:
 
     # 프로필 이미지는 항상 public-read로 전환
     try:
-        blob = bucket.blob(dest)
+        blob = get_bucket().blob(dest)
         try:
             blob.make_public()
         except Exception:
@@ -1,10 +1,28 @@
 import os
-import httpx
+import re
+import time
+import asyncio
+import logging
+import jwt
+from typing import Dict, Any, Optional
+from services import oauth_http
 
 GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID")
 GOOGLE_CLIENT_SECRET = os.getenv("GOOGLE_CLIENT_SECRET")
 GOOGLE_REDIRECT_URI = os.getenv("GOOGLE_REDIRECT_URI")
 
+# id_token 로컬 검증용 설정
+GOOGLE_JWKS_URL = "https://www.googleapis.com/oauth2/v3/certs"
+GOOGLE_ISSUERS = ("https://accounts.google.com", "accounts.google.com")
+JWKS_DEFAULT_MAX_AGE_SECONDS = 60 * 60  # Cache-Control 헤더가 없을 때
+JWKS_MIN_REFRESH_INTERVAL_SECONDS = 60  # 모르는 kid로 인한 강제 갱신 최소 간격
+ID_TOKEN_LEEWAY_SECONDS = 60  # 시계 오차 허용
+
+_jwks_keys: Dict[str, Any] = {}  # kid -> 공개키
+_jwks_expires_at = 0.0
+_jwks_fetched_at = 0.0
+_jwks_lock = asyncio.Lock()
+
 
 def get_login_url(front_redirect: str = None):
     """
@@ -18,7 +36,7 @@ def get_login_url(front_redirect: str = None):
     
     Note:
         - front_redirect는 state 파라미터로 전달
-        - scope: email (이메일 주소만 요청)
+        - scope: openid email (이메일 주소 + 서명된 id_token 요청)
         - access_type: offline, prompt: consent (리프레시 토큰용)
         - 환경변수: GOOGLE_CLIENT_ID, GOOGLE_REDIRECT_URI 사용
     """
@@ -27,7 +45,7 @@ def get_login_url(front_redirect: str = None):
         f"client_id={GOOGLE_CLIENT_ID}",
         "response_type=code",
         f"redirect_uri={GOOGLE_REDIRECT_URI}",
-        "scope=email",
+        "scope=openid%20email",
         "access_type=offline",
         "prompt=consent"
     ]
@@ -38,20 +56,20 @@ def get_login_url(front_redirect: str = None):
     return "https://accounts.google.com/o/oauth2/v2/auth?" + "&".join(params)
 
 
-def get_access_token(code: str):
+async def exchange_code(code: str) -> dict:
     """
-    구글에서 액세스 토큰 받기
+    구글 인증 코드를 토큰으로 교환
     
     Args:
         code: 구글에서 받은 인증 코드
         
     Returns:
-        str: 구글 액세스 토큰
+        dict: 구글 토큰 응답 (access_token, id_token, expires_in 등)
     
     Note:
         - 환경변수: GOOGLE_CLIENT_ID, GOOGLE_CLIENT_SECRET, GOOGLE_REDIRECT_URI 사용
         - Content-Type: application/x-www-form-urlencoded
-        - 응답의 access_token 필드 반환
+        - 공용 커넥션 풀(oauth_http) 사용
     """
     token_url = "https://oauth2.googleapis.com/token"
     headers = {"Content-Type": "application/x-www-form-urlencoded"}
@@ -62,11 +80,27 @@ def get_access_token(code: str):
         "redirect_uri": GOOGLE_REDIRECT_URI,
         "grant_type": "authorization_code",
     }
-    response = httpx.post(token_url, data=data, headers=headers)
-    return response.json().get("access_token")
+    response = await oauth_http.request("google", "token", "POST", token_url, data=data, headers=headers)
+    return response.json()
+
+
+async def get_access_token(code: str):
+    """
+    구글에서 액세스 토큰 받기
+    
+    Args:
+        code: 구글에서 받은 인증 코드
+        
+    Returns:
+        str: 구글 액세스 토큰
+    
+    Note:
+        - exchange_code 응답의 access_token 필드 반환
+    """
+    return (await exchange_code(code)).get("access_token")
 
 
-def get_user_info(token: str):
+async def get_user_info(token: str):
     """
     구글 사용자 정보 조회
     
@@ -83,5 +117,114 @@ def get_user_info(token: str):
         - sub 필드가 사용자 ID (일부 응답에서는 id 필드)
     """
     headers = {"Authorization": f"Bearer {token}"}
-    response = httpx.get("https://www.googleapis.com/oauth2/v2/userinfo", headers=headers)
-    return response.json() 
\ No newline at end of file
+    response = await oauth_http.request("google", "userinfo", "GET", "https://www.googleapis.com/oauth2/v2/userinfo", headers=headers)
+    return response.json()
+
+
+async def get_user_info_from_tokens(tokens: dict) -> dict:
+    """
+    토큰 응답에서 구글 사용자 정보 추출
+    
+    Args:
+        tokens: exchange_code의 토큰 응답
+        
+    Returns:
+        dict: 구글 사용자 정보 (sub, email, name)
+    
+    Note:
+        - id_token이 있으면 캐시된 JWKS로 로컬 서명 검증 후 클레임 사용 (userinfo 호출 생략)
+        - id_token이 없거나 검증에 실패하면 userinfo 엔드포인트로 폴백
+    """
+    id_token = tokens.get("id_token")
+    if id_token:
+        try:
+            claims = await verify_id_token(id_token)
+            return {"sub": claims["sub"], "email": claims.get("email"), "name": claims.get("name")}
+        except Exception as e:
+            logging.warning(f"구글 id_token 로컬 검증 실패, userinfo로 폴백: {e}")
+    return await get_user_info(tokens.get("access_token"))
+
+
+async def verify_id_token(id_token: str) -> dict:
+    """
+    구글 id_token 로컬 검증
+    
+    Args:
+        id_token: 토큰 응답의 id_token (RS256 서명 JWT)
+        
+    Returns:
+        dict: 검증된 클레임 (sub, email, name 등)
+        
+    Raises:
+        jwt.PyJWTError: 서명, 만료, audience, issuer 검증 실패
+        ValueError: 서명 키(kid)를 찾을 수 없음
+    
+    Note:
+        - 서명 키는 구글 JWKS를 Cache-Control max-age 동안 캐싱하여 사용
+        - audience: GOOGLE_CLIENT_ID, issuer: accounts.google.com
+    """
+    kid = jwt.get_unverified_header(id_token).get("kid")
+    key = await _get_signing_key(kid)
+    claims = jwt.decode(
+        id_token,
+        key=key,
+        algorithms=["RS256"],
+        audience=GOOGLE_CLIENT_ID,
+        leeway=ID_TOKEN_LEEWAY_SECONDS,
+        options={"require": ["exp", "iat", "iss", "aud", "sub"]},
+    )
+    if claims.get("iss") not in GOOGLE_ISSUERS:
+        raise jwt.InvalidIssuerError(f"unexpected issuer: {claims.get('iss')}")
+    return claims
+
+
+async def _get_signing_key(kid: Optional[str]):
+    """kid에 해당하는 구글 공개키 반환 (만료 시 갱신, 모르는 kid면 최소 간격을 두고 강제 갱신)"""
+    now = time.monotonic()
+    if now >= _jwks_expires_at:
+        await _refresh_jwks()
+    if kid not in _jwks_keys and time.monotonic() - _jwks_fetched_at >= JWKS_MIN_REFRESH_INTERVAL_SECONDS:
+        await _refresh_jwks(force=True)
+    key = _jwks_keys.get(kid)
+    if key is None:
+        raise ValueError(f"unknown id_token kid: {kid}")
+    return key
+
+
+async def _refresh_jwks(force: bool = False) -> None:
+    """
+    구글 JWKS 갱신
+    
+    동시에 여러 로그인이 만료를 감지해도 한 번만 요청하며,
+    갱신에 실패하면 기존 키를 유지합니다 (구글 장애 시에도 로그인 유지).
+    """
+    global _jwks_keys, _jwks_expires_at, _jwks_fetched_at
+    async with _jwks_lock:
+        now = time.monotonic()
+        if not force and now < _jwks_expires_at:
+            return
+        if force and now - _jwks_fetched_at < JWKS_MIN_REFRESH_INTERVAL_SECONDS:
+            return
+        try:
+            response = await oauth_http.request("google", "jwks", "GET", GOOGLE_JWKS_URL)
+            response.raise_for_status()
+            keys = {}
+            for jwk in response.json().get("keys", []):
+                try:
+                    keys[jwk["kid"]] = jwt.PyJWK(jwk).key
+                except Exception as e:
+                    logging.warning(f"구글 JWKS 키 파싱 실패: {e}")
+            if keys:
+                _jwks_keys = keys
+            _jwks_fetched_at = now
+            _jwks_expires_at = now + _parse_max_age(response.headers.get("cache-control"))
+        except Exception as e:
+            logging.warning(f"구글 JWKS 갱신 실패 (기존 키 {len(_jwks_keys)}개 유지): {e}")
+            # 잠시 후 재시도 (매 로그인마다 재요청하지 않도록)
+            _jwks_fetched_at = now
+            _jwks_expires_at = now + JWKS_MIN_REFRESH_INTERVAL_SECONDS
+
+
+def _parse_max_age(cache_control: Optional[str]) -> int:
+    match = re.search(r"max-age=(\d+)", cache_control or "")
+    return int(match.group(1)) if match else JWKS_DEFAULT_MAX_AGE_SECONDS
@@ -0,0 +1,102 @@
+"""
+HTTP 요청 메트릭
+
+RequestMetricsMiddleware가 요청마다 처리 시간을 라우트 템플릿(/v1/posts/{post_id})과 응답 상태별
+히스토그램에 기록하고, 처리 중인 요청 수를 게이지로 유지합니다. (/metrics로 노출)
+
+라우트 템플릿을 라벨로 쓰므로 경로 파라미터 값이 라벨 수를 늘리지 않으며,
+매칭되지 않은 경로(404 등)는 하나의 라벨("unmatched")로 모읍니다.
+"""
+
+import time
+from typing import Dict
+
+from services import metrics
+
+# API 응답 기준 지연 버킷 (초)
+HTTP_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+REQUEST_SECONDS = metrics.histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간 (초, 응답 본문 전송 완료까지)", HTTP_LATENCY_BUCKETS
+)
+IN_FLIGHT = metrics.gauge("http_requests_in_flight", "처리 중인 HTTP 요청 수")
+
+UNMATCHED_ROUTE = "unmatched"
+
+# 라우트별 접두사 (APIRouter prefix, include_router prefix) 캐시
+_route_prefixes: Dict[int, str] = {}
+
+
+def route_template(scope) -> str:
+    """
+    요청이 매칭된 라우트의 전체 경로 템플릿
+
+    Args:
+        scope: ASGI scope (라우팅 이후)
+
+    Returns:
+        str: 예) "/v1/posts/{post_id}", 매칭된 라우트가 없으면 "unmatched"
+
+    Note:
+        - 포함된 라우터의 route.path는 접두사를 제외한 경로일 수 있으므로,
+          실제 경로에서 라우트 정규식이 매칭되는 위치로 접두사를 구해 붙임 (라우트별 캐시)
+    """
+    route = scope.get("route")
+    template = getattr(route, "path", None)
+    if not template:
+        return UNMATCHED_ROUTE
+    path = scope.get("path", "")
+    regex = getattr(route, "path_regex", None)
+    if regex is None:
+        return template
+
+    prefix = _route_prefixes.get(id(route))
+    if prefix is not None and path.startswith(prefix) and regex.match(path[len(prefix):]):
+        return prefix + template
+    if regex.match(path):
+        prefix = ""
+    else:
+        prefix = None
+        index = path.find("/", 1)
+        while index != -1:
+            if regex.match(path[index:]):
+                prefix = path[:index]
+                break
+            index = path.find("/", index + 1)
+        if prefix is None:
+            return template
+    _route_prefixes[id(route)] = prefix
+    return prefix + template
+
+
+class RequestMetricsMiddleware:
+    """요청 처리 시간(라우트/메서드/상태별)과 처리 중 요청 수를 기록하는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            IN_FLIGHT.dec()
+            REQUEST_SECONDS.observe(
+                time.perf_counter() - started,
+                method=scope["method"],
+                route=route_template(scope),
+                status=status_code,
+            )
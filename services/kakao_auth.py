@@ -1,5 +1,6 @@
 import os, httpx
 from fastapi import HTTPException
+from services import oauth_http
 
 def get_login_url(front_redirect: str = None):
     """
@@ -32,7 +33,7 @@ def get_login_url(front_redirect: str = None):
     query_string = urlencode(params)
     return f"https://kauth.kakao.com/oauth/authorize?{query_string}"
 
-def get_access_token(code: str):
+async def get_access_token(code: str):
     """
     카카오에서 액세스 토큰 받기
     
@@ -49,7 +50,7 @@ def get_access_token(code: str):
     
     Note:
         - 환경변수: KAKAO_CLIENT_ID, KAKAO_CLIENT_SECRET, KAKAO_REDIRECT_URI 사용
-        - 10초 타임아웃 설정
+        - 공용 커넥션 풀(oauth_http) 사용, 타임아웃은 settings.OAUTH_HTTP_* 설정
     """
     url = "https://kauth.kakao.com/oauth/token"
     data = {
@@ -61,7 +62,7 @@ def get_access_token(code: str):
     }
     
     try:
-        response = httpx.post(url, data=data, timeout=10.0)
+        response = await oauth_http.request("kakao", "token", "POST", url, data=data)
         if response.status_code != 200:
             raise HTTPException(400, f"카카오 토큰 요청 실패: {response.text}")
         
@@ -73,7 +74,7 @@ def get_access_token(code: str):
     except httpx.RequestError as e:
         raise HTTPException(500, f"카카오 토큰 요청 중 오류: {str(e)}")
 
-def get_user_info(token: str):
+async def get_user_info(token: str):
     """
     카카오 사용자 정보 조회
     
@@ -92,12 +93,12 @@ def get_user_info(token: str):
     
     Note:
         - 카카오 API v2 사용 (/v2/user/me)
-        - 10초 타임아웃 설정
+        - 공용 커넥션 풀(oauth_http) 사용, 타임아웃은 settings.OAUTH_HTTP_* 설정
     """
     headers = {"Authorization": f"Bearer {token}"}
     
     try:
-        response = httpx.get("https://kapi.kakao.com/v2/user/me", headers=headers, timeout=10.0)
+        response = await oauth_http.request("kakao", "userinfo", "GET", "https://kapi.kakao.com/v2/user/me", headers=headers)
         if response.status_code != 200:
             raise HTTPException(400, f"카카오 사용자 정보 요청 실패: {response.text}")
         
@@ -1,25 +1,24 @@
+import importlib.util
 import logging
 import queue
 from typing import Optional
 from logging.handlers import QueueHandler
 import os
 
-# Optional Redis imports (graceful fallback when redis is unavailable)
-try:
-    import redis  # sync client for logging handler publish
-except Exception:  # pragma: no cover
-    redis = None  # type: ignore
-
-try:
-    import redis.asyncio as aioredis  # async client for SSE subscriber
-except Exception:  # pragma: no cover
-    aioredis = None  # type: ignore
+from services import metrics
 
 REDIS_URL: Optional[str] = os.getenv("REDIS_URL")
 
 
 log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue()
 
+SSE_SUBSCRIBERS = metrics.gauge("sse_subscribers", "연결된 로그 스트림(SSE) 구독자 수")
+
+
+def _redis_installed() -> bool:
+    # Optional Redis dependency: check availability without importing it at startup
+    return importlib.util.find_spec("redis") is not None
+
 
 def ensure_queue_handler() -> queue.Queue:
     root_logger = logging.getLogger()
@@ -33,25 +32,32 @@ def ensure_queue_handler() -> queue.Queue:
 class RedisLogHandler(logging.Handler):
     """
     Logging handler that publishes formatted records to a Redis Pub/Sub channel.
+    The Redis client is created on the first emitted record.
     """
 
     def __init__(self, channel: str = "app_logs"):
         super().__init__()
         self.channel = channel
         self._client = None
-        if redis and REDIS_URL:
+        self._client_failed = False
+
+    def _get_client(self):
+        if self._client is None and not self._client_failed and REDIS_URL:
             try:
+                import redis  # sync client for logging handler publish
                 self._client = redis.from_url(REDIS_URL, decode_responses=True)
             except Exception:
-                self._client = None
+                self._client_failed = True
+        return self._client
 
     def emit(self, record: logging.LogRecord) -> None:  # pragma: no cover
-        if not self._client:
+        client = self._get_client()
+        if not client:
             return
         try:
             line = format_record(record)
             # Publish as plain text line; subscriber will wrap as SSE
-            self._client.publish(self.channel, line)
+            client.publish(self.channel, line)
         except Exception:
             # Do not raise from logging handler
             pass
@@ -62,7 +68,7 @@ def ensure_redis_handler(channel: str = "app_logs") -> bool:
     Attach RedisLogHandler to root logger if REDIS_URL and redis are available.
     Returns True when attached/available, False otherwise.
     """
-    if not (REDIS_URL and redis):
+    if not (REDIS_URL and _redis_installed()):
         return False
 
     root_logger = logging.getLogger()
@@ -89,9 +95,26 @@ async def sse_event_stream(channel: str = "app_logs"):
     - In-process queue fallback (single-worker scenarios)
 
     It also emits periodic comment pings to keep the connection alive.
+    Connected subscribers are counted in the sse_subscribers gauge.
     """
+    SSE_SUBSCRIBERS.inc(channel=channel)
+    try:
+        async for line in _sse_event_stream(channel):
+            yield line
+    finally:
+        SSE_SUBSCRIBERS.dec(channel=channel)
+
+
+async def _sse_event_stream(channel: str):
     # Prefer Redis when available
-    if REDIS_URL and aioredis:
+    aioredis = None
+    if REDIS_URL:
+        try:
+            import redis.asyncio as aioredis  # async client for SSE subscriber
+        except Exception:  # pragma: no cover
+            aioredis = None
+
+    if aioredis:
         import asyncio
         client = aioredis.from_url(REDIS_URL, decode_responses=True)
         pubsub = client.pubsub()
@@ -0,0 +1,295 @@
+"""
+프로세스 내 메트릭 (카운터, 게이지, 히스토그램)
+
+외부 의존성 없이 요청 경로에서 가볍게 기록하고, /internal/metrics(JSON)와 /metrics(Prometheus 텍스트)로 조회합니다.
+값은 워커 프로세스별로 집계됩니다 (워커 간 합산은 수집 측에서 처리).
+
+기록은 스레드별 샤드에 하므로 요청 경로에서 락을 잡지 않습니다 (새 스레드의 첫 기록 시에만 샤드 등록).
+조회 시 샤드를 합산하며, 기록 중인 값과 약간 어긋날 수 있습니다.
+스레드가 끝나면 그 스레드의 샤드는 종료 스레드 합계에 합쳐지고 목록에서 제거됩니다 (스레드가 계속 바뀌어도 샤드가 쌓이지 않음).
+
+사용 예:
+    OAUTH_LATENCY = metrics.histogram("oauth_request_seconds", "소셜 로그인 제공자 호출 지연")
+    OAUTH_LATENCY.observe(0.12, provider="kakao", operation="token")
+"""
+
+import bisect
+import math
+import threading
+import weakref
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# 외부 HTTP 호출 기준 지연 버킷 (초)
+DEFAULT_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, str]) -> LabelKey:
+    if not labels:
+        return ()
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+class _ShardHolder:
+    """스레드별 샤드 보관 (thread-local에만 저장 - 스레드 종료 시 정리되어 finalize 실행)"""
+
+    __slots__ = ("shard", "__weakref__")
+
+    def __init__(self):
+        self.shard: dict = {}
+
+
+class _Sharded:
+    """스레드별 샤드(dict) 관리 - 샤드는 해당 스레드만 쓰고, 조회 시 전체를 합산"""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards: List[dict] = []
+        self._retired: dict = {}  # 종료된 스레드의 샤드 합계
+        self._shards_lock = threading.Lock()
+
+    def _shard(self) -> dict:
+        holder = getattr(self._local, "holder", None)
+        if holder is None:
+            holder = self._local.holder = _ShardHolder()
+            with self._shards_lock:
+                self._shards.append(holder.shard)
+            weakref.finalize(holder, self._retire, holder.shard)
+        return holder.shard
+
+    def _retire(self, shard: dict) -> None:
+        # 스레드 종료 후 호출되므로 shard에 더 이상 기록되지 않음
+        with self._shards_lock:
+            self._merge(self._retired, shard)
+            for i, s in enumerate(self._shards):
+                if s is shard:
+                    del self._shards[i]
+                    break
+
+    def _all_shards(self) -> List[dict]:
+        with self._shards_lock:
+            return [self._merge({}, self._retired)] + self._shards
+
+    @staticmethod
+    def _merge(target: dict, shard: dict) -> dict:
+        """shard 값을 target에 더함 (하위 클래스별 값 형식)"""
+        raise NotImplementedError
+
+    def values(self) -> dict:
+        merged: dict = {}
+        for shard in self._all_shards():
+            self._merge(merged, shard)
+        return merged
+
+
+class Counter(_Sharded):
+    """라벨별 누적 카운터"""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, description: str):
+        super().__init__()
+        self.name = name
+        self.description = description
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        shard = self._shard()
+        key = _label_key(labels)
+        shard[key] = shard.get(key, 0) + amount
+
+    @staticmethod
+    def _merge(target: dict, shard: dict) -> dict:
+        for key, value in list(shard.items()):
+            target[key] = target.get(key, 0) + value
+        return target
+
+    def snapshot(self) -> List[dict]:
+        return [{"labels": dict(key), "value": value} for key, value in self.values().items()]
+
+
+class Gauge(Counter):
+    """
+    라벨별 현재 값 (inc/dec로 증감, 예: 처리 중인 요청 수)
+
+    callback을 주면 기록 대신 조회 시점에 callback()이 반환한 [(라벨 dict, 값), ...]을 사용합니다
+    (예: 커넥션 풀 상태처럼 다른 곳에 이미 있는 값).
+    """
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, description: str, callback: Optional[Callable[[], Iterable[Tuple[dict, float]]]] = None):
+        super().__init__(name, description)
+        self.callback = callback
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def values(self) -> Dict[LabelKey, float]:
+        if self.callback is None:
+            return super().values()
+        return {_label_key(labels): value for labels, value in self.callback()}
+
+
+class Histogram(_Sharded):
+    """라벨별 히스토그램 (버킷 카운트, 합계, 근사 분위수)"""
+
+    type_name = "histogram"
+
+    def __init__(self, name: str, description: str, buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS):
+        super().__init__()
+        self.name = name
+        self.description = description
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        shard = self._shard()
+        key = _label_key(labels)
+        state = shard.get(key)
+        if state is None:
+            # [버킷별 카운트..., +Inf 카운트, 합계]
+            state = shard[key] = [0] * (len(self.buckets) + 1) + [0.0]
+        state[bisect.bisect_left(self.buckets, value)] += 1
+        state[-1] += value
+
+    @staticmethod
+    def _merge(target: dict, shard: dict) -> dict:
+        for key, state in list(shard.items()):
+            state = list(state)
+            total = target.get(key)
+            if total is None:
+                target[key] = state
+            else:
+                for i, v in enumerate(state):
+                    total[i] += v
+        return target
+
+    def snapshot(self) -> List[dict]:
+        result = []
+        for key, state in self.values().items():
+            counts, total = state[:-1], state[-1]
+            count = sum(counts)
+            result.append({
+                "labels": dict(key),
+                "count": count,
+                "sum": round(total, 6),
+                "avg": round(total / count, 6) if count else None,
+                "p50": self._quantile(counts, count, 0.50),
+                "p95": self._quantile(counts, count, 0.95),
+                "p99": self._quantile(counts, count, 0.99),
+                "buckets": {
+                    **{str(bound): c for bound, c in zip(self.buckets, self._cumulative(counts))},
+                    "+Inf": count,
+                },
+            })
+        return result
+
+    @staticmethod
+    def _cumulative(counts: List[int]) -> List[int]:
+        running, result = 0, []
+        for c in counts:
+            running += c
+            result.append(running)
+        return result
+
+    def _quantile(self, counts: List[int], count: int, q: float):
+        """분위수가 속한 버킷의 상한 (마지막 버킷을 넘으면 "+Inf")"""
+        if not count:
+            return None
+        target = q * count
+        running = 0
+        for bound, c in zip(self.buckets, counts):
+            running += c
+            if running >= target:
+                return bound
+        return "+Inf"
+
+
+_registry: Dict[str, object] = {}
+_registry_lock = threading.Lock()
+
+
+def _register(name: str, factory: Callable[[], object]):
+    with _registry_lock:
+        if name not in _registry:
+            _registry[name] = factory()
+        return _registry[name]
+
+
+def counter(name: str, description: str) -> Counter:
+    """이름으로 카운터 생성 또는 기존 카운터 반환"""
+    return _register(name, lambda: Counter(name, description))  # type: ignore[return-value]
+
+
+def gauge(name: str, description: str, callback: Optional[Callable[[], Iterable[Tuple[dict, float]]]] = None) -> Gauge:
+    """이름으로 게이지 생성 또는 기존 게이지 반환 (callback: 조회 시점 값 계산 함수)"""
+    return _register(name, lambda: Gauge(name, description, callback))  # type: ignore[return-value]
+
+
+def histogram(name: str, description: str, buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS) -> Histogram:
+    """이름으로 히스토그램 생성 또는 기존 히스토그램 반환"""
+    return _register(name, lambda: Histogram(name, description, buckets))  # type: ignore[return-value]
+
+
+def _registered() -> list:
+    with _registry_lock:
+        return list(_registry.values())
+
+
+def snapshot() -> dict:
+    """등록된 모든 메트릭의 현재 값"""
+    return {
+        m.name: {"description": m.description, "type": m.type_name, "values": m.snapshot()}
+        for m in _registered()
+    }
+
+
+# ----- Prometheus 텍스트 포맷 (exposition format 0.0.4) -----
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(key: LabelKey, extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+    pairs = key + extra
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, float):
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        if value.is_integer():
+            return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def render_prometheus() -> str:
+    """
+    등록된 모든 메트릭을 Prometheus 텍스트 포맷으로 변환
+
+    Returns:
+        str: exposition format 0.0.4 텍스트 (PROMETHEUS_CONTENT_TYPE으로 응답)
+    """
+    lines: List[str] = []
+    for m in _registered():
+        lines.append(f"# HELP {m.name} {_escape(m.description)}")
+        lines.append(f"# TYPE {m.name} {m.type_name}")
+        if isinstance(m, Histogram):
+            for key, state in m.values().items():
+                counts, total = state[:-1], state[-1]
+                for bound, cumulative in zip(m.buckets, m._cumulative(counts)):
+                    lines.append(f"{m.name}_bucket{_format_labels(key, (('le', _format_value(float(bound))),))} {cumulative}")
+                count = sum(counts)
+                lines.append(f"{m.name}_bucket{_format_labels(key, (('le', '+Inf'),))} {count}")
+                lines.append(f"{m.name}_sum{_format_labels(key)} {_format_value(float(total))}")
+                lines.append(f"{m.name}_count{_format_labels(key)} {count}")
+        else:
+            for key, value in m.values().items():
+                lines.append(f"{m.name}{_format_labels(key)} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,162 @@
+"""
+DB 스키마 마이그레이션
+
+배포마다 한 번 `python update_db.py`로 실행합니다. 워커 기동 시에는 스키마를 조회하지 않습니다
+(RUN_MIGRATIONS_ON_STARTUP=true일 때만 startup에서 실행).
+
+- 적용된 버전은 schema_version 테이블에 기록되고, 아직 적용되지 않은 마이그레이션만 버전 순서대로 실행됩니다.
+- 각 마이그레이션은 자체 트랜잭션에서 실행되며 버전 기록과 함께 커밋됩니다.
+- 여러 프로세스가 동시에 실행해도 advisory lock으로 한 곳에서만 적용됩니다.
+- 마이그레이션 본문은 멱등하게 작성합니다 (기존 스키마가 일부 반영된 DB에 처음 도입해도 안전하도록).
+
+새 마이그레이션은 MIGRATIONS 끝에 다음 버전 번호로 추가합니다. 적용된 마이그레이션은 수정하지 않습니다.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, List, Set
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+from database import Base
+
+# pg_advisory_lock 키 (프로젝트 고유 임의 상수)
+MIGRATION_LOCK_KEY = 4_204_190_040
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    description: str
+    apply: Callable[[Connection], None]
+
+
+def _create_tables(conn: Connection) -> None:
+    # 없는 테이블만 생성 (기존 테이블의 컬럼/인덱스는 변경하지 않음)
+    Base.metadata.create_all(bind=conn)
+
+
+def _add_users_user_id(conn: Connection) -> None:
+    conn.execute(text("ALTER TABLE users ADD COLUMN IF NOT EXISTS user_id VARCHAR(100) UNIQUE"))
+
+
+def _widen_posts_image_url(conn: Connection) -> None:
+    conn.execute(text("ALTER TABLE posts ALTER COLUMN image_url TYPE VARCHAR(500)"))
+
+
+def _posts_user_id_to_varchar(conn: Connection) -> None:
+    # 정수형 → 소셜 user_id 문자열
+    conn.execute(text("ALTER TABLE posts ALTER COLUMN user_id TYPE VARCHAR(100) USING user_id::text"))
+
+
+def _posts_deadline_to_timestamp(conn: Connection) -> None:
+    # 과거 DATE였던 스키마 호환
+    conn.execute(text(
+        "ALTER TABLE posts ALTER COLUMN deadline TYPE TIMESTAMP WITHOUT TIME ZONE USING deadline::timestamp"
+    ))
+
+
+def _posts_views_not_null(conn: Connection) -> None:
+    conn.execute(text("ALTER TABLE posts ADD COLUMN IF NOT EXISTS views INTEGER NOT NULL DEFAULT 0"))
+    conn.execute(text("UPDATE posts SET views = 0 WHERE views IS NULL"))
+    conn.execute(text("ALTER TABLE posts ALTER COLUMN views SET DEFAULT 0, ALTER COLUMN views SET NOT NULL"))
+
+
+def _users_email_nullable(conn: Connection) -> None:
+    conn.execute(text("ALTER TABLE users ALTER COLUMN email DROP NOT NULL"))
+
+
+def _applications_keyset_index(conn: Connection) -> None:
+    # create_all은 기존 테이블에 인덱스를 추가하지 않음
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS idx_applications_post_created ON applications (post_id, created_at, id)"
+    ))
+
+
+def _users_version(conn: Connection) -> None:
+    conn.execute(text("ALTER TABLE users ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 0"))
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "create tables", _create_tables),
+    Migration(2, "users.user_id column", _add_users_user_id),
+    Migration(3, "posts.image_url VARCHAR(500)", _widen_posts_image_url),
+    Migration(4, "posts.user_id VARCHAR(100)", _posts_user_id_to_varchar),
+    Migration(5, "posts.deadline TIMESTAMP", _posts_deadline_to_timestamp),
+    Migration(6, "posts.views NOT NULL DEFAULT 0", _posts_views_not_null),
+    Migration(7, "users.email nullable", _users_email_nullable),
+    Migration(8, "idx_applications_post_created", _applications_keyset_index),
+    Migration(9, "users.version column", _users_version),
+]
+
+
+def _ensure_version_table(conn: Connection) -> None:
+    conn.execute(text("""
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            description VARCHAR(255) NOT NULL,
+            applied_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+        )
+    """))
+
+
+def _applied_versions(conn: Connection) -> Set[int]:
+    return {row[0] for row in conn.execute(text("SELECT version FROM schema_version"))}
+
+
+def pending_migrations(engine: Engine) -> List[Migration]:
+    """
+    아직 적용되지 않은 마이그레이션 목록을 반환합니다.
+
+    Args:
+        engine: 대상 DB 엔진
+
+    Returns:
+        List[Migration]: 버전 순으로 정렬된 미적용 마이그레이션
+    """
+    with engine.begin() as conn:
+        _ensure_version_table(conn)
+        applied = _applied_versions(conn)
+    return [m for m in sorted(MIGRATIONS, key=lambda m: m.version) if m.version not in applied]
+
+
+def run_migrations(engine: Engine) -> List[Migration]:
+    """
+    미적용 마이그레이션을 버전 순서대로 적용합니다.
+
+    Args:
+        engine: 대상 DB 엔진
+
+    Returns:
+        List[Migration]: 이번 실행에서 적용된 마이그레이션
+
+    Raises:
+        Exception: 마이그레이션 실패 시 (실패한 마이그레이션은 롤백되고 이후 마이그레이션은 실행되지 않음)
+
+    Note:
+        advisory lock을 잡은 뒤 적용 여부를 다시 확인하므로, 동시에 실행된 다른 프로세스가
+        먼저 적용한 마이그레이션은 건너뜁니다.
+    """
+    applied_now: List[Migration] = []
+    with engine.connect() as conn:
+        conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+        conn.commit()
+        try:
+            with conn.begin():
+                _ensure_version_table(conn)
+                applied = _applied_versions(conn)
+
+            for migration in sorted(MIGRATIONS, key=lambda m: m.version):
+                if migration.version in applied:
+                    continue
+                with conn.begin():
+                    migration.apply(conn)
+                    conn.execute(
+                        text("INSERT INTO schema_version (version, description) VALUES (:version, :description)"),
+                        {"version": migration.version, "description": migration.description},
+                    )
+                applied_now.append(migration)
+        finally:
+            conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY})
+            conn.commit()
+    return applied_now
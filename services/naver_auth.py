@@ -1,6 +1,6 @@
 import os
-import httpx
 import secrets
+from services import oauth_http
 
 NAVER_CLIENT_ID = os.getenv("NAVER_CLIENT_ID")
 NAVER_CLIENT_SECRET = os.getenv("NAVER_CLIENT_SECRET")
@@ -31,7 +31,7 @@ def get_login_url(front_redirect: str = None):
         f"&state={state}"
     )
 
-def get_access_token(code: str, state: str):
+async def get_access_token(code: str, state: str):
     """
     네이버에서 액세스 토큰 받기
     
@@ -45,6 +45,7 @@ def get_access_token(code: str, state: str):
     Note:
         - 환경변수: NAVER_CLIENT_ID, NAVER_CLIENT_SECRET 사용
         - 응답의 access_token 필드 반환
+        - 공용 커넥션 풀(oauth_http) 사용
     """
     token_url = "https://nid.naver.com/oauth2.0/token"
     params = {
@@ -55,10 +56,10 @@ def get_access_token(code: str, state: str):
         "state": state,
     }
 
-    response = httpx.post(token_url, params=params)
+    response = await oauth_http.request("naver", "token", "POST", token_url, params=params)
     return response.json().get("access_token")
 
-def get_user_info(token: str):
+async def get_user_info(token: str):
     """
     네이버 사용자 정보 조회
     
@@ -75,5 +76,5 @@ def get_user_info(token: str):
         - response 필드만 반환하여 직접 사용 가능
     """
     headers = {"Authorization": f"Bearer {token}"}
-    response = httpx.get("https://openapi.naver.com/v1/nid/me", headers=headers)
+    response = await oauth_http.request("naver", "userinfo", "GET", "https://openapi.naver.com/v1/nid/me", headers=headers)
     return response.json().get("response")  # 실제 사용자 정보는 'response' 키에 들어있음 
\ No newline at end of file
@@ -0,0 +1,162 @@
+"""
+소셜 로그인 제공자별 공용 비동기 HTTP 클라이언트
+
+제공자(kakao, naver, google)마다 httpx.AsyncClient 하나를 앱 시작 시 만들어 재사용합니다.
+- keep-alive 커넥션 풀로 로그인마다 새 TLS 연결을 맺지 않음
+- h2 패키지가 있으면 HTTP/2 사용
+- 타임아웃/풀 크기는 settings.OAUTH_HTTP_* 로 설정
+- 앱 종료 시 shutdown()으로 모든 커넥션 정리
+
+제공자 API 호출은 request()를 통해 수행합니다.
+- 제공자/작업별 지연 히스토그램, 결과별 카운터 기록 (/internal/metrics)
+- 제공자별 서킷 브레이커: 연속 실패(타임아웃, 네트워크 오류, 5xx) 시 일정 시간 즉시 503
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict
+
+import httpx
+
+from config import settings
+from exceptions import ServiceUnavailableError
+from services import metrics
+from services.circuit_breaker import CircuitBreaker
+
+PROVIDERS = ("kakao", "naver", "google")
+
+try:
+    import h2  # noqa: F401  (httpx[http2])
+    HTTP2_AVAILABLE = True
+except Exception:  # pragma: no cover
+    HTTP2_AVAILABLE = False
+
+_clients: Dict[str, httpx.AsyncClient] = {}
+
+_breakers: Dict[str, CircuitBreaker] = {
+    provider: CircuitBreaker(
+        provider,
+        failure_threshold=settings.OAUTH_CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout_seconds=settings.OAUTH_CIRCUIT_RESET_SECONDS,
+    )
+    for provider in PROVIDERS
+}
+
+REQUEST_LATENCY = metrics.histogram("oauth_request_seconds", "소셜 로그인 제공자 API 호출 지연 (초)")
+REQUEST_TOTAL = metrics.counter("oauth_requests_total", "소셜 로그인 제공자 API 호출 수 (결과별)")
+
+# 서킷 브레이커 실패로 집계하는 결과 (cancelled, exception은 제공자 문제가 아니므로 제외)
+_FAILURE_OUTCOMES = {"timeout", "error", "http_5xx"}
+
+
+def _build_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        timeout=httpx.Timeout(
+            settings.OAUTH_HTTP_TIMEOUT_SECONDS,
+            connect=settings.OAUTH_HTTP_CONNECT_TIMEOUT_SECONDS,
+        ),
+        limits=httpx.Limits(
+            max_connections=settings.OAUTH_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.OAUTH_HTTP_MAX_CONNECTIONS,
+            keepalive_expiry=settings.OAUTH_HTTP_KEEPALIVE_SECONDS,
+        ),
+    )
+
+
+def get_client(provider: str) -> httpx.AsyncClient:
+    """
+    제공자별 공용 AsyncClient 반환
+    
+    Args:
+        provider: 소셜 로그인 제공자 ("kakao", "naver", "google")
+        
+    Returns:
+        httpx.AsyncClient: 커넥션 풀을 공유하는 클라이언트
+    
+    Note:
+        - 보통 startup()에서 미리 생성되며, 시작 이벤트 없이 사용되는 경우(스크립트 등)를 위해 지연 생성도 지원
+    """
+    client = _clients.get(provider)
+    if client is None or client.is_closed:
+        client = _clients[provider] = _build_client()
+    return client
+
+
+async def request(provider: str, operation: str, method: str, url: str, **kwargs) -> httpx.Response:
+    """
+    제공자 API 호출 (계측 + 서킷 브레이커)
+    
+    Args:
+        provider: 소셜 로그인 제공자 ("kakao", "naver", "google")
+        operation: 메트릭 라벨용 작업 이름 (예: "token", "userinfo")
+        method: HTTP 메서드
+        url: 요청 URL
+        **kwargs: httpx 요청 인자 (data, params, headers 등)
+        
+    Returns:
+        httpx.Response: 제공자 응답 (4xx 응답도 그대로 반환)
+        
+    Raises:
+        ServiceUnavailableError: 서킷이 열려 있음 (503)
+        httpx.RequestError: 타임아웃/네트워크 오류
+    
+    Note:
+        - 타임아웃, 네트워크 오류(httpx.RequestError), 5xx 응답을 실패로 집계 (4xx는 잘못된 인증 코드 등 요청 문제이므로 제외)
+        - 요청 취소(클라이언트 연결 종료 등)는 "cancelled", 그 밖의 예외는 "exception"으로 기록하고 실패로 집계하지 않음
+        - 연속 실패가 OAUTH_CIRCUIT_FAILURE_THRESHOLD에 도달하면 OAUTH_CIRCUIT_RESET_SECONDS 동안 즉시 실패
+    """
+    breaker = _breakers[provider]
+    if not breaker.allow():
+        REQUEST_TOTAL.inc(provider=provider, operation=operation, outcome="circuit_open")
+        raise ServiceUnavailableError(f"{provider} 로그인 서버가 응답하지 않습니다. 잠시 후 다시 시도해주세요.")
+
+    outcome = "exception"
+    start = time.perf_counter()
+    try:
+        response = await get_client(provider).request(method, url, **kwargs)
+        outcome = "http_5xx" if response.status_code >= 500 else "ok"
+        return response
+    except httpx.TimeoutException:
+        outcome = "timeout"
+        raise
+    except httpx.RequestError:
+        outcome = "error"
+        raise
+    except asyncio.CancelledError:
+        outcome = "cancelled"
+        raise
+    finally:
+        REQUEST_LATENCY.observe(time.perf_counter() - start, provider=provider, operation=operation)
+        REQUEST_TOTAL.inc(provider=provider, operation=operation, outcome=outcome)
+        if outcome == "ok":
+            breaker.record_success()
+        elif outcome not in _FAILURE_OUTCOMES:
+            breaker.record_ignored()
+        else:
+            breaker.record_failure()
+            if breaker.state()["state"] != CircuitBreaker.CLOSED:
+                logging.warning(f"OAuth 서킷 open ({provider}/{operation}, 마지막 결과: {outcome})")
+
+
+def breaker_states() -> Dict[str, dict]:
+    """제공자별 서킷 브레이커 상태 (메트릭 조회용)"""
+    return {provider: breaker.state() for provider, breaker in _breakers.items()}
+
+
+async def startup() -> None:
+    """앱 시작 시 제공자별 클라이언트 생성"""
+    for provider in PROVIDERS:
+        get_client(provider)
+    logging.info(f"OAuth HTTP 클라이언트 준비 완료 (http2={HTTP2_AVAILABLE})")
+
+
+async def shutdown() -> None:
+    """앱 종료 시 제공자별 클라이언트 종료"""
+    for provider, client in list(_clients.items()):
+        try:
+            await client.aclose()
+        except Exception as e:
+            logging.warning(f"OAuth HTTP 클라이언트 종료 실패({provider}): {e}")
+    _clients.clear()
@@ -0,0 +1,153 @@
+"""
+블로킹 작업 오프로드 (이벤트 루프 밖 스레드에서 실행)
+
+async 라우트 안에서 동기 SQLAlchemy Session 조회나 GCS 업로드 같은 블로킹 I/O를 그대로 호출하면
+워커의 이벤트 루프 전체가 멈춥니다. 전체 비동기 전환 전까지 이런 구간을 풀별 동시 실행 한도가 있는
+스레드에서 실행합니다.
+
+- 풀: "db"(동기 Session 작업), "gcs"(파일 업로드), "redis"(동기 Redis 호출) - 풀마다 동시 실행 수를 따로 제한해
+  느린 업로드가 DB 작업 스레드를 모두 차지하지 않게 합니다. (Starlette 기본 스레드풀 한도와도 별개)
+- 계측: 풀별 대기 시간/실행 시간 히스토그램, 실행 중/대기 중 작업 수 게이지 (/metrics)
+- ContextVar(요청별 쿼리 계측 등)는 실행 스레드로 전달됩니다. (anyio.to_thread)
+
+사용 예:
+    # 라우트 전체 (동기 Session 의존성을 쓰는 핸들러)
+    @router.get("/notices")
+    @offload.blocking()
+    def get_notices(db: Session = Depends(get_read_db)): ...
+
+    # 일부 구간만
+    url = await offload.run_blocking(upload_file_to_gcs, file, blob_name, pool="gcs")
+
+    # 동기 Redis 호출 (Redis가 없으면 스레드 전환 없이 바로 실행)
+    version = await offload.run_redis(user_cache.get_user_version, sub)
+"""
+
+import functools
+import time
+from typing import Callable, Dict, TypeVar
+
+import anyio
+import anyio.to_thread
+
+from config import settings
+from services import metrics
+from services.redis_client import get_redis
+
+T = TypeVar("T")
+
+# 풀 이름 -> 동시 실행 한도
+POOL_SIZES = {
+    "db": settings.OFFLOAD_DB_THREADS,
+    "gcs": settings.OFFLOAD_GCS_THREADS,
+    "redis": settings.OFFLOAD_REDIS_THREADS,
+}
+
+WAIT_SECONDS = metrics.histogram(
+    "offload_wait_seconds", "오프로드 작업이 실행 슬롯을 얻기까지 대기한 시간 (초, 풀별)",
+    (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+RUN_SECONDS = metrics.histogram("offload_run_seconds", "오프로드 작업 실행 시간 (초, 풀별)")
+IN_FLIGHT = metrics.gauge("offload_in_flight", "스레드에서 실행 중인 오프로드 작업 수 (풀별)")
+WAITING = metrics.gauge("offload_waiting", "실행 슬롯을 기다리는 오프로드 작업 수 (풀별)")
+
+# 이벤트 루프 안에서 처음 사용할 때 생성 (워커 프로세스별)
+_limiters: Dict[str, anyio.CapacityLimiter] = {}
+
+
+def _limiter(pool: str) -> anyio.CapacityLimiter:
+    limiter = _limiters.get(pool)
+    if limiter is None:
+        if pool not in POOL_SIZES:
+            raise ValueError(f"알 수 없는 오프로드 풀: {pool}")
+        limiter = _limiters[pool] = anyio.CapacityLimiter(POOL_SIZES[pool])
+    return limiter
+
+
+async def run_blocking(func: Callable[..., T], *args, pool: str = "db", **kwargs) -> T:
+    """
+    블로킹 함수를 풀 한도 안에서 스레드로 실행
+
+    Args:
+        func: 실행할 동기 함수
+        *args, **kwargs: func 인자
+        pool: 오프로드 풀 이름 ("db" | "gcs" | "redis")
+
+    Returns:
+        func의 반환값 (예외도 그대로 전파)
+
+    Note:
+        - 요청이 취소되어도 이미 시작된 작업은 끝까지 실행됩니다 (Session 상태 보호)
+    """
+    limiter = _limiter(pool)
+    queued = time.perf_counter()
+    WAITING.inc(pool=pool)
+    started = None
+
+    def call():
+        nonlocal started
+        started = time.perf_counter()
+        WAITING.dec(pool=pool)
+        WAIT_SECONDS.observe(started - queued, pool=pool)
+        IN_FLIGHT.inc(pool=pool)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            IN_FLIGHT.dec(pool=pool)
+            RUN_SECONDS.observe(time.perf_counter() - started, pool=pool)
+
+    try:
+        return await anyio.to_thread.run_sync(call, limiter=limiter)
+    finally:
+        if started is None:
+            # 슬롯을 얻기 전에 취소됨
+            WAITING.dec(pool=pool)
+
+
+async def run_redis(func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    동기 Redis 클라이언트를 쓰는 함수를 "redis" 풀에서 실행
+
+    Args:
+        func: 실행할 동기 함수 (get_redis()가 None이면 Redis 호출 없이 반환해야 함)
+        *args, **kwargs: func 인자
+
+    Returns:
+        func의 반환값
+
+    Note:
+        - Redis가 설정되지 않았으면 블로킹 호출이 없으므로 스레드 전환 없이 바로 실행
+    """
+    if get_redis() is None:
+        return func(*args, **kwargs)
+    return await run_blocking(func, *args, pool="redis", **kwargs)
+
+
+def blocking(pool: str = "db") -> Callable:
+    """
+    동기 라우트 핸들러를 오프로드 풀에서 실행하는 async 핸들러로 감싸는 데코레이터
+
+    FastAPI는 원래 시그니처로 의존성/파라미터를 해석하고(functools.wraps),
+    핸들러 본문은 지정한 풀의 스레드에서 실행됩니다.
+
+    Args:
+        pool: 오프로드 풀 이름 ("db" | "gcs" | "redis")
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            return await run_blocking(func, *args, pool=pool, **kwargs)
+        return wrapper
+    return decorator
+
+
+def pool_status() -> Dict[str, dict]:
+    """풀별 한도와 현재 사용 중인 슬롯 수 (/internal/metrics 조회용)"""
+    return {
+        pool: {
+            "limit": size,
+            "borrowed": int(_limiters[pool].borrowed_tokens) if pool in _limiters else 0,
+            "waiting": _limiters[pool].statistics().tasks_waiting if pool in _limiters else 0,
+        }
+        for pool, size in POOL_SIZES.items()
+    }
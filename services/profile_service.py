@@ -2,6 +2,7 @@ from sqlalchemy.orm import Session
 from database import User, ProfileCareer, Application, Post
 import json
 from fastapi import HTTPException
+from services import user_cache
 
 
 def update_profile(db: Session, user: User, name: str, field: str, university: str, portfolio: str, careers: str, avatar_url: str = None, banner_url: str = None):
@@ -72,8 +73,10 @@ def update_profile(db: Session, user: User, name: str, field: str, university: s
                 )
                 db.add(new_career)
 
+        user_cache.bump_version(user)
         db.commit()
         db.refresh(user)
+        user_cache.invalidate_user(user.user_id, user.id, user.version)
         return user
 
     except Exception as e:
@@ -0,0 +1,175 @@
+"""
+요청별 SQL 쿼리 계측 (N+1 탐지)
+
+QueryStatsMiddleware가 요청마다 QueryStats를 컨텍스트에 두고, 엔진의 cursor execute 이벤트가
+쿼리 수, DB 시간, 같은 SQL문 반복 횟수를 기록합니다. 동기 라우터(스레드풀)와 비동기 세션(greenlet)
+모두 요청 컨텍스트를 이어받으므로 같은 요청의 쿼리로 집계됩니다.
+
+- QUERY_STATS_HEADERS=true: 응답에 Server-Timing(db), X-DB-Query-Count, X-DB-Repeated-Queries 헤더 추가
+- QUERY_COUNT_WARN_THRESHOLD 이상 쿼리, 또는 같은 SQL문을 QUERY_REPEAT_WARN_THRESHOLD번 이상 실행한 요청은 경고 로그
+- @query_budget(n)이 붙은 라우트가 n개를 넘기면 경고 로그, QUERY_BUDGET_ENFORCE=true면 500 응답 (테스트/CI용)
+
+같은 SQL문 판별은 바인드 파라미터가 분리된 SQL 문자열 기준입니다 (IN 목록 길이가 다르면 다른 문장).
+"""
+
+import json
+import logging
+import time
+from collections import Counter as CounterDict
+from contextvars import ContextVar
+from typing import Callable, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStats:
+    """한 요청 동안 실행된 쿼리 집계"""
+
+    __slots__ = ("count", "db_seconds", "statements")
+
+    def __init__(self):
+        self.count = 0
+        self.db_seconds = 0.0
+        self.statements: CounterDict = CounterDict()
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """threshold번 이상 실행된 SQL문과 횟수 (많은 순)"""
+        return [(sql, n) for sql, n in self.statements.most_common() if n >= threshold]
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current() -> Optional[QueryStats]:
+    """현재 요청의 쿼리 집계 (미들웨어 밖이면 None)"""
+    return _current.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info.setdefault("query_stats_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is None:
+        return
+    starts = conn.info.get("query_stats_start")
+    if starts:
+        stats.db_seconds += time.perf_counter() - starts.pop()
+    stats.count += 1
+    stats.statements[statement] += 1
+
+
+_installed = False
+
+
+def install() -> None:
+    """모든 엔진(복제본, 비동기 엔진의 sync_engine 포함)에 쿼리 계측 이벤트 등록"""
+    global _installed
+    if not _installed:
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        _installed = True
+
+
+def query_budget(max_queries: int) -> Callable:
+    """
+    라우트의 요청당 쿼리 수 상한 지정
+
+    Args:
+        max_queries: 허용 쿼리 수 (인증 사용자 조회, 복제 지연 확인 등 의존성 쿼리 포함)
+
+    Note:
+        - 라우터 데코레이터 아래에 붙임 (@router.get(...) 다음 줄)
+        - 함수를 감싸지 않고 속성만 추가하므로 FastAPI 시그니처 분석에 영향 없음
+    """
+    def decorator(func: Callable) -> Callable:
+        func.__query_budget__ = max_queries
+        return func
+    return decorator
+
+
+def _short_sql(statement: str, limit: int = 120) -> str:
+    sql = " ".join(statement.split())
+    return sql if len(sql) <= limit else sql[:limit] + "..."
+
+
+class QueryStatsMiddleware:
+    """요청별 쿼리 수/DB 시간 집계, 헤더 노출, 경고 로그, 쿼리 예산 검사를 하는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current.set(stats)
+        started = time.perf_counter()
+        budget_exceeded = False
+
+        async def send_wrapper(message):
+            nonlocal budget_exceeded
+            if message["type"] == "http.response.start":
+                budget = getattr(scope.get("endpoint"), "__query_budget__", None)
+                if budget is not None and stats.count > budget and settings.QUERY_BUDGET_ENFORCE:
+                    budget_exceeded = True
+                    await self._send_budget_error(send, stats, budget)
+                    return
+                if settings.QUERY_STATS_HEADERS:
+                    message = dict(message)
+                    message["headers"] = list(message.get("headers", [])) + self._headers(stats)
+            elif budget_exceeded:
+                return
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            self._report(scope, stats, time.perf_counter() - started)
+
+    @staticmethod
+    def _headers(stats: QueryStats) -> List[Tuple[bytes, bytes]]:
+        repeated = stats.repeated(2)
+        return [
+            (b"server-timing", f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.count} queries"'.encode()),
+            (b"x-db-query-count", str(stats.count).encode()),
+            (b"x-db-repeated-queries", str(sum(n - 1 for _, n in repeated)).encode()),
+        ]
+
+    @staticmethod
+    async def _send_budget_error(send, stats: QueryStats, budget: int) -> None:
+        body = json.dumps(
+            {"detail": f"쿼리 예산 초과: {stats.count}개 실행 (예산 {budget}개)"}, ensure_ascii=False
+        ).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 500,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    @staticmethod
+    def _report(scope, stats: QueryStats, elapsed: float) -> None:
+        path = scope.get("path")
+        method = scope.get("method")
+        budget = getattr(scope.get("endpoint"), "__query_budget__", None)
+        repeated = stats.repeated(settings.QUERY_REPEAT_WARN_THRESHOLD)
+
+        if budget is not None and stats.count > budget:
+            logger.warning(f"쿼리 예산 초과: {method} {path} {stats.count}개 (예산 {budget}개)")
+        if stats.count >= settings.QUERY_COUNT_WARN_THRESHOLD or repeated:
+            details = "; ".join(f"{n}회: {_short_sql(sql)}" for sql, n in repeated[:3])
+            logger.warning(
+                f"쿼리 과다: {method} {path} {stats.count}개, DB {stats.db_seconds * 1000:.1f}ms, "
+                f"전체 {elapsed * 1000:.1f}ms" + (f" / 반복 SQL {details}" if details else "")
+            )
@@ -0,0 +1,194 @@
+"""
+공고별 질문 캐시
+
+PostQuestion은 공고 작성자가 create_post_questions로 전체를 교체할 때만 바뀌지만,
+질문 조회와 지원서 제출마다 읽힙니다. 공고별로 버전을 두고 질문 목록을 캐싱합니다.
+
+- 1차: 프로세스 내 LRU + TTL (settings.QUESTION_CACHE_MAX_POSTS개 공고, QUESTION_CACHE_TTL_SECONDS초)
+- 2차: Redis (REDIS_URL이 있을 때만) - 워커 간 버전 공유 및 질문 목록 공유
+- 무효화: invalidate_post_questions가 공고 버전을 새 임의 토큰으로 바꿈 → 이전 버전 캐시는 더 이상 사용되지 않음
+  (숫자를 올리는 방식과 달리 버전 키가 만료·삭제되어도 이전 버전 값이 다시 나오지 않음)
+- 버전 키가 없으면(처음 조회, eviction, Redis 재시작) 새 토큰을 SET NX로 만들어 사용 (이전 데이터 키와 겹치지 않음)
+- Redis가 없거나 장애 중이면 버전 대신 DB의 (질문 수, 최대 질문 ID)를 조회해 사용
+  (질문은 전체 삭제 후 새 ID로 다시 생성되므로 변경되면 값이 달라짐 → 다른 워커의 변경도 바로 반영)
+"""
+
+import json
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+import time
+import uuid
+from typing import List, Dict, Any, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from config import settings
+from database import PostQuestion
+from services import metrics
+from services.redis_client import get_redis
+
+# 캐시 조회 결과 (result: local, redis, miss) - 적중률은 수집 측에서 계산
+CACHE_REQUESTS = metrics.counter("cache_requests_total", "캐시 조회 수 (cache, result: local/redis/miss)")
+
+# Redis 버전(임의 토큰) 또는 DB 표식("db:질문 수:최대 ID")
+Version = str
+_DB_MARKER_PREFIX = "db:"
+
+_local: "OrderedDict[int, Tuple[float, Version, List[Dict[str, Any]]]]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def _version_key(post_id: int) -> str:
+    return f"post_questions:{post_id}:version"
+
+
+def _data_key(post_id: int, version: Version) -> str:
+    return f"post_questions:{post_id}:v{version}"
+
+
+def _new_token() -> str:
+    return uuid.uuid4().hex
+
+
+def _is_shared(version: Version) -> bool:
+    """Redis 버전인지 (DB 표식이면 Redis 데이터 키를 쓰지 않음)"""
+    return not version.startswith(_DB_MARKER_PREFIX)
+
+
+def _current_version(db: Session, post_id: int) -> Version:
+    """공고 질문 버전 조회 (Redis 우선, 키가 없으면 새 토큰 생성, 실패 시 DB 표식)"""
+    client = get_redis()
+    if client:
+        try:
+            key = _version_key(post_id)
+            version = client.get(key)
+            if version is None:
+                # 없는 키를 0 같은 고정값으로 보면 eviction 후 이전 버전 데이터가 다시 사용될 수 있음
+                client.set(key, _new_token(), nx=True)
+                version = client.get(key)
+            if version is not None:
+                return version
+        except Exception as e:
+            logging.warning(f"질문 캐시 버전 조회 실패(Redis): {e}")
+    count, max_id = db.query(func.count(PostQuestion.id), func.max(PostQuestion.id)).filter(
+        PostQuestion.post_id == post_id
+    ).one()
+    return f"{_DB_MARKER_PREFIX}{count}:{max_id or 0}"
+
+
+def _to_snapshot(question: PostQuestion) -> Dict[str, Any]:
+    return {
+        "id": question.id,
+        "post_id": question.post_id,
+        "question_type": question.question_type,
+        "question_content": question.question_content,
+        "is_required": question.is_required,
+        "choices": question.choices,
+        "created_at": question.created_at,
+    }
+
+
+def _store_local(post_id: int, version: Version, questions: List[Dict[str, Any]]) -> None:
+    with _lock:
+        _local[post_id] = (time.monotonic() + settings.QUESTION_CACHE_TTL_SECONDS, version, questions)
+        _local.move_to_end(post_id)
+        while len(_local) > settings.QUESTION_CACHE_MAX_POSTS:
+            _local.popitem(last=False)
+
+
+def _load_from_redis(post_id: int, version: Version) -> Optional[List[Dict[str, Any]]]:
+    client = get_redis()
+    if not client or not _is_shared(version):
+        return None
+    try:
+        raw = client.get(_data_key(post_id, version))
+    except Exception as e:
+        logging.warning(f"질문 캐시 조회 실패(Redis): {e}")
+        return None
+    if raw is None:
+        return None
+    questions = json.loads(raw)
+    for question in questions:
+        question["created_at"] = datetime.fromisoformat(question["created_at"])
+    return questions
+
+
+def _store_redis(post_id: int, version: Version, questions: List[Dict[str, Any]]) -> None:
+    client = get_redis()
+    if not client or not _is_shared(version):
+        return
+    try:
+        client.set(
+            _data_key(post_id, version),
+            json.dumps(questions, ensure_ascii=False, default=lambda v: v.isoformat()),
+            ex=settings.QUESTION_CACHE_REDIS_TTL_SECONDS,
+        )
+    except Exception as e:
+        logging.warning(f"질문 캐시 저장 실패(Redis): {e}")
+
+
+def get_post_questions(db: Session, post_id: int) -> List[Dict[str, Any]]:
+    """
+    공고의 질문 목록 조회 (캐시 우선)
+    
+    Args:
+        db: 데이터베이스 세션 (캐시 미스 시, Redis가 없으면 버전 표식 조회에도 사용)
+        post_id: 공고 ID
+        
+    Returns:
+        List[dict]: 생성 순서대로 정렬된 질문 목록
+        - id, post_id, question_type, question_content, is_required, choices, created_at
+    
+    Note:
+        - 반환된 목록은 여러 요청이 공유하므로 수정하지 말 것
+        - 버전은 조회 전에 읽어 두므로, 조회 도중 무효화되면 이전 버전으로 저장되어 다시 사용되지 않음
+        - 읽기 복제본 세션(get_read_db)에서 DB 조회한 결과는 캐싱하지 않음 (캐시 적중은 그대로 사용)
+    """
+    version = _current_version(db, post_id)
+    
+    with _lock:
+        cached = _local.get(post_id)
+        if cached and cached[1] == version and cached[0] >= time.monotonic():
+            _local.move_to_end(post_id)
+            CACHE_REQUESTS.inc(cache="post_questions", result="local")
+            return cached[2]
+    
+    questions = _load_from_redis(post_id, version)
+    CACHE_REQUESTS.inc(cache="post_questions", result="miss" if questions is None else "redis")
+    if questions is None:
+        rows = db.query(PostQuestion).filter(
+            PostQuestion.post_id == post_id
+        ).order_by(PostQuestion.created_at, PostQuestion.id).all()
+        questions = [_to_snapshot(row) for row in rows]
+        if db.info.get("read_replica"):
+            # 복제 지연으로 무효화 이전 질문을 읽었을 수 있으므로 캐싱하지 않음
+            return questions
+        _store_redis(post_id, version, questions)
+    
+    _store_local(post_id, version, questions)
+    return questions
+
+
+def invalidate_post_questions(post_id: int) -> None:
+    """
+    공고 질문 캐시 무효화 (질문 변경 커밋 후 호출)
+    
+    Args:
+        post_id: 공고 ID
+    
+    Note:
+        - Redis가 있으면 공고 버전을 새 토큰으로 바꿔 모든 워커의 캐시를 무효화
+        - 버전 변경에 실패하면 다른 워커는 최대 QUESTION_CACHE_REDIS_TTL_SECONDS 동안 이전 질문을 볼 수 있음
+        - 프로세스 내 캐시는 즉시 제거 (Redis가 없으면 다른 워커는 DB 표식이 바뀐 것으로 변경을 감지)
+    """
+    client = get_redis()
+    if client:
+        try:
+            client.set(_version_key(post_id), _new_token())
+        except Exception as e:
+            logging.warning(f"질문 캐시 무효화 실패(Redis): {e}")
+    with _lock:
+        _local.pop(post_id, None)
@@ -0,0 +1,264 @@
+"""
+요청 속도 제한 (Redis 공유 토큰 버킷 + 워커 로컬 사전 검사)
+
+정책별 한도("20/minute")를 클라이언트(JWT sub, 없으면 IP)마다 모든 워커가 공유하도록 Redis 토큰 버킷에서 관리합니다.
+요청마다 Redis를 왕복하지 않도록 워커는 두 단계로 판단합니다.
+
+1. 로컬 토큰 버킷 사전 검사: 이 워커가 본 요청만으로 이미 한도를 넘었으면 Redis 없이 바로 거절
+2. 토큰 임대: Redis 버킷에서 토큰을 한 번에 여러 개(한도의 1/10) 가져와 로컬에서 소진 (짧은 시간 후 만료)
+   - 임대한 토큰만 사용하므로 전체 허용량은 한도를 넘지 않음
+   - 클라이언트 요청이 여러 워커로 나뉘면 다른 워커가 임대한 토큰만큼 먼저 거절될 수 있음
+
+Redis가 없거나(REDIS_URL 미설정) 장애 중이면 로컬 토큰 버킷만으로 워커별 한도를 적용합니다.
+Redis 호출은 이벤트 루프를 막지 않도록 오프로드 스레드("redis" 풀)에서 실행합니다.
+
+사용 예:
+    @router.post("/posts", dependencies=[Depends(rate_limit("upload"))])
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, Request, status
+
+from config import settings
+from security import decode_token
+from services import metrics, offload
+from services.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_DECISIONS = metrics.counter(
+    "rate_limit_decisions_total", "속도 제한 판단 수 (정책, 결과=allowed|rejected, 판단 위치=local|lease|redis)"
+)
+
+# 임대 크기 = 한도 // LEASE_DIVISOR (최소 1)
+LEASE_DIVISOR = 10
+# 임대한 토큰의 로컬 유효 시간 (초) - 짧을수록 워커 간 편차가 작고 Redis 호출은 늘어남
+LEASE_SECONDS = 2.0
+# Redis 호출 실패 후 로컬 버킷만 사용하는 시간 (초)
+REDIS_BACKOFF_SECONDS = 5.0
+
+_PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+# 토큰 버킷 (KEYS[1], ARGV: 용량, 초당 충전량, 요청 토큰 수) → {부여한 토큰 수, 다음 토큰까지 초}
+_TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local granted = math.min(requested, math.floor(tokens))
+tokens = tokens - granted
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000) + 1000)
+local retry_after = 0
+if granted == 0 then retry_after = (1 - tokens) / rate end
+return {granted, tostring(retry_after)}
+"""
+
+
+@dataclass(frozen=True)
+class RatePolicy:
+    name: str
+    limit: int  # 버킷 용량 (연속 허용 요청 수)
+    period_seconds: float  # limit개가 다시 채워지는 시간
+
+    @property
+    def rate(self) -> float:
+        return self.limit / self.period_seconds
+
+    @property
+    def lease_size(self) -> int:
+        return max(1, self.limit // LEASE_DIVISOR)
+
+
+def parse_rate(name: str, value: str) -> RatePolicy:
+    """
+    한도 문자열 파싱
+
+    Args:
+        name: 정책 이름
+        value: "횟수/단위" (단위: second|minute|hour|day, 예: "20/minute")
+
+    Returns:
+        RatePolicy: 파싱된 정책
+    """
+    count, _, period = value.strip().partition("/")
+    period = period.strip().lower().rstrip("s")
+    if period not in _PERIODS or not count.strip().isdigit() or int(count) <= 0:
+        raise ValueError(f"잘못된 속도 제한 설정 ({name}): {value}")
+    return RatePolicy(name=name, limit=int(count), period_seconds=_PERIODS[period])
+
+
+POLICIES: Dict[str, RatePolicy] = {
+    name: parse_rate(name, value)
+    for name, value in {
+        "upload": settings.RATE_LIMIT_UPLOAD,
+        "oauth_callback": settings.RATE_LIMIT_OAUTH_CALLBACK,
+        "search": settings.RATE_LIMIT_SEARCH,
+        "ping": settings.RATE_LIMIT_PING,
+        "health": settings.RATE_LIMIT_HEALTH,
+    }.items()
+}
+
+
+class _LocalState:
+    """클라이언트별 로컬 토큰 버킷과 Redis에서 임대한 토큰"""
+
+    __slots__ = ("tokens", "updated", "leased", "lease_expires")
+
+    def __init__(self, policy: RatePolicy, now: float):
+        self.tokens = float(policy.limit)
+        self.updated = now
+        self.leased = 0
+        self.lease_expires = 0.0
+
+    def refill(self, policy: RatePolicy, now: float) -> None:
+        self.tokens = min(policy.limit, self.tokens + (now - self.updated) * policy.rate)
+        self.updated = now
+
+
+_local: "OrderedDict[Tuple[str, str], _LocalState]" = OrderedDict()
+_lock = threading.Lock()
+_script = None
+_redis_backoff_until = 0.0
+
+
+def _state(policy: RatePolicy, identity: str, now: float) -> _LocalState:
+    key = (policy.name, identity)
+    state = _local.get(key)
+    if state is None:
+        state = _local[key] = _LocalState(policy, now)
+        while len(_local) > settings.RATE_LIMIT_LOCAL_MAX_KEYS:
+            _local.popitem(last=False)
+    else:
+        _local.move_to_end(key)
+    return state
+
+
+def _acquire_from_redis(policy: RatePolicy, identity: str) -> Optional[Tuple[int, float]]:
+    """Redis 버킷에서 임대 크기만큼 토큰 요청 → (부여 수, 재시도까지 초), Redis를 쓸 수 없으면 None"""
+    global _script, _redis_backoff_until
+    if time.monotonic() < _redis_backoff_until:
+        return None
+    client = get_redis()
+    if not client:
+        return None
+    try:
+        if _script is None:
+            _script = client.register_script(_TOKEN_BUCKET_SCRIPT)
+        granted, retry_after = _script(
+            keys=[f"ratelimit:{policy.name}:{identity}"],
+            args=[policy.limit, policy.rate, policy.lease_size],
+        )
+        return int(granted), float(retry_after)
+    except Exception as e:
+        _redis_backoff_until = time.monotonic() + REDIS_BACKOFF_SECONDS
+        logger.warning(f"속도 제한 Redis 호출 실패, {REDIS_BACKOFF_SECONDS:.0f}초간 워커 로컬 한도만 적용: {e}")
+        return None
+
+
+async def check(policy: RatePolicy, identity: str) -> Tuple[bool, float]:
+    """
+    요청 1건 허용 여부 판단
+
+    Args:
+        policy: 속도 제한 정책
+        identity: 클라이언트 식별자 ("sub:..." 또는 "ip:...")
+
+    Returns:
+        (허용 여부, 거절 시 재시도까지 초)
+    """
+    now = time.monotonic()
+    with _lock:
+        state = _state(policy, identity, now)
+        state.refill(policy, now)
+        # 1. 로컬 사전 검사: 이 워커에서만 이미 한도 초과
+        if state.tokens < 1:
+            RATE_LIMIT_DECISIONS.inc(policy=policy.name, result="rejected", source="local")
+            return False, (1 - state.tokens) / policy.rate
+        # 2. 임대한 토큰 사용
+        if state.leased > 0 and state.lease_expires > now:
+            state.leased -= 1
+            state.tokens -= 1
+            RATE_LIMIT_DECISIONS.inc(policy=policy.name, result="allowed", source="lease")
+            return True, 0.0
+
+    # 3. Redis에서 새로 임대 (락 밖, 이벤트 루프 밖 스레드에서 호출)
+    if time.monotonic() < _redis_backoff_until or not get_redis():
+        acquired = None
+    else:
+        acquired = await offload.run_blocking(_acquire_from_redis, policy, identity, pool="redis")
+
+    with _lock:
+        state = _state(policy, identity, now)
+        if acquired is None:
+            # Redis 미사용/장애: 로컬 버킷만으로 판단 (1단계에서 토큰 확인됨)
+            state.tokens -= 1
+            RATE_LIMIT_DECISIONS.inc(policy=policy.name, result="allowed", source="local")
+            return True, 0.0
+        granted, retry_after = acquired
+        if granted <= 0:
+            RATE_LIMIT_DECISIONS.inc(policy=policy.name, result="rejected", source="redis")
+            return False, retry_after
+        # 같은 워커의 동시 요청이 먼저 받은 임대가 아직 유효하면 합산 (덮어쓰면 그 토큰이 유실됨)
+        if state.lease_expires > time.monotonic():
+            state.leased += granted - 1
+        else:
+            state.leased = granted - 1
+        state.lease_expires = time.monotonic() + LEASE_SECONDS
+        state.tokens -= 1
+        RATE_LIMIT_DECISIONS.inc(policy=policy.name, result="allowed", source="redis")
+        return True, 0.0
+
+
+def client_identity(request: Request) -> str:
+    """속도 제한 키 - 유효한 Bearer 토큰이 있으면 sub, 없으면 클라이언트 IP"""
+    authorization = request.headers.get("authorization")
+    if authorization and authorization[:7].lower() == "bearer ":
+        payload = decode_token(authorization[7:].strip())
+        if payload and payload.get("sub"):
+            return f"sub:{payload['sub']}"
+    return f"ip:{request.client.host if request.client else 'unknown'}"
+
+
+def rate_limit(policy_name: str, query_params: Sequence[str] = ()) -> Callable:
+    """
+    라우트용 속도 제한 의존성 생성
+
+    Args:
+        policy_name: POLICIES의 정책 이름 (upload, oauth_callback, search, ping, health)
+        query_params: 지정하면 이 쿼리 파라미터 중 하나라도 있는 요청에만 적용 (예: 검색어가 있는 목록 조회)
+
+    Returns:
+        Callable: FastAPI 의존성 (dependencies=[Depends(...)])
+
+    Raises:
+        HTTPException: 429 - 한도 초과 (Retry-After 헤더 포함)
+    """
+    policy = POLICIES[policy_name]
+
+    async def dependency(request: Request) -> None:
+        if not settings.RATE_LIMIT_ENABLED:
+            return
+        if query_params and not any(request.query_params.get(name) for name in query_params):
+            return
+        allowed, retry_after = await check(policy, client_identity(request))
+        if not allowed:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="요청이 너무 많습니다. 잠시 후 다시 시도해주세요.",
+                headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+            )
+
+    return dependency
@@ -0,0 +1,212 @@
+"""
+읽기 전용 복제본(read replica) 라우팅
+
+DATABASE_READ_URLS(쉼표 구분)가 설정되면 공개 조회 API는 get_read_db / get_async_read_db로
+복제본 세션을 받습니다. 복제본이 없으면 기존과 같이 기본(primary) DB를 사용합니다.
+
+- 라운드 로빈으로 복제본 선택
+- 복제 지연 확인: DB_READ_LAG_CHECK_INTERVAL_SECONDS마다 선택된 세션에서 지연을 조회하여
+  DB_READ_MAX_LAG_SECONDS를 넘거나 조회에 실패한 복제본은 다음 확인 전까지 제외 (모두 제외되면 primary)
+- read-your-writes: 쓰기 요청(POST/PUT/PATCH/DELETE)이 성공한 클라이언트(Authorization 헤더 기준)는
+  DB_READ_YOUR_WRITES_SECONDS 동안 primary에서 읽음 (Redis가 있으면 워커 간 공유)
+
+복제본 세션은 session.info["read_replica"]에 복제본 이름을 가지므로,
+캐시 계층은 이를 보고 복제 지연된 데이터를 캐싱하지 않을 수 있습니다.
+read-your-writes로 primary에 고정된 요청의 세션은 session.info["read_your_writes"]가 True이며,
+동시 조회 합치기(services/single_flight.py)는 이런 요청을 합치지 않습니다.
+(복제본이 없어도 SINGLE_FLIGHT_ENABLED면 쓰기를 기록 - 쓰기 전에 시작된 조회 결과를 받지 않도록)
+"""
+
+import hashlib
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import text
+
+from config import settings
+from services import offload
+from services.redis_client import get_redis
+
+# 복제 지연(초) - WAL을 모두 재생했으면 0 (쓰기가 없는 동안 마지막 재생 시각이 오래돼도 지연으로 보지 않음)
+REPLICA_LAG_SQL = text(
+    "SELECT CASE WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+@dataclass
+class Replica:
+    name: str
+    session_factory: Callable
+    async_session_factory: Callable
+    lag_seconds: Optional[float] = None
+    checked_at: float = float("-inf")
+    healthy: bool = True
+
+
+_replicas: List[Replica] = []
+_round_robin = itertools.count()
+_sticky: Dict[str, float] = {}  # 클라이언트 키 -> primary 고정 만료 시각 (Redis가 없을 때)
+_lock = threading.Lock()
+
+
+def add_replica(name: str, session_factory: Callable, async_session_factory: Callable) -> None:
+    """복제본 등록 (database.py에서 DATABASE_READ_URLS마다 호출)"""
+    _replicas.append(Replica(name, session_factory, async_session_factory))
+
+
+def has_replicas() -> bool:
+    return bool(_replicas)
+
+
+def tracks_writes() -> bool:
+    """read-your-writes 기록 여부 (복제본이 있거나 동시 조회 합치기를 사용할 때)"""
+    return bool(_replicas) or settings.SINGLE_FLIGHT_ENABLED
+
+
+def client_key(authorization: Optional[str]) -> Optional[str]:
+    """read-your-writes 고정용 클라이언트 키 (토큰 원문 대신 해시 사용)"""
+    if not authorization:
+        return None
+    return hashlib.blake2b(authorization.encode(), digest_size=16).hexdigest()
+
+
+def mark_write(key: Optional[str]) -> None:
+    """
+    클라이언트의 쓰기 기록 - 이후 DB_READ_YOUR_WRITES_SECONDS 동안 primary에서 읽음
+    
+    Args:
+        key: client_key 결과 (None이면 무시)
+    """
+    if not key or not tracks_writes():
+        return
+    window = settings.DB_READ_YOUR_WRITES_SECONDS
+    client = get_redis()
+    if client:
+        try:
+            client.set(f"rw_sticky:{key}", 1, px=int(window * 1000))
+            return
+        except Exception as e:
+            logging.warning(f"read-your-writes 기록 실패(Redis): {e}")
+    now = time.monotonic()
+    with _lock:
+        _sticky[key] = now + window
+        # 만료 항목 정리 (쓰기 요청 수만큼만 쌓이므로 가끔 정리해도 충분)
+        if len(_sticky) > 10000:
+            for expired in [k for k, until in _sticky.items() if until < now]:
+                del _sticky[expired]
+
+
+def is_sticky(key: Optional[str]) -> bool:
+    """클라이언트가 read-your-writes 기간 중인지 (primary에서 읽어야 하고 조회 합치기 제외)"""
+    if not key or not tracks_writes():
+        return False
+    client = get_redis()
+    if client:
+        try:
+            return bool(client.exists(f"rw_sticky:{key}"))
+        except Exception as e:
+            logging.warning(f"read-your-writes 확인 실패(Redis): {e}")
+            return True  # 확인할 수 없으면 안전하게 primary
+    with _lock:
+        until = _sticky.get(key)
+    return until is not None and until > time.monotonic()
+
+
+def sticky_check_uses_redis(key: Optional[str]) -> bool:
+    """is_sticky가 Redis를 호출하는지 (async 경로에서는 오프로드 스레드에서 확인)"""
+    return bool(key) and tracks_writes() and get_redis() is not None
+
+
+def choose_replica(key: Optional[str]) -> Optional[Replica]:
+    """
+    이번 읽기에 사용할 복제본 선택
+    
+    Args:
+        key: 요청 클라이언트 키 (client_key)
+        
+    Returns:
+        Replica | None: 사용할 복제본, primary를 써야 하면 None
+    
+    Note:
+        - read-your-writes 고정 여부는 호출 측에서 is_sticky로 먼저 확인 (고정이면 호출하지 않음)
+    """
+    if not _replicas:
+        return None
+    now = time.monotonic()
+    start = next(_round_robin)
+    for offset in range(len(_replicas)):
+        replica = _replicas[(start + offset) % len(_replicas)]
+        if replica.healthy or now - replica.checked_at >= settings.DB_READ_LAG_CHECK_INTERVAL_SECONDS:
+            return replica
+    return None
+
+
+def needs_lag_check(replica: Replica) -> bool:
+    return time.monotonic() - replica.checked_at >= settings.DB_READ_LAG_CHECK_INTERVAL_SECONDS
+
+
+def record_lag(replica: Replica, lag_seconds: Optional[float]) -> bool:
+    """
+    복제 지연 확인 결과 기록
+    
+    Args:
+        replica: 확인한 복제본
+        lag_seconds: 지연(초), 조회 실패 시 None
+        
+    Returns:
+        bool: 복제본 사용 가능 여부
+    """
+    replica.checked_at = time.monotonic()
+    replica.lag_seconds = lag_seconds
+    healthy = lag_seconds is not None and lag_seconds <= settings.DB_READ_MAX_LAG_SECONDS
+    if replica.healthy and not healthy:
+        logging.warning(f"읽기 복제본 제외 ({replica.name}, 지연: {lag_seconds})")
+    replica.healthy = healthy
+    return healthy
+
+
+def replica_stats() -> Dict[str, dict]:
+    """복제본별 상태 (메트릭 조회용)"""
+    return {
+        replica.name: {"healthy": replica.healthy, "lag_seconds": replica.lag_seconds}
+        for replica in _replicas
+    }
+
+
+class ReadYourWritesMiddleware:
+    """
+    쓰기 요청이 성공(2xx/3xx)하면 해당 클라이언트를 잠시 primary에 고정하는 ASGI 미들웨어
+    
+    복제본이 설정되지 않았고 동시 조회 합치기도 끄면 아무 일도 하지 않습니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not tracks_writes() or scope["method"] not in WRITE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        authorization = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                authorization = value.decode("latin-1")
+                break
+        key = client_key(authorization)
+
+        async def send_wrapper(message):
+            if key and message["type"] == "http.response.start" and message["status"] < 400:
+                # 응답 시작 전에 기록을 마쳐 클라이언트의 다음 요청이 항상 기록을 보도록 함
+                # (Redis 기록은 이벤트 루프를 막지 않도록 오프로드 스레드에서 실행)
+                await offload.run_redis(mark_write, key)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,58 @@
+"""
+공용 Redis 클라이언트 (선택 사항)
+
+REDIS_URL이 설정되어 있고 redis 패키지가 설치된 경우에만 클라이언트를 만듭니다.
+이 클라이언트를 사용하는 캐시 계층은 Redis가 없거나 일시적으로 실패해도
+프로세스 내 캐시만으로 동작해야 합니다.
+"""
+
+import logging
+import os
+import threading
+from typing import Optional
+
+REDIS_URL: Optional[str] = os.getenv("REDIS_URL")
+
+# 요청 경로에서 호출되므로 Redis 장애 시 오래 블로킹되지 않도록 짧은 타임아웃 사용
+REDIS_SOCKET_TIMEOUT_SECONDS = 0.25
+
+_client = None
+_unavailable = False  # redis 패키지 미설치
+_client_lock = threading.Lock()
+
+
+def get_redis():
+    """
+    공용 동기 Redis 클라이언트 반환
+    
+    Returns:
+        redis.Redis | None: REDIS_URL과 redis 패키지가 모두 있으면 클라이언트, 아니면 None
+    
+    Note:
+        - 최초 호출 시 한 번만 생성 (연결은 실제 명령 실행 시점에 맺어짐)
+        - redis 패키지도 이때 import (REDIS_URL이 없으면 로딩하지 않음)
+        - decode_responses=True (문자열 반환)
+    """
+    global _client, _unavailable
+    if not REDIS_URL or _unavailable:
+        return None
+    if _client is None:
+        with _client_lock:
+            if _client is None and not _unavailable:
+                try:
+                    # Optional Redis import (graceful fallback when redis is unavailable)
+                    import redis
+                except Exception:
+                    _unavailable = True
+                    return None
+                try:
+                    _client = redis.from_url(
+                        REDIS_URL,
+                        decode_responses=True,
+                        socket_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+                        socket_connect_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+                    )
+                except Exception as e:
+                    logging.warning(f"Redis 클라이언트 생성 실패: {e}")
+                    return None
+    return _client
@@ -0,0 +1,192 @@
+"""
+조회 요청 합치기 (single-flight)
+
+인기 공고에 동시 요청이 몰리면 같은 조회가 같은 순간 수백 번 실행됩니다.
+같은 키(라우트 + 정규화한 파라미터 + 읽기 대상 DB)의 조회가 이미 진행 중이면 새 요청은 DB를 다시 조회하지 않고
+진행 중인 계산(리더)의 결과를 함께 받습니다. 캐시가 아니므로 리더가 끝나면 다음 요청은 다시 조회합니다.
+
+- coalesce: async 라우트용 (워커 이벤트 루프 단위)
+- coalesce_sync: 동기 라우트용 (스레드풀/오프로드 스레드 단위)
+- 결과는 모든 대기자가 공유하므로 loader는 변경하지 않을 dict/list만 반환해야 함 (ORM 객체, Response 금지)
+- loader 예외(404 등)는 대기자에게도 복사본으로 전달
+- 리더 요청이 취소되면 대기자는 직접 다시 조회 (대기자 중 하나가 새 리더가 됨)
+- 읽기 복제본 세션은 복제본 이름을 키에 넣어 primary 조회와 섞이지 않게 함
+- read-your-writes로 primary에 고정된 요청(session.info["read_your_writes"])은 합치지 않음
+  (쓰기 커밋 전에 시작된 조회 결과를 받지 않도록 항상 직접 조회)
+
+남는 지연: 합쳐진 요청은 자기 요청보다 최대 조회 1회 시간만큼 먼저 시작된 조회 결과를 받습니다.
+다른 클라이언트의 쓰기는 동시 조회와 마찬가지로 반영되지 않을 수 있고, Redis가 없으면
+read-your-writes 기록이 워커별이라 다른 워커에서 쓴 직후의 요청은 합쳐질 수 있습니다.
+
+사용 예:
+    key = single_flight.make_key("post_detail", session=db, post_id=post_id)
+    data = await single_flight.coalesce(key, lambda: _load_post_detail(db, post_id))
+"""
+
+import asyncio
+import copy
+import threading
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+from urllib.parse import urlencode
+
+from config import settings
+from services import metrics
+
+T = TypeVar("T")
+
+SINGLE_FLIGHT_REQUESTS = metrics.counter(
+    "single_flight_requests_total", "합치기 대상 조회 수 (이름별, role=leader|follower)"
+)
+
+
+class _LeaderGone(Exception):
+    """리더가 결과 없이 중단됨 (요청 취소 등) - 대기자는 다시 시도"""
+
+
+def make_key(name: str, session: Any = None, **params) -> Optional[str]:
+    """
+    합치기 키 생성
+
+    Args:
+        name: 조회 이름 (라우트 단위, 메트릭 라벨로도 사용)
+        session: 조회에 쓸 DB 세션 (복제본 세션이면 복제본 이름을 키에 포함)
+        **params: 결과를 결정하는 파라미터 (None은 제외, Enum은 값 사용, 이름순 정렬)
+
+    Returns:
+        str | None: 예) "post_list|primary|page=1&size=20&sort=최신순",
+        read-your-writes로 고정된 세션이면 None (합치지 않음)
+    """
+    if session is not None and session.info.get("read_your_writes"):
+        return None
+    target = session.info.get("read_replica", "primary") if session is not None else "-"
+    normalized = sorted(
+        (key, value.value if isinstance(value, Enum) else str(value))
+        for key, value in params.items() if value is not None
+    )
+    return f"{name}|{target}|{urlencode(normalized)}"
+
+
+def _label(key: str) -> str:
+    return key.split("|", 1)[0]
+
+
+def _copy_error(error: BaseException) -> BaseException:
+    # 같은 예외 객체를 여러 요청에서 raise하면 traceback이 섞이므로 복사본 전달
+    try:
+        return copy.copy(error)
+    except Exception:
+        return error
+
+
+# --- async ---
+
+class _AsyncCall:
+    __slots__ = ("future", "waiters")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.future = loop.create_future()
+        self.waiters = 0
+
+
+_inflight: Dict[str, _AsyncCall] = {}
+
+
+async def coalesce(key: Optional[str], loader: Callable[[], Awaitable[T]]) -> T:
+    """
+    진행 중인 같은 키의 조회가 있으면 그 결과를, 없으면 loader를 실행해 결과를 반환
+
+    Args:
+        key: make_key 결과 (None이면 합치지 않고 loader 실행)
+        loader: 실제 조회 (코루틴 함수, 인자 없음)
+
+    Returns:
+        loader 결과 (대기자와 공유)
+    """
+    if key is None or not settings.SINGLE_FLIGHT_ENABLED:
+        return await loader()
+    loop = asyncio.get_running_loop()
+    while True:
+        call = _inflight.get(key)
+        if call is None or call.future.get_loop() is not loop:
+            break
+        call.waiters += 1
+        SINGLE_FLIGHT_REQUESTS.inc(name=_label(key), role="follower")
+        try:
+            return await asyncio.shield(call.future)
+        except _LeaderGone:
+            continue
+        except Exception as e:
+            raise _copy_error(e) from None
+
+    call = _inflight[key] = _AsyncCall(loop)
+    SINGLE_FLIGHT_REQUESTS.inc(name=_label(key), role="leader")
+    try:
+        result = await loader()
+    except BaseException as e:
+        _inflight.pop(key, None)
+        if call.waiters:
+            call.future.set_exception(e if isinstance(e, Exception) else _LeaderGone())
+        else:
+            call.future.cancel()
+        raise
+    _inflight.pop(key, None)
+    call.future.set_result(result)
+    return result
+
+
+# --- sync ---
+
+class _SyncCall:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+_sync_inflight: Dict[str, _SyncCall] = {}
+_sync_lock = threading.Lock()
+
+
+def coalesce_sync(key: Optional[str], loader: Callable[[], T]) -> T:
+    """
+    coalesce의 동기 버전 (동기 Session을 쓰는 라우트, 스레드에서 호출)
+
+    Args:
+        key: make_key 결과 (None이면 합치지 않고 loader 실행)
+        loader: 실제 조회 (인자 없음)
+
+    Returns:
+        loader 결과 (대기자와 공유)
+    """
+    if key is None or not settings.SINGLE_FLIGHT_ENABLED:
+        return loader()
+    while True:
+        with _sync_lock:
+            call = _sync_inflight.get(key)
+            leader = call is None
+            if leader:
+                call = _sync_inflight[key] = _SyncCall()
+        if leader:
+            break
+        SINGLE_FLIGHT_REQUESTS.inc(name=_label(key), role="follower")
+        call.done.wait()
+        if isinstance(call.error, _LeaderGone):
+            continue
+        if call.error is not None:
+            raise _copy_error(call.error) from None
+        return call.result
+
+    SINGLE_FLIGHT_REQUESTS.inc(name=_label(key), role="leader")
+    try:
+        call.result = loader()
+        return call.result
+    except BaseException as e:
+        call.error = e if isinstance(e, Exception) else _LeaderGone()
+        raise
+    finally:
+        with _sync_lock:
+            _sync_inflight.pop(key, None)
+        call.done.set()
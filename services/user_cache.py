@@ -0,0 +1,366 @@
+"""
+인증 사용자 캐시
+
+get_current_user는 모든 인증 요청마다 토큰의 sub로 User를 조회합니다.
+sub별 User 컬럼 스냅샷을 캐싱하여 반복 조회를 없앱니다.
+
+- 1차: 프로세스 내 LRU + TTL (settings.AUTH_USER_CACHE_MAX_ENTRIES개, AUTH_USER_CACHE_TTL_SECONDS초)
+- 2차: Redis (REDIS_URL이 있을 때만, AUTH_USER_CACHE_REDIS_TTL_SECONDS초) - 워커 간 공유
+  스냅샷의 version이 현재 사용자 버전과 같을 때만 저장/사용 (변경 중에 읽은 이전 스냅샷이 남지 않도록)
+- 무효화: 사용자 정보를 수정하는 곳에서 커밋 전 bump_version, 커밋 후 invalidate_user 호출
+  (다른 워커의 1차 캐시는 최대 AUTH_USER_CACHE_TTL_SECONDS 동안 유지될 수 있으므로 1차 TTL은 짧게 유지)
+
+캐시 적중 시에는 스냅샷으로 User 객체를 만들어 요청 세션에 조회 없이 연결하므로,
+핸들러는 기존과 같이 관계(careers) 지연 로딩이나 수정 후 커밋을 할 수 있습니다.
+
+사용자 버전: users.version 컬럼은 사용자 정보를 변경하는 트랜잭션에서 bump_version으로 1씩 증가합니다.
+클레임 모드 액세스 토큰(JWT_EMBED_CLAIMS)은 발급 시점의 버전(ver)을 담고,
+get_current_claims는 토큰 버전이 현재 버전보다 낮으면 클레임을 신뢰하지 않습니다.
+- Redis의 auth_user_version:{sub}는 "users.id:users.version" 형식의 DB 버전 사본이며 더 큰 값으로만 갱신
+  ((id, version) 순서로 비교, 만료 없음, 되돌아가지 않음)
+- 탈퇴 시 버전을 _DELETED_VERSION으로 올려 이전 토큰/스냅샷을 거절하고, 같은 소셜 계정으로 다시 가입하면
+  새 행의 users.id가 더 크므로 새 계정의 버전(id, 0)이 탈퇴 버전보다 커져 정상적으로 사용됨
+- Redis가 없거나, 키가 없거나, 조회에 실패하면 버전을 알 수 없음(None) → 클레임을 신뢰하지 않고 DB 조회
+
+Redis를 호출하는 함수(get_shared_snapshot, cache_snapshot, publish_version, invalidate_user, get_user_version)는
+동기 함수이므로 async 코드에서는 offload.run_redis로 호출합니다. (이벤트 루프 블로킹 방지)
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+# (users.id, users.version) - 같은 sub의 계정이 탈퇴 후 다시 만들어져도 새 행의 id가 더 크므로 순서가 유지됨
+UserVersion = Tuple[int, int]
+
+from sqlalchemy import DateTime, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from config import settings
+from database import User
+from services import metrics
+from services.redis_client import get_redis
+
+CACHE_REQUESTS = metrics.counter("cache_requests_total", "캐시 조회 수 (cache, result: local/redis/miss)")
+
+_USER_COLUMNS = [attr.key for attr in inspect(User).column_attrs]
+_DATETIME_COLUMNS = {
+    attr.key for attr in inspect(User).column_attrs
+    if isinstance(attr.columns[0].type, DateTime)
+}
+
+_local: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_lock = threading.Lock()
+_publish_script = None
+_store_script = None
+
+# 탈퇴한 사용자의 버전 (INTEGER 최댓값) - 해당 행(users.id)으로 발급된 토큰의 클레임을 더 이상 신뢰하지 않음
+_DELETED_VERSION = 2 ** 31 - 1
+
+# 버전 키 값("id:version") 해석과 (id, version) 비교 - 형식이 다른 값(이전 형식 등)은 가장 작은 값으로 취급
+_VERSION_LUA = """
+local function parse(value)
+    if not value then return -1, -1 end
+    local uid, version = string.match(value, '^(%d+):(%d+)$')
+    if not uid then return -1, -1 end
+    return tonumber(uid), tonumber(version)
+end
+local cur_uid, cur_version = parse(redis.call('GET', KEYS[1]))
+local uid, version = tonumber(ARGV[1]), tonumber(ARGV[2])
+local newer = uid > cur_uid or (uid == cur_uid and version > cur_version)
+if newer then
+    redis.call('SET', KEYS[1], ARGV[1] .. ':' .. ARGV[2])
+end
+"""
+
+# 버전을 더 큰 값으로만 갱신 (KEYS[1]: 버전 키, ARGV: users.id, users.version)
+_PUBLISH_VERSION_SCRIPT = _VERSION_LUA + """
+return 1
+"""
+
+# 버전 반영 후 스냅샷 저장 - 스냅샷 버전이 현재 버전보다 낮으면(조회 후 다른 요청이 변경) 저장하지 않음
+# (KEYS[1]: 버전 키, KEYS[2]: 스냅샷 키, ARGV: users.id, 스냅샷 버전, 스냅샷 JSON, TTL 초)
+_STORE_SNAPSHOT_SCRIPT = _VERSION_LUA + """
+if newer or (uid == cur_uid and version == cur_version) then
+    redis.call('SET', KEYS[2], ARGV[3], 'EX', ARGV[4])
+end
+return 1
+"""
+
+
+def _redis_key(sub: str) -> str:
+    return f"auth_user:{sub}"
+
+
+def _version_key(sub: str) -> str:
+    return f"auth_user_version:{sub}"
+
+
+def _parse_version(value: Optional[str]) -> Optional[UserVersion]:
+    if value is None:
+        return None
+    uid, sep, version = value.partition(":")
+    if not sep or not uid.isdigit() or not version.isdigit():
+        return None
+    return int(uid), int(version)
+
+
+def _to_snapshot(user: User) -> Dict[str, Any]:
+    return {key: getattr(user, key) for key in _USER_COLUMNS}
+
+
+def _from_snapshot(db: Session, snapshot: Dict[str, Any]) -> User:
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return db.merge(user, load=False)
+
+
+def _store_local(sub: str, snapshot: Dict[str, Any]) -> None:
+    with _lock:
+        _local[sub] = (time.monotonic() + settings.AUTH_USER_CACHE_TTL_SECONDS, snapshot)
+        _local.move_to_end(sub)
+        while len(_local) > settings.AUTH_USER_CACHE_MAX_ENTRIES:
+            _local.popitem(last=False)
+
+
+def _get_local(sub: str) -> Optional[Dict[str, Any]]:
+    with _lock:
+        cached = _local.get(sub)
+        if not cached:
+            return None
+        expires_at, snapshot = cached
+        if expires_at < time.monotonic():
+            del _local[sub]
+            return None
+        _local.move_to_end(sub)
+        return snapshot
+
+
+def _get_redis_snapshot(sub: str) -> Optional[Dict[str, Any]]:
+    client = get_redis()
+    if not client:
+        return None
+    try:
+        version, raw = client.mget(_version_key(sub), _redis_key(sub))
+    except Exception as e:
+        logging.warning(f"사용자 캐시 조회 실패(Redis): {e}")
+        return None
+    current = _parse_version(version)
+    if raw is None or current is None:
+        return None
+    snapshot = json.loads(raw)
+    if (snapshot.get("id"), snapshot.get("version")) != current:
+        # 변경 전에 읽은 스냅샷 (무효화와 저장이 엇갈린 경우)
+        return None
+    for key in _DATETIME_COLUMNS:
+        if snapshot.get(key):
+            snapshot[key] = datetime.fromisoformat(snapshot[key])
+    return snapshot
+
+
+def get_local_snapshot(sub: str) -> Optional[Dict[str, Any]]:
+    """
+    1차(프로세스 내) 캐시 조회 (블로킹 호출 없음)
+    
+    Args:
+        sub: 토큰의 sub (소셜 user_id, 예: "kakao_12345")
+        
+    Returns:
+        dict | None: 사용자 스냅샷, 미스 시 None (이어서 get_shared_snapshot 호출)
+    """
+    snapshot = _get_local(sub)
+    if snapshot is not None:
+        CACHE_REQUESTS.inc(cache="auth_user", result="local")
+    return snapshot
+
+
+def get_shared_snapshot(sub: str) -> Optional[Dict[str, Any]]:
+    """
+    2차(Redis) 캐시 조회 - 동기 Redis 호출이므로 async 코드에서는 offload.run_redis로 호출
+    
+    Args:
+        sub: 토큰의 sub
+        
+    Returns:
+        dict | None: 사용자 스냅샷 (적중 시 1차 캐시에도 저장), 미스 시 None
+    """
+    snapshot = _get_redis_snapshot(sub)
+    if snapshot is None:
+        CACHE_REQUESTS.inc(cache="auth_user", result="miss")
+        return None
+    CACHE_REQUESTS.inc(cache="auth_user", result="redis")
+    _store_local(sub, snapshot)
+    return snapshot
+
+
+def attach_user(db: Session, snapshot: Dict[str, Any]) -> User:
+    """
+    스냅샷으로 User 객체를 만들어 세션에 연결 (DB 조회 없음)
+    
+    Args:
+        db: 요청 데이터베이스 세션
+        snapshot: get_local_snapshot/get_shared_snapshot 결과
+        
+    Returns:
+        User: 세션에 연결된 User
+    """
+    return _from_snapshot(db, snapshot)
+
+
+def get_cached_user(db: Session, sub: str) -> Optional[User]:
+    """
+    캐시된 사용자 조회 (DB 조회 없음, 동기 코드용)
+    
+    Args:
+        db: 요청 데이터베이스 세션 (반환 객체가 연결될 세션)
+        sub: 토큰의 sub (소셜 user_id, 예: "kakao_12345")
+        
+    Returns:
+        User | None: 캐시 적중 시 세션에 연결된 User, 미스 시 None
+    """
+    snapshot = get_local_snapshot(sub)
+    if snapshot is None:
+        snapshot = get_shared_snapshot(sub)
+        if snapshot is None:
+            return None
+    return _from_snapshot(db, snapshot)
+
+
+def snapshot_user(user: User) -> Dict[str, Any]:
+    """
+    User 컬럼 스냅샷 (cache_snapshot 인자, 지연 로딩이 필요 없도록 세션 안에서 호출)
+    
+    Args:
+        user: DB에서 조회된 User 객체
+        
+    Returns:
+        dict: 컬럼명 -> 값
+    """
+    return _to_snapshot(user)
+
+
+def cache_user(sub: str, user: User) -> None:
+    """
+    사용자 스냅샷 캐싱 (DB에서 조회한 직후 호출, 동기 코드용)
+    
+    Args:
+        sub: 토큰의 sub
+        user: DB에서 조회된 User 객체 (버전도 Redis에 반영)
+    """
+    cache_snapshot(sub, _to_snapshot(user))
+
+
+def cache_snapshot(sub: str, snapshot: Dict[str, Any]) -> None:
+    """
+    사용자 스냅샷 캐싱 - 동기 Redis 호출이므로 async 코드에서는 offload.run_redis로 호출
+    
+    Args:
+        sub: 토큰의 sub
+        snapshot: snapshot_user 결과
+    
+    Note:
+        - Redis 스냅샷은 스냅샷의 version이 현재 버전과 같을 때만 저장
+          (조회 후 다른 요청이 변경·무효화했다면 이전 스냅샷을 남기지 않음)
+    """
+    global _store_script
+    _store_local(sub, snapshot)
+    client = get_redis()
+    if client and snapshot.get("id") is not None and snapshot.get("version") is not None:
+        try:
+            if _store_script is None:
+                _store_script = client.register_script(_STORE_SNAPSHOT_SCRIPT)
+            _store_script(
+                keys=[_version_key(sub), _redis_key(sub)],
+                args=[
+                    int(snapshot["id"]),
+                    int(snapshot["version"]),
+                    json.dumps(snapshot, ensure_ascii=False, default=lambda v: v.isoformat()),
+                    settings.AUTH_USER_CACHE_REDIS_TTL_SECONDS,
+                ],
+            )
+        except Exception as e:
+            logging.warning(f"사용자 캐시 저장 실패(Redis): {e}")
+
+
+def bump_version(user: User) -> None:
+    """
+    사용자 버전 증가 (사용자 정보를 변경하는 트랜잭션 안에서, 커밋 전에 호출)
+    
+    Args:
+        user: 변경할 User 객체
+    
+    Note:
+        - UPDATE ... SET version = version + 1로 반영되므로 동시에 변경해도 증가분이 유실되지 않음
+        - 커밋 후 user.version은 다시 조회됨 (refresh 또는 지연 로딩)
+    """
+    user.version = User.version + 1
+
+
+def publish_version(sub: Optional[str], uid: Optional[int], version: Optional[int]) -> None:
+    """
+    DB의 사용자 버전을 Redis에 반영 (현재 값보다 클 때만 갱신)
+    
+    Args:
+        sub: 소셜 user_id (None이면 무시)
+        uid: users.id
+        version: DB에서 읽은 users.version
+    """
+    global _publish_script
+    client = get_redis()
+    if not sub or uid is None or version is None or not client:
+        return
+    try:
+        if _publish_script is None:
+            _publish_script = client.register_script(_PUBLISH_VERSION_SCRIPT)
+        _publish_script(keys=[_version_key(sub)], args=[int(uid), int(version)])
+    except Exception as e:
+        logging.warning(f"사용자 버전 갱신 실패(Redis): {e}")
+
+
+def invalidate_user(sub: Optional[str], uid: int, version: Optional[int]) -> None:
+    """
+    사용자 캐시 무효화 (사용자 정보 변경 커밋 후 호출)
+    
+    Args:
+        sub: 소셜 user_id (None이면 무시)
+        uid: users.id
+        version: 커밋된 users.version (bump_version 이후 값), 탈퇴로 행이 삭제되었으면 None
+    """
+    if not sub:
+        return
+    with _lock:
+        _local.pop(sub, None)
+    # 버전을 먼저 올려 이후 도착하는 이전 스냅샷 저장이 거절되게 한 뒤 삭제
+    publish_version(sub, uid, _DELETED_VERSION if version is None else version)
+    client = get_redis()
+    if client:
+        try:
+            client.delete(_redis_key(sub))
+        except Exception as e:
+            logging.warning(f"사용자 캐시 무효화 실패(Redis): {e}")
+
+
+def get_user_version(sub: str) -> Optional[UserVersion]:
+    """
+    사용자 버전 조회 (클레임 모드 토큰의 최신성 확인용)
+    
+    Args:
+        sub: 소셜 user_id
+        
+    Returns:
+        (users.id, users.version) | None: Redis에 반영된 현재 버전,
+        Redis가 없거나 키가 없거나(형식이 다른 값 포함) 조회에 실패하면 None
+    """
+    client = get_redis()
+    if not client:
+        return None
+    try:
+        value = client.get(_version_key(sub))
+    except Exception as e:
+        logging.warning(f"사용자 버전 조회 실패(Redis): {e}")
+        return None
+    return _parse_version(value)
@@ -1,6 +1,10 @@
 # services/user_service.py
+from sqlalchemy import func, literal_column, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from database import User
+from services import user_cache
 
 PROVIDER_ID_FIELD = {"kakao":"kakao_id","naver":"naver_id","google":"google_id"}
 
@@ -63,44 +67,59 @@ def get_or_create_minimal(db: Session, *, provider: str, provider_user_id: str,
         - created: 신규 생성 여부 (bool)
     
     Note:
-        - 1단계: provider_id로 기존 사용자 조회
-        - 2단계: 이메일로 기존 사용자 조회 후 provider_id 연결
-        - 3단계: 신규 사용자 생성 (is_onboarded=False)
-        - 기존 사용자의 user_id가 없으면 자동 설정
+        - provider_id 기준 INSERT ... ON CONFLICT DO UPDATE ... RETURNING 한 번으로 조회/생성
+          (기존 사용자의 user_id가 없으면 자동 설정, 같은 사용자의 콜백이 동시에 와도 안전)
+        - 신규 생성이 이메일 중복으로 실패하면 해당 이메일 사용자에 provider_id 연결
+          (user_id, 닉네임은 비어있을 때만 설정)
+        - 신규 사용자는 is_onboarded=False
     """
     pid_field = getattr(User, PROVIDER_ID_FIELD[provider])
     user_id = generate_user_id(provider, provider_user_id)
 
-    # 1) provider id로 조회
-    user = db.query(User).filter(pid_field == provider_user_id).first()
-    if user:
-        # 기존 사용자의 user_id가 없으면 설정
-        if not user.user_id:
-            user.user_id = user_id
-            db.commit(); db.refresh(user)
-        return user, user_id, False  # created=False
-
-    # 2) email 중복 (이메일 제공된 경우에만)
-    if email:
-        existing = db.query(User).filter(User.email == email).first()
-        if existing:
-            setattr(existing, PROVIDER_ID_FIELD[provider], provider_user_id)
-            # user_id도 설정
-            if not existing.user_id:
-                existing.user_id = user_id
-            # 닉네임이 제공되면 갱신(비어있을 때만)
-            if name and not existing.name:
-                existing.name = name
-            db.commit(); db.refresh(existing)
-            return existing, user_id, False
-
-    # 3) 새로(임시) 생성
-    user = User(
+    # 1) provider id 기준 upsert (xmax = 0 이면 새로 삽입된 행)
+    stmt = insert(User).values(
         email=email,  # None 허용
-        user_id=user_id,  # user_id 설정
+        user_id=user_id,
         name=name,  # 닉네임 저장(없으면 None)
-        **{PROVIDER_ID_FIELD[provider]: provider_user_id}, 
-        is_onboarded=False
+        is_onboarded=False,
+        **{PROVIDER_ID_FIELD[provider]: provider_user_id},
     )
-    db.add(user); db.commit(); db.refresh(user)
-    return user, user_id, True  # created=True 
\ No newline at end of file
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[pid_field],
+        set_={"user_id": func.coalesce(User.user_id, stmt.excluded.user_id)},
+    ).returning(User, literal_column("xmax = 0").label("created"))
+
+    try:
+        user, created = db.execute(stmt, execution_options={"populate_existing": True}).one()
+    except IntegrityError:
+        # 2) email 중복 - 기존 이메일 사용자에 provider id 연결
+        db.rollback()
+        if not email:
+            raise
+        link = (
+            update(User)
+            .where(User.email == email)
+            .values({
+                PROVIDER_ID_FIELD[provider]: provider_user_id,
+                "user_id": func.coalesce(User.user_id, user_id),
+                "name": func.coalesce(func.nullif(User.name, ""), name),
+                "version": User.version + 1,
+            })
+            .returning(User)
+        )
+        user = db.execute(link, execution_options={"synchronize_session": False}).scalar_one_or_none()
+        if user is None:
+            raise
+        user = _commit_returning(db, user)
+        user_cache.invalidate_user(user.user_id, user.id, user.version)
+        return user, user_id, False
+
+    # 기존 사용자의 user_id가 비어있던 경우에는 해당 user_id로 캐시된 항목이 없으므로 무효화 불필요
+    return _commit_returning(db, user), user_id, bool(created)
+
+
+def _commit_returning(db: Session, user: User) -> User:
+    """RETURNING으로 받은 값을 유지한 채 커밋 (커밋 후 refresh 조회 없음)"""
+    db.expunge(user)
+    db.commit()
+    return db.merge(user, load=False)
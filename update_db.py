@@ -1,48 +1,47 @@
 #!/usr/bin/env python3
 """
-데이터베이스 스키마 업데이트 스크립트
-Render 서버에서 실행하여 누락된 컬럼을 추가합니다.
+데이터베이스 스키마 마이그레이션 스크립트
+배포마다 한 번 실행하여 미적용 마이그레이션을 적용합니다. (services/migrations.py)
+
+사용법:
+    python update_db.py           # 미적용 마이그레이션 적용
+    python update_db.py --status  # 미적용 마이그레이션 목록만 출력
 """
 
-import os
 import sys
-from sqlalchemy import create_engine, text
-from database import Base, engine
+
+from database import engine
+from services.migrations import pending_migrations, run_migrations
+
 
 def update_database_schema():
-    """데이터베이스 스키마를 업데이트합니다."""
+    """데이터베이스 스키마를 최신 버전으로 마이그레이션합니다."""
     try:
-        print("데이터베이스 스키마 업데이트 시작...")
-        
-        # 모든 테이블 생성/업데이트
-        Base.metadata.create_all(bind=engine)
-        print("✅ Base.metadata.create_all() 완료")
-        
-        # user_id 컬럼이 없으면 추가
-        with engine.connect() as conn:
-            # users 테이블에 user_id 컬럼이 있는지 확인
-            result = conn.execute(text("""
-                SELECT column_name 
-                FROM information_schema.columns 
-                WHERE table_name = 'users' AND column_name = 'user_id'
-            """))
-            
-            if not result.fetchone():
-                print("user_id 컬럼이 없습니다. 추가 중...")
-                conn.execute(text("""
-                    ALTER TABLE users 
-                    ADD COLUMN user_id VARCHAR(100) UNIQUE
-                """))
-                conn.commit()
-                print("✅ user_id 컬럼 추가 완료")
-            else:
-                print("✅ user_id 컬럼이 이미 존재합니다")
-        
-        print("🎉 데이터베이스 스키마 업데이트 완료!")
-        
+        print("데이터베이스 마이그레이션 시작...")
+        applied = run_migrations(engine)
+        for migration in applied:
+            print(f"✅ {migration.version:04d} {migration.description}")
+        if not applied:
+            print("✅ 적용할 마이그레이션이 없습니다")
+        print("🎉 데이터베이스 마이그레이션 완료!")
+
     except Exception as e:
         print(f"❌ 에러 발생: {e}")
         sys.exit(1)
 
+
+def print_status():
+    """미적용 마이그레이션 목록을 출력합니다."""
+    pending = pending_migrations(engine)
+    if not pending:
+        print("✅ 스키마가 최신 상태입니다")
+        return
+    for migration in pending:
+        print(f"대기 중: {migration.version:04d} {migration.description}")
+
+
 if __name__ == "__main__":
-    update_database_schema()
+    if "--status" in sys.argv[1:]:
+        print_status()
+    else:
+        update_database_schema()